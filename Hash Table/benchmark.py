@@ -0,0 +1,285 @@
+""" 
+Benchmarks of LinearProbeTable.
+
+- Compares the original table-size bound universal hash against the cached full hash backends.
+- Compares the deletion strategies under a delete-heavy workload.
+- Compares max load factors, and a bulk load with and without reserve.
+- Compares the open addressing engines and separate chaining, including their probe length statistics.
+- Compares the memory per entry and iteration speed of the table layouts.
+- Compares integer ID keys against the same IDs stringified.
+- Compares the worst case insert latency of blocking and incremental resizing.
+- Compares cold starts: reinserting every key, loading a snapshot, and memory-mapping it for a few lookups.
+- Compares the throughput of a sharded table against one globally locked table across thread counts.
+- Run from this directory: python benchmark.py
+"""
+
+import os
+import tempfile
+import threading
+import time
+import timeit
+import tracemalloc
+from fixed_size_array import FixedSizeArray
+from hash import LinearProbeTable, HashFunction, DeletionStrategy, ResizeStrategy
+from open_addressing import RobinHoodTable, QuadraticProbeTable, DoubleHashTable
+from separate_chaining import SeparateChainingTable
+from compact_table import CompactProbeTable
+from sharded import ShardedHashTable
+
+N = 20000
+REPEAT = 3
+
+
+def table_bound_universal_hash(key: str, table_size: int) -> int:
+    """ The original universal hash, recomputed per table size (cannot be cached). """
+    value = 0
+    a = 31415
+    for char in key:
+        value = (ord(char) + a * value) % table_size
+        a = a * LinearProbeTable.DEFAULT_HASH_BASE % (table_size - 1)
+    return value
+
+
+def best_of(statement) -> float:
+    return min(timeit.repeat(statement, number=1, repeat=REPEAT))
+
+
+def bench_hash_functions(keys: list[str]) -> None:
+    print(f"Hashing {N} keys")
+    table_size = LinearProbeTable.PRIMES[-1]
+    elapsed = best_of(lambda: [table_bound_universal_hash(key, table_size) for key in keys])
+    print(f"  {'table bound universal':<24}{elapsed * 1000:10.2f} ms")
+    for hash_function in HashFunction:
+        table = LinearProbeTable(hash_function=hash_function)
+        elapsed = best_of(lambda: [table.hash_key(key) for key in keys])
+        print(f"  {hash_function.name.lower():<24}{elapsed * 1000:10.2f} ms")
+
+
+def bench_table(keys: list[str]) -> None:
+    print(f"Inserting then looking up {N} keys (includes every resize)")
+    for hash_function in HashFunction:
+        def insert() -> LinearProbeTable:
+            table = LinearProbeTable(hash_function=hash_function)
+            for i, key in enumerate(keys):
+                table[key] = i
+            return table
+
+        table = insert()
+        insert_time = best_of(insert)
+        lookup_time = best_of(lambda: [table[key] for key in keys])
+        print(f"  {hash_function.name.lower():<24}insert {insert_time * 1000:10.2f} ms   lookup {lookup_time * 1000:10.2f} ms")
+
+
+def bench_deletion(keys: list[str]) -> None:
+    print(f"Churn: deleting and reinserting {N} keys in a table holding {N} keys")
+    for deletion_strategy in DeletionStrategy:
+        table = LinearProbeTable(hash_function=HashFunction.BUILTIN, deletion_strategy=deletion_strategy)
+        for i, key in enumerate(keys):
+            table[key] = i
+
+        def churn() -> None:
+            for i, key in enumerate(keys):
+                del table[key]
+                table[key] = i
+
+        elapsed = best_of(churn)
+        print(f"  {deletion_strategy.name.lower():<24}{elapsed * 1000:10.2f} ms")
+
+
+def bench_load_factor(keys: list[str]) -> None:
+    print(f"Bulk loading {N} keys")
+    for max_load_factor in (0.5, 2 / 3, 0.9, 1):
+        for reserve in (False, True):
+            def load() -> LinearProbeTable:
+                table = LinearProbeTable(hash_function=HashFunction.BUILTIN, max_load_factor=max_load_factor)
+                if reserve:
+                    table.reserve(len(keys))
+                for i, key in enumerate(keys):
+                    table[key] = i
+                return table
+
+            table = load()
+            load_time = best_of(load)
+            lookup_time = best_of(lambda: [table[key] for key in keys])
+            label = f"max load {max_load_factor:.2f}" + (" reserved" if reserve else "")
+            print(f"  {label:<24}insert {load_time * 1000:10.2f} ms   lookup {lookup_time * 1000:10.2f} ms")
+
+
+def bench_engines(keys: list[str]) -> None:
+    print(f"Engines holding {N} keys")
+    for table_type in (LinearProbeTable, RobinHoodTable, QuadraticProbeTable, DoubleHashTable, SeparateChainingTable):
+        table = table_type(hash_function=HashFunction.BUILTIN)
+        table.reserve(len(keys))
+        for i, key in enumerate(keys):
+            table[key] = i
+
+        lookup_time = best_of(lambda: [table[key] for key in keys])
+        statistics = table.probe_statistics()
+        print(f"  {table_type.__name__:<24}load {table.load_factor():.2f}   lookup {lookup_time * 1000:8.2f} ms   "
+              f"probes mean {statistics.mean:.2f} max {statistics.maximum} variance {statistics.variance:.2f}")
+
+
+def tuple_layout(table: LinearProbeTable) -> tuple[FixedSizeArray, FixedSizeArray]:
+    """ The previous layout of LinearProbeTable: one (key, data) tuple per slot, plus the cached hashes. """
+    pairs = FixedSizeArray(len(table.slot_keys))
+    hashes = FixedSizeArray(len(table.slot_keys))
+    for i in range(len(table.slot_keys)):
+        if table.slot_keys[i] is not None:
+            pairs[i] = (table.slot_keys[i], table.slot_values[i])
+            hashes[i] = table.slot_keys[i].__hash__()  # a fresh int, as the hash backend would return
+    return (pairs, hashes)
+
+
+def allocated_bytes(build) -> int:
+    """ Returns the bytes still allocated by whatever build returns. """
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def fill(table_type, keys: list[str], values: list[int]):
+    table = table_type(hash_function=HashFunction.BUILTIN)
+    for key, value in zip(keys, values):
+        table[key] = value
+    return table
+
+
+def bench_layout(keys: list[str]) -> None:
+    print(f"Memory per entry holding {N} keys (keys and values themselves excluded)")
+    values = list(range(1000, 1000 + len(keys)))  # allocated up front, so only the table is measured
+    table = fill(LinearProbeTable, keys, values)
+    layouts = [
+        ("tuple layout", lambda: tuple_layout(table)),
+        ("split LinearProbeTable", lambda: fill(LinearProbeTable, keys, values)),
+        ("CompactProbeTable", lambda: fill(CompactProbeTable, keys, values)),
+        ("dict", lambda: dict(zip(keys, values))),
+    ]
+    for label, build in layouts:
+        print(f"  {label:<24}{allocated_bytes(build) / len(keys):8.1f} bytes")
+
+    print(f"Iterating over {N} keys")
+    compact = fill(CompactProbeTable, keys, values)
+    scan_time = best_of(lambda: [table.slot_keys[i] for i in range(len(table.slot_keys)) if table.slot_keys[i] is not None])
+    compact_time = best_of(lambda: list(compact))
+    print(f"  {'slot scan (split)':<24}{scan_time * 1000:10.2f} ms")
+    print(f"  {'dense entries (compact)':<24}{compact_time * 1000:10.2f} ms")
+
+
+def bench_integer_keys() -> None:
+    print(f"Inserting then looking up {N} integer IDs")
+    ids = list(range(10 ** 9, 10 ** 9 + 7 * N, 7))
+    for hash_function in HashFunction:
+        for label, convert in [("int", lambda key: key), ("str(int)", str)]:
+            def insert() -> LinearProbeTable:
+                table = LinearProbeTable(hash_function=hash_function)
+                for key in ids:
+                    table[convert(key)] = key
+                return table
+
+            table = insert()
+            insert_time = best_of(insert)
+            lookup_time = best_of(lambda: [table[convert(key)] for key in ids])
+            print(f"  {hash_function.name.lower() + ' ' + label:<24}{insert_time * 1000:10.2f} ms insert"
+                  f"{lookup_time * 1000:10.2f} ms lookup  max probe {table.probe_statistics().maximum}")
+
+
+def bench_resize_latency(count: int) -> None:
+    print(f"Latency of each of {count} inserts (includes every resize)")
+    keys = list(range(count))
+    for resize_strategy in ResizeStrategy:
+        table = LinearProbeTable(resize_strategy=resize_strategy)
+        latencies = []
+        start = time.perf_counter()
+        for key in keys:
+            before = time.perf_counter_ns()
+            table[key] = key
+            latencies.append(time.perf_counter_ns() - before)
+        total = time.perf_counter() - start
+        latencies.sort()
+        print(f"  {resize_strategy.name.lower():<24}{total * 1000:10.2f} ms total"
+              f"{latencies[int(0.999 * len(latencies))] / 1000:10.1f} us p99.9{latencies[-1] / 1000:12.1f} us max")
+
+
+def bench_snapshot(count: int) -> None:
+    print(f"Cold start of a table of {count} keys, then 100 lookups")
+    keys = ["key-" + str(i) for i in range(count)]
+    table = LinearProbeTable()
+    for i, key in enumerate(keys):
+        table[key] = i
+    touched = keys[::count // 100]
+
+    def rebuild() -> None:
+        rebuilt = LinearProbeTable()
+        for i, key in enumerate(keys):
+            rebuilt[key] = i
+        [rebuilt[key] for key in touched]
+
+    def load(mmap: bool) -> None:
+        loaded = LinearProbeTable.load(path, mmap)
+        [loaded[key] for key in touched]
+        if mmap:
+            loaded.close()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "table.snapshot")
+        table.save(path)
+        for label, start in [("reinsert", rebuild), ("load", lambda: load(False)), ("load mmap", lambda: load(True))]:
+            print(f"  {label:<24}{best_of(start) * 1000:10.2f} ms")
+
+
+class GloballyLockedTable:
+    """ LinearProbeTable behind a single lock, the baseline for the sharded table. """
+
+    def __init__(self) -> None:
+        self.table = LinearProbeTable()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            return self.table.get(key)
+
+    def __setitem__(self, key, data) -> None:
+        with self.lock:
+            self.table[key] = data
+
+
+def threaded_throughput(table, keys: list[str], thread_count: int) -> float:
+    """ Operations per second of thread_count threads each doing 9 lookups per write over their share of the keys. """
+    def work(thread: int) -> None:
+        for i in range(thread, len(keys), thread_count):
+            table[keys[i]] = i
+            for j in range(i - 8, i + 1):
+                table.get(keys[j])
+
+    threads = [threading.Thread(target=work, args=(thread,)) for thread in range(thread_count)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return 10 * len(keys) / (time.perf_counter() - start)
+
+
+def bench_sharded(keys: list[str]) -> None:
+    print(f"Throughput of 90% lookups and 10% inserts over {N} keys")
+    for thread_count in [1, 2, 4, 8]:
+        for label, table_type in [("global lock", GloballyLockedTable), ("sharded", ShardedHashTable)]:
+            throughput = max(threaded_throughput(table_type(), keys, thread_count) for _ in range(REPEAT))
+            print(f"  {label + ' x' + str(thread_count):<24}{throughput / 1000:10.1f} k ops/s")
+
+
+if __name__ == '__main__':
+    keys = ["key-" + str(i) for i in range(N)]
+    bench_hash_functions(keys)
+    bench_table(keys)
+    bench_deletion(keys)
+    bench_load_factor(keys)
+    bench_engines(keys)
+    bench_layout(keys)
+    bench_integer_keys()
+    bench_resize_latency(10 * N)
+    bench_snapshot(10 * N)
+    bench_sharded(keys)
@@ -0,0 +1,228 @@
+"""
+Compact Hash Table Implementation.
+
+- Defines a Hash Table laid out like CPython's dict: a dense, insertion ordered array of entries and a sparse index probed linearly.
+- The sparse index only holds entry numbers in a typed array, so an empty slot costs 1 to 8 bytes instead of three references.
+- Iterating only scans the dense entries, in insertion order.
+"""
+
+from array import array
+from fixed_size_array import FixedSizeArray
+from hash import LinearProbeTable, HashFunction, HASH_FUNCTIONS, ProbeStatistics, TOMBSTONE
+
+
+EMPTY = -1  # index slot that was never used
+DUMMY = -2  # index slot of a deleted entry, lookups probe past it
+
+
+def index_typecode(table_size: int) -> str:
+    """ Smallest signed array typecode that can hold the entry numbers of a table of the given size. """
+    for typecode in ('b', 'h', 'i'):
+        if table_size < 1 << (8 * array(typecode).itemsize - 1):
+            return typecode
+    return 'q'
+
+
+class CompactProbeTable[K, T]:
+    """
+    Compact Linear Probe Hash Table
+
+    Constants:
+        - MIN_CAPACITY: smallest valid table size
+        - DEFAULT_TABLE_SIZE: default table size used in the __init__
+        - DEFAULT_MAX_LOAD_FACTOR: fraction of the index that may be used by entries before the table grows
+        - DEFAULT_MIN_LOAD_FACTOR: load factor below which the table shrinks (0 never shrinks)
+        - PRIMES: list of prime numbers to use for resizing (shared with LinearProbeTable)
+
+    Attributes:
+        - count: number of elements in the hash table
+        - used: number of entries appended since the last resize (including deleted ones)
+        - index: sparse array of entry numbers, EMPTY or DUMMY
+        - entry_keys: dense array of keys in insertion order (TOMBSTONE for a deleted entry)
+        - entry_values: dense array of the data of the key at the same position in entry_keys
+        - entry_hashes: dense array of the full hash of the key at the same position in entry_keys
+        - hash_function: hash backend used to compute the full hash of a key
+        - max_load_factor: entries the table holds before growing, as a fraction of the index size
+        - min_load_factor: table shrinks along PRIMES once count / index size falls below it
+        - min_table_size: the table never shrinks below the size it was created with
+    """
+    MIN_CAPACITY = 1
+
+    DEFAULT_TABLE_SIZE = 17
+    DEFAULT_MAX_LOAD_FACTOR = 2 / 3
+    DEFAULT_MIN_LOAD_FACTOR = 1 / 8
+    PRIMES = LinearProbeTable.PRIMES
+
+    def __init__(self, table_size: int = DEFAULT_TABLE_SIZE, hash_function: HashFunction = HashFunction.UNIVERSAL,
+                 max_load_factor: float = DEFAULT_MAX_LOAD_FACTOR,
+                 min_load_factor: float = DEFAULT_MIN_LOAD_FACTOR) -> None:
+        if not 0 <= min_load_factor < max_load_factor <= 1:
+            raise ValueError("Load factors should satisfy 0 <= min_load_factor < max_load_factor <= 1.")
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.min_table_size = max(self.MIN_CAPACITY, table_size)
+        self.hash_function = hash_function
+        self.__hash_key = HASH_FUNCTIONS[hash_function]
+        self.__allocate(self.min_table_size)
+
+    def __allocate(self, table_size: int) -> None:
+        """ Creates an empty index of the given size, with room for as many entries as the max load factor allows. """
+        entries = max(1, int(self.max_load_factor * table_size))
+        self.count = 0
+        self.used = 0
+        self.index = array(index_typecode(table_size), [EMPTY]) * table_size
+        self.entry_keys = FixedSizeArray(entries)
+        self.entry_values = FixedSizeArray(entries)
+        self.entry_hashes = array('q', [0]) * entries
+
+    def __len__(self) -> int:
+        """ Returns number of elements in the hash table. """
+        return self.count
+
+    def __iter__(self):
+        """ Yields the keys in insertion order, raising RuntimeError if the table changes size during the iteration. """
+        entry_keys = self.entry_keys
+        count = self.count
+        for i in range(self.used):
+            if self.entry_keys is not entry_keys or self.count != count:
+                raise RuntimeError("CompactProbeTable changed size during iteration")
+            key = entry_keys[i]
+            if key is not TOMBSTONE:
+                yield key
+
+    def __find_slot(self, key: K, key_hash: int) -> int:
+        """
+        Find the index slot pointing at this key using linear probing.
+
+        Complexity (Best): O(1) first slot is empty
+        Complexity (Worst): O(N) when we've searched the entire index where N is the table_size
+        """
+        size = len(self.index)
+        slot = key_hash % size
+        for _ in range(size):
+            entry = self.index[slot]
+            if entry == EMPTY:
+                break
+            elif entry >= 0 and self.entry_hashes[entry] == key_hash and self.entry_keys[entry] == key:
+                return slot
+            slot = (slot + 1) % size
+        raise KeyError(key)
+
+    def __getitem__(self, key: K) -> T:
+        """ Get the item at a certain key. """
+        return self.entry_values[self.index[self.__find_slot(key, self.hash_key(key))]]
+
+    def __setitem__(self, key: K, data: T) -> None:
+        """
+        Set an (key, data) pair in our hash table. A new key is appended to the dense entries.
+        :see: #self.__append(key: K, data: T, key_hash: int)
+        """
+        key_hash = self.hash_key(key)
+        try:
+            slot = self.__find_slot(key, key_hash)
+        except KeyError:
+            if self.used == len(self.entry_keys):  # no room left for another entry
+                if self.count < len(self.entry_keys):
+                    self.__resize(len(self.index))  # compacting the deleted entries away is enough
+                else:
+                    self.__resize(self.__table_size_for(self.count + 1, len(self.index)))
+            self.__append(key, data, key_hash)
+        else:
+            self.entry_values[self.index[slot]] = data
+
+    def __append(self, key: K, data: T, key_hash: int) -> None:
+        """ Append a key known not to be in the table to the entries, pointing the first free index slot at it. """
+        size = len(self.index)
+        slot = key_hash % size
+        while self.index[slot] >= 0:
+            slot = (slot + 1) % size
+        self.index[slot] = self.used
+        self.entry_keys[self.used] = key
+        self.entry_values[self.used] = data
+        self.entry_hashes[self.used] = key_hash
+        self.used += 1
+        self.count += 1
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes an item by leaving a DUMMY in its index slot and a hole in the entries. Both are dropped on the next resize.
+
+        Complexity (Best): O(K) finds the position straight away where K is the size of the key
+        Complexity (Worst): O(K + N) where N is the table size
+        """
+        slot = self.__find_slot(key, self.hash_key(key))
+        entry = self.index[slot]
+        self.index[slot] = DUMMY
+        self.entry_keys[entry] = TOMBSTONE
+        self.entry_values[entry] = None
+        self.count -= 1
+
+        if self.count < self.min_load_factor * len(self.index) and len(self.index) > self.min_table_size:
+            # Shrink to about half the max load factor, so a few inserts do not grow it straight back
+            self.__resize(max(self.__table_size_for(2 * self.count), self.min_table_size))
+
+    def __table_size_for(self, n: int, larger_than: int = 0) -> int:
+        """ Smallest size along PRIMES (above larger_than) that holds n items within the max load factor. """
+        for prime in self.PRIMES:
+            if prime > larger_than and n <= int(self.max_load_factor * prime):
+                return prime
+        return max(int(n / self.max_load_factor), larger_than) + 1  # ran out of primes
+
+    def __resize(self, table_size: int) -> None:
+        """ Rebuild the index at the given size and compact the entries, keeping insertion order. The cached hashes are reused. """
+        old_keys = self.entry_keys
+        old_values = self.entry_values
+        old_hashes = self.entry_hashes
+        old_used = self.used
+        self.__allocate(table_size)
+
+        for i in range(old_used):
+            if old_keys[i] is not TOMBSTONE:
+                self.__append(old_keys[i], old_values[i], old_hashes[i])
+
+    def reserve(self, n: int) -> None:
+        """ Resize the table once so that it holds n items without growing again. """
+        table_size = self.__table_size_for(n)
+        if table_size > len(self.index):
+            self.__resize(table_size)
+
+    def load_factor(self) -> float:
+        """ Returns the fraction of the index that points at an item. """
+        return self.count / len(self.index)
+
+    def probe_statistics(self) -> ProbeStatistics:
+        """ Returns statistics on how many probes a lookup of each stored key takes. """
+        lengths = []
+        for slot in range(len(self.index)):
+            entry = self.index[slot]
+            if entry >= 0:
+                lengths.append((slot - self.entry_hashes[entry]) % len(self.index) + 1)
+        return ProbeStatistics.from_lengths(lengths)
+
+    def is_empty(self) -> bool:
+        """ Returns whether the hash table is empty. """
+        return self.count == 0
+
+    def is_full(self) -> bool:
+        """ Returns whether the hash table is full. """
+        return self.count == len(self.index)
+
+    def hash_key(self, key: K) -> int:
+        """ Full hash of the key using the table's hash backend. It does not depend on the table size. """
+        return self.__hash_key(key)
+
+    def hash(self, key: K) -> int:
+        """ Position of the key in the current index. """
+        return self.hash_key(key) % len(self.index)
+
+    def insert(self, key: K, data: T) -> None:
+        """ Utility method to call our setitem method. """
+        self[key] = data
+
+    def __str__(self) -> str:
+        """ Returns all they key/value pairs in our hash table (in insertion order). """
+        result = ""
+        for i in range(self.used):
+            if self.entry_keys[i] is not TOMBSTONE:
+                result += "(" + str(self.entry_keys[i]) + "," + str(self.entry_values[i]) + ")\n"
+        return result
@@ -2,14 +2,233 @@
 Hash Table Implementation. 
 
 - Defines a Hash Table using Linear Probing for conflict resolution.
-- It currently rehashes the primary cluster to handle deletion.
+- It rehashes the primary cluster to handle deletion, or marks deleted slots with lazy tombstones.
+- The full hash of every key is cached next to its entry, so resizing never recomputes it.
+- Keys, values and hashes are kept in separate parallel arrays, so no (key, data) tuple is allocated per entry.
+  The hashes are plain 64-bit integers in a typed array, so caching them allocates no objects either.
+- Implements the full MutableMapping protocol, iterating by scanning the slots.
+- Grows in one blocking resize, or incrementally: the old and new arrays coexist and every insert or delete migrates
+  a bounded number of old slots, so no single write pays for moving the whole table.
+- Keys may be any hashable object except None. Strings and bytes are hashed by their contents, integers and other keys
+  by mixing Python's hash, so integer IDs never need to be stringified.
+- Saves to a fixed binary snapshot (slot hashes, record offsets and a heap of pickled records), which can be memory-mapped
+  and answer lookups straight from the file, deserialising only the records it touches.
 """
 
+import pickle
+import struct
+import zlib
+from array import array
+from collections.abc import Callable, Hashable, MutableMapping, Mapping, KeysView, ValuesView, ItemsView
+from enum import Enum
+from numbers import Number
+from mmap import mmap as MemoryMap, ACCESS_READ
+from typing import NamedTuple
 from fixed_size_array import FixedSizeArray
 import unittest
 
 
-class LinearProbeTable[T]:
+UNIVERSAL_HASH_MODULUS = (1 << 61) - 1  # Mersenne prime, keeps the hash independent of the table size
+UNIVERSAL_HASH_BASE = 31
+MASK64 = (1 << 64) - 1
+TUPLE_HASH_MULTIPLIER = 1000003
+
+# Snapshot layout (native byte order, every section 8-byte aligned):
+#   header, hashes (table_size int64), record offsets (table_size + 1 int64), heap of pickled (key, data) records.
+# Slot i holds the record heap[offsets[i]:offsets[i + 1]], an empty slot has an empty record.
+SNAPSHOT_MAGIC = b"LPTSNAP1"
+SNAPSHOT_HEADER = struct.Struct("=8sqqqqqqqddd")
+
+
+def integer_hash(key: Hashable) -> int:
+    """
+    Mixes Python's hash of the key with the splitmix64 finaliser, so consecutive integer IDs spread over the whole table.
+    Equal numbers (1, 1.0, True) share Python's hash, so they still hash alike. The result fits in a signed 64-bit integer.
+    """
+    z = (hash(key) + 0x9E3779B97F4A7C15) & MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return (z ^ (z >> 31)) >> 1
+
+
+def tuple_hash(key: tuple, item_hash: Callable[[Hashable], int]) -> int:
+    """ Combines the hashes of the items of a tuple (in order) into one non negative 63-bit hash. """
+    value = 0x345678
+    for item in key:
+        value = ((value ^ item_hash(item)) * TUPLE_HASH_MULTIPLIER) & MASK64
+    return (value ^ len(key)) >> 1
+
+
+def universal_hash(key: Hashable) -> int:
+    """ Universal Hash function over a fixed prime modulus for strings and bytes, integer mixing for any other key. """
+    if isinstance(key, str):
+        value = 0
+        a = 31415
+        for char in key:
+            value = (ord(char) + a * value) % UNIVERSAL_HASH_MODULUS
+            a = a * UNIVERSAL_HASH_BASE % (UNIVERSAL_HASH_MODULUS - 1)
+        return value
+    elif isinstance(key, bytes):
+        value = 0
+        a = 31415
+        for byte in key:
+            value = (byte + a * value) % UNIVERSAL_HASH_MODULUS
+            a = a * UNIVERSAL_HASH_BASE % (UNIVERSAL_HASH_MODULUS - 1)
+        return value
+    elif isinstance(key, tuple):
+        return tuple_hash(key, universal_hash)
+    return integer_hash(key)
+
+
+def builtin_hash(key: Hashable) -> int:
+    """ Python's own (C implemented, per-process salted) hash. """
+    return hash(key)
+
+
+def bytes_hash(key: Hashable) -> int:
+    """ CRC32 over the UTF-8 bytes of a string or over raw bytes, computed in C but stable across processes. """
+    if isinstance(key, str):
+        return zlib.crc32(key.encode('utf-8', 'surrogatepass'))
+    elif isinstance(key, bytes):
+        return zlib.crc32(key)
+    elif isinstance(key, tuple):
+        return tuple_hash(key, bytes_hash)
+    return integer_hash(key)
+
+
+def has_stable_hash(key: Hashable) -> bool:
+    """
+    Returns whether the universal and bytes hashes of the key are the same in every process.
+    Strings, bytes, numbers and None are, tuples are when all their items are. Any other key (a frozenset of strings
+    for example) falls back to Python's hash, which may be salted per process.
+    """
+    if key is None or isinstance(key, (str, bytes, Number)):
+        return True
+    elif isinstance(key, tuple):
+        return all(has_stable_hash(item) for item in key)
+    return False
+
+
+class HashFunction(Enum):
+    """ Hash backends a table can be created with. """
+    UNIVERSAL = 0
+    BUILTIN = 1
+    BYTES = 2
+
+
+class DeletionStrategy(Enum):
+    """ How a table empties the slot of a deleted key. """
+    REHASH_CLUSTER = 0
+    TOMBSTONE = 1
+
+
+class ResizeStrategy(Enum):
+    """ How a table moves its items into a larger table. """
+    BLOCKING = 0
+    INCREMENTAL = 1
+
+
+class ProbeStatistics(NamedTuple):
+    """ Summary of the number of probes needed to find each stored key. """
+    count: int
+    mean: float
+    maximum: int
+    variance: float
+
+    @classmethod
+    def from_lengths(cls, lengths: list[int]) -> 'ProbeStatistics':
+        """ Summarises a list of probe lengths. """
+        if len(lengths) == 0:
+            return cls(0, 0.0, 0, 0.0)
+        mean = sum(lengths) / len(lengths)
+        variance = sum((length - mean) ** 2 for length in lengths) / len(lengths)
+        return cls(len(lengths), mean, max(lengths), variance)
+
+
+# Marks a deleted slot (in place of its key): lookups probe past it and inserts may reuse it
+TOMBSTONE = object()
+
+
+HASH_FUNCTIONS = {
+    HashFunction.UNIVERSAL: universal_hash,
+    HashFunction.BUILTIN: builtin_hash,
+    HashFunction.BYTES: bytes_hash,
+}
+
+
+class LinearProbeTableIterator[K, T]:
+    """
+    Iterator scanning the slots of a LinearProbeTable in place, then the slots still to be migrated while it resizes incrementally.
+
+    Attributes:
+        - table: the table being iterated
+        - slot_keys: key array of the table when the iterator was created
+        - segments: (keys, values) arrays to scan in turn
+        - return_keys: whether the key of each item is returned
+        - return_values: whether the data of each item is returned, as a (key, data) pair if return_keys is set too
+        - segment: segment being scanned
+        - position: next slot to scan in that segment
+        - count: number of elements of the table when the iterator was created
+    """
+
+    def __init__(self, table: 'LinearProbeTable[K, T]', return_keys: bool = True, return_values: bool = False) -> None:
+        self.table = table
+        self.slot_keys = table.slot_keys
+        self.segments = [(table.slot_keys, table.slot_values)]
+        if table.rehash_keys is not None:
+            self.segments.append((table.rehash_keys, table.rehash_values))
+        self.return_keys = return_keys
+        self.return_values = return_values
+        self.segment = 0
+        self.position = 0
+        self.count = len(table)
+
+    def __iter__(self) -> 'LinearProbeTableIterator':
+        """ Returns itself, as required to be iterable. """
+        return self
+
+    def __next__(self):
+        """ Returns the key, data or (key, data) pair of the next occupied slot. """
+        if self.table.slot_keys is not self.slot_keys or len(self.table) != self.count:
+            raise RuntimeError("LinearProbeTable changed size during iteration")
+        while self.segment < len(self.segments):
+            (slot_keys, slot_values) = self.segments[self.segment]
+            while self.position < len(slot_keys):
+                key = slot_keys[self.position]
+                self.position += 1
+                if key is not None and key is not TOMBSTONE:
+                    if not self.return_values:
+                        return key
+                    elif not self.return_keys:
+                        return slot_values[self.position - 1]
+                    return (key, slot_values[self.position - 1])
+            self.segment += 1
+            self.position = 0
+        raise StopIteration
+
+
+class LinearProbeKeysView(KeysView):
+    """ Keys of a LinearProbeTable, iterated by scanning its slots. """
+
+    def __iter__(self) -> LinearProbeTableIterator:
+        return LinearProbeTableIterator(self._mapping)
+
+
+class LinearProbeValuesView(ValuesView):
+    """ Values of a LinearProbeTable, iterated by scanning its slots instead of looking up every key. """
+
+    def __iter__(self) -> LinearProbeTableIterator:
+        return LinearProbeTableIterator(self._mapping, return_keys=False, return_values=True)
+
+
+class LinearProbeItemsView(ItemsView):
+    """ (key, data) pairs of a LinearProbeTable, iterated by scanning its slots instead of looking up every key. """
+
+    def __iter__(self) -> LinearProbeTableIterator:
+        return LinearProbeTableIterator(self._mapping, return_values=True)
+
+
+class LinearProbeTable[K, T](MutableMapping):
     """
     Linear Probe Hash Table
 
@@ -18,134 +237,655 @@ class LinearProbeTable[T]:
         - DEFAULT_TABLE_SIZE: default table size used in the __init__
         - DEFAULT_HASH_TABLE: default hash base used for the hash function
         - PRIMES: list of prime numbers to use for resizing
+        - DEFAULT_TOMBSTONE_FRACTION: fraction of the table that may hold tombstones before it is compacted
+        - DEFAULT_MAX_LOAD_FACTOR: load factor above which the table grows
+        - DEFAULT_MIN_LOAD_FACTOR: load factor below which the table shrinks (0 never shrinks)
+        - DEFAULT_REHASH_STEP: number of old slots each insert or delete migrates while resizing incrementally
 
     Attributes:
-        - count: number of elements in the hash table
-        - array: used to represent our internal array
-        - table_size: current size of the hash table
+        - count: number of elements in slot_keys
+        - slot_keys: internal array of keys (None for an empty slot, TOMBSTONE for a deleted slot)
+        - slot_values: internal array of the data of the key at the same position in slot_keys
+        - hashes: typed array of the full hash of the key at the same position in slot_keys
+        - hash_function: hash backend used to compute the full hash of a key
+        - deletion_strategy: whether a delete rehashes its cluster or leaves a tombstone
+        - tombstones: number of tombstones in slot_keys
+        - tombstone_fraction: table is compacted once tombstones exceed this fraction of it
+        - max_load_factor: table grows along PRIMES once (count + tombstones) / table size exceeds it
+        - min_load_factor: table shrinks along PRIMES once count / table size falls below it
+        - min_table_size: the table never shrinks below the size it was created with
+        - resize_strategy: whether the table grows in one go or migrates its items a few slots per write
+        - rehash_step: number of old slots each insert or delete migrates while resizing incrementally
+        - rehash_keys, rehash_values, rehash_hashes: arrays of the table being migrated, None when not resizing
+        - rehash_position: next slot of rehash_keys to migrate (every slot before it is a TOMBSTONE)
+        - rehash_count: number of elements still in rehash_keys
     """
     MIN_CAPACITY = 1
 
     DEFAULT_TABLE_SIZE = 17
-    DEFAULT_HASH_BASE = 31
+    DEFAULT_HASH_BASE = UNIVERSAL_HASH_BASE
+    DEFAULT_TOMBSTONE_FRACTION = 0.25
+    DEFAULT_MAX_LOAD_FACTOR = 2 / 3
+    DEFAULT_MIN_LOAD_FACTOR = 1 / 8
+    DEFAULT_REHASH_STEP = 64
     PRIMES = [3, 7, 11, 17, 23, 29, 37, 47, 59, 71, 89, 107, 131, 163, 197, 239, 293, 353, 431, 521, 631, 761, 919,
               1103, 1327, 1597, 1931, 2333, 2801, 3371, 4049, 4861, 5839, 7013, 8419, 10103, 12143, 14591, 17519, 21023,
               25229, 30313, 36353, 43627, 52361, 62851, 75521, 90523, 108631, 130363, 156437, 187751, 225307, 270371,
               324449, 389357, 467237, 560689, 672827, 807403, 968897, 1162687, 1395263, 1674319, 2009191, 2411033,
               2893249, 3471899, 4166287, 4999559, 5999471, 7199369]
 
-    def __init__(self, table_size: int = DEFAULT_TABLE_SIZE) -> None:
+    def __init__(self, table_size: int = DEFAULT_TABLE_SIZE, hash_function: HashFunction = HashFunction.UNIVERSAL,
+                 deletion_strategy: DeletionStrategy = DeletionStrategy.REHASH_CLUSTER,
+                 tombstone_fraction: float = DEFAULT_TOMBSTONE_FRACTION,
+                 max_load_factor: float = DEFAULT_MAX_LOAD_FACTOR,
+                 min_load_factor: float = DEFAULT_MIN_LOAD_FACTOR,
+                 resize_strategy: ResizeStrategy = ResizeStrategy.BLOCKING,
+                 rehash_step: int = DEFAULT_REHASH_STEP) -> None:
+        if not 0 <= min_load_factor < max_load_factor <= 1:
+            raise ValueError("Load factors should satisfy 0 <= min_load_factor < max_load_factor <= 1.")
+        if rehash_step < 1:
+            raise ValueError("The rehash step should migrate at least one slot.")
         self.count = 0
-        self.table = FixedSizeArray(max(self.MIN_CAPACITY, table_size))
-        self.next_prime = 0
-
-        while LinearProbeTable.PRIMES[self.next_prime] <= table_size:
-            self.next_prime += 1
+        self.tombstones = 0
+        self.deletion_strategy = deletion_strategy
+        self.tombstone_fraction = tombstone_fraction
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.min_table_size = max(self.MIN_CAPACITY, table_size)
+        self.slot_keys = FixedSizeArray(self.min_table_size)
+        self.slot_values = FixedSizeArray(self.min_table_size)
+        self.hashes = array('q', [0]) * self.min_table_size
+        self.hash_function = hash_function
+        self.__hash_key = HASH_FUNCTIONS[hash_function]
+        self.resize_strategy = resize_strategy
+        self.rehash_step = rehash_step
+        self.rehash_keys = None
+        self.rehash_values = None
+        self.rehash_hashes = None
+        self.rehash_position = 0
+        self.rehash_count = 0
 
     def __len__(self) -> int:
-        """ Returns number of elements in the hash table. """
-        return self.count
+        """ Returns number of elements in the hash table, including those still to be migrated. """
+        return self.count + self.rehash_count
+
+    def __iter__(self) -> LinearProbeTableIterator[K, T]:
+        """ Computes and returns an iterator over the keys of the table. """
+        return LinearProbeTableIterator(self)
+
+    def __contains__(self, key: K) -> bool:
+        """ Checks to see if the key is in the table, without raising. """
+        key_hash = self.hash_key(key)
+        return self.__linear_probe(key, key_hash, False) >= 0 or self.__rehash_probe(key, key_hash) >= 0
+
+    def keys(self) -> LinearProbeKeysView:
+        """ Returns a view of the keys of the table. """
+        return LinearProbeKeysView(self)
 
-    def __delitem__(self, key: str) -> None:
+    def values(self) -> LinearProbeValuesView:
+        """ Returns a view of the data of the table. """
+        return LinearProbeValuesView(self)
+
+    def items(self) -> LinearProbeItemsView:
+        """ Returns a view of the (key, data) pairs of the table. """
+        return LinearProbeItemsView(self)
+
+    def get(self, key: K, default: T = None) -> T:
+        """ Returns the data at a certain key, or default if the key is not in the table. """
+        key_hash = self.hash_key(key)
+        position = self.__linear_probe(key, key_hash, False)
+        if position >= 0:
+            return self.slot_values[position]
+        position = self.__rehash_probe(key, key_hash)
+        if position >= 0:
+            return self.rehash_values[position]
+        return default
+
+    def pop(self, key: K, *default: T) -> T:
+        """ Deletes the key and returns its data. Returns default if given and the key is not in the table, otherwise raises KeyError. """
+        try:
+            return self.__pop(key, self.hash_key(key))
+        except KeyError:
+            if len(default) > 0:
+                return default[0]
+            raise
+
+    def update(self, other=(), /, **kwargs: T) -> None:
+        """
+        Inserts every (key, data) pair of a mapping or an iterable of pairs, then of the keyword arguments.
+        The table is resized at most once up front when the number of pairs is known, and the cached hashes
+        of another LinearProbeTable with the same hash backend are reused.
+        """
+        if hasattr(other, "__len__"):
+            self.reserve(len(self) + len(other) + len(kwargs))
+        if isinstance(other, LinearProbeTable) and other.hash_function == self.hash_function:
+            for (key, data, key_hash) in other.__hashed_items():
+                self.__set_hashed(key, data, key_hash)
+        elif isinstance(other, Mapping):
+            for key in other:
+                self[key] = other[key]
+        else:
+            for (key, data) in other:
+                self[key] = data
+        for (key, data) in kwargs.items():
+            self[key] = data
+
+    def clear(self) -> None:
+        """ Clears the table back to its initial size. """
+        self.__resize(self.min_table_size, keep_items=False)
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes an item from our hash table.
+        :see: #self.__pop(key: K, key_hash: int)
+        """
+        self.__pop(key, self.hash_key(key))
+
+    def __pop(self, key: K, key_hash: int) -> T:
+        """
+        Deletes the key from whichever array holds it and returns its data, raising KeyError if it is not in the table.
+        While resizing incrementally it then migrates the next rehash_step old slots.
+        :see: #self.__delete_at(position: int)
         """
-        Deletes an item from our hash table by rehashing the remaining items in the current primary cluster.
+        position = self.__linear_probe(key, key_hash, False)
+        if position >= 0:
+            data = self.slot_values[position]
+            self.__delete_at(position)
+        else:
+            position = self.__rehash_probe(key, key_hash)
+            if position < 0:
+                raise KeyError(key)
+            data = self.rehash_values[position]
+            self.rehash_keys[position] = TOMBSTONE  # the old arrays are only probed, never inserted into
+            self.rehash_values[position] = None
+            self.rehash_count -= 1
+        if self.rehash_keys is not None:
+            self.__rehash_step(self.rehash_step)
+        return data
+
+    def __delete_at(self, position: int) -> None:
+        """
+        Deletes the item at a position by rehashing the remaining items in the current primary cluster,
+        or by leaving a tombstone in its slot when using DeletionStrategy.TOMBSTONE.
 
-        Complexity (Best): O(K) finds the position straight away and doesn't have to rehash where K is the size of the key
-        Complexity (Worst): O(K + N) when it has to rehash all items in the hash table where N is the table size
+        Complexity (Best): O(1) doesn't have to rehash
+        Complexity (Worst): O(N) when it has to reinsert all items in the hash table where N is the table size
         """
-        position = self.__linear_probe(key, False)
-        self.table[position] = None
+        self.slot_values[position] = None
         self.count -= 1
 
-        position = (position + 1) % len(self.table)
-        while self.table[position] is not None:
-            item = self.table[position]
-            self.table[position] = None
-            self.count -= 1
-            self[str(item[0])] = item[1]
-            position = (position + 1) % len(self.table)
+        if self.deletion_strategy == DeletionStrategy.TOMBSTONE:
+            self.slot_keys[position] = TOMBSTONE
+            self.tombstones += 1
+        else:
+            self.slot_keys[position] = None
+
+            # Reinsert the rest of the cluster with their cached hashes
+            position = (position + 1) % len(self.slot_keys)
+            while self.slot_keys[position] is not None:
+                item_key = self.slot_keys[position]
+                item_data = self.slot_values[position]
+                key_hash = self.hashes[position]
+                self.slot_keys[position] = None
+                self.slot_values[position] = None
+                self.count -= 1
+                self.__insert(item_key, item_data, key_hash)
+                position = (position + 1) % len(self.slot_keys)
+
+        if len(self) < self.min_load_factor * len(self.slot_keys) and len(self.slot_keys) > self.min_table_size:
+            # Shrink to about half the max load factor, so a few inserts do not grow it straight back
+            self.__resize(max(self.__table_size_for(2 * len(self)), self.min_table_size))
+        elif self.tombstones > self.tombstone_fraction * len(self.slot_keys):
+            self.__resize(len(self.slot_keys))  # compact the tombstones away
+
+    def reserve(self, n: int) -> None:
+        """ Resize the table once so that it holds n items without growing again. """
+        table_size = self.__table_size_for(n)
+        if table_size > len(self.slot_keys):
+            self.__resize(table_size)
+
+    def load_factor(self) -> float:
+        """ Returns the fraction of the table that is occupied by items (counting those still to be migrated). """
+        return len(self) / len(self.slot_keys)
+
+    def __table_size_for(self, n: int, larger_than: int = 0) -> int:
+        """ Smallest size along PRIMES (above larger_than) that holds n items within the max load factor. """
+        for prime in LinearProbeTable.PRIMES:
+            if prime > larger_than and n <= self.max_load_factor * prime:
+                return prime
+        return max(int(n / self.max_load_factor), larger_than) + 1  # ran out of primes
 
     def __rehash(self) -> None:
-        """ Need to resize table and reinsert all values. """
-        new_hash = LinearProbeTable(LinearProbeTable.PRIMES[self.next_prime])
-        self.next_prime += 1
+        """
+        Need to grow the table and reinsert all values. An incremental resize instead starts migrating into a table
+        about twice the size, which leaves room for every insert made until the migration has finished.
+        """
+        if self.resize_strategy == ResizeStrategy.BLOCKING:
+            self.__resize(self.__table_size_for(self.count + 1, len(self.slot_keys)))
+        elif self.rehash_keys is not None:
+            # Only happens if the writes outpaced the migration: finish it in one go
+            self.__resize(self.__table_size_for(len(self) + 1, len(self.slot_keys)))
+        else:
+            table_size = self.__table_size_for(2 * (len(self) + 1), len(self.slot_keys))
+            self.rehash_keys = self.slot_keys
+            self.rehash_values = self.slot_values
+            self.rehash_hashes = self.hashes
+            self.rehash_position = 0
+            self.rehash_count = self.count
+            self.count = 0
+            self.tombstones = 0
+            self.slot_keys = FixedSizeArray(table_size)
+            self.slot_values = FixedSizeArray(table_size)
+            self.hashes = array('q', [0]) * table_size
+
+    def __rehash_step(self, slots: int) -> None:
+        """
+        Migrates the next slots of the table being resized into the current one, with their cached hashes.
+        Each migrated slot is left as a TOMBSTONE, so lookups in the old arrays still probe past it.
+        The old arrays are dropped as soon as they hold no item.
+
+        Complexity (Best): O(1) when the next slot is the last item
+        Complexity (Worst): O(slots) for scanning the slots, plus the probes inserting their items
+        """
+        while slots > 0 and self.rehash_keys is not None and self.rehash_count > 0:
+            position = self.rehash_position
+            key = self.rehash_keys[position]
+            self.rehash_position += 1
+            slots -= 1
+            if key is not None and key is not TOMBSTONE:
+                data = self.rehash_values[position]
+                self.rehash_keys[position] = TOMBSTONE
+                self.rehash_values[position] = None
+                self.rehash_count -= 1
+                self.__insert(key, data, self.rehash_hashes[position])
 
-        for i in range(len(self.table)):
-            if self.table[i] is not None:
-                new_hash[str(self.table[i][0])] = self.table[i][1]
+        if self.rehash_keys is not None and self.rehash_count == 0:
+            self.rehash_keys = None
+            self.rehash_values = None
+            self.rehash_hashes = None
+            self.rehash_position = 0
+
+    def __rehash_probe(self, key: K, key_hash: int) -> int:
+        """
+        Finds the position of the key in the arrays being migrated with linear probing, or -1 if it is not there
+        (or the table is not resizing incrementally).
+        """
+        if self.rehash_keys is None:
+            return -1
+        size = len(self.rehash_keys)
+        position = key_hash % size
+        for _ in range(size):
+            stored_key = self.rehash_keys[position]
+            if stored_key is None:
+                return -1
+            elif stored_key is not TOMBSTONE and self.rehash_hashes[position] == key_hash and stored_key == key:
+                return position
+            position = (position + 1) % size
+        return -1
+
+    def __hashed_items(self):
+        """ Yields the (key, data, full hash) of every item, including those still to be migrated. """
+        for (slot_keys, slot_values, hashes) in [(self.slot_keys, self.slot_values, self.hashes),
+                                                 (self.rehash_keys, self.rehash_values, self.rehash_hashes)]:
+            for i in range(len(slot_keys) if slot_keys is not None else 0):
+                key = slot_keys[i]
+                if key is not None and key is not TOMBSTONE:
+                    yield (key, slot_values[i], hashes[i])
+
+    def __resize(self, table_size: int, keep_items: bool = True) -> None:
+        """
+        Reinsert all values into a table of the given size in one go, dropping any tombstone and finishing any incremental resize.
+        The cached hashes are reused, so no key is hashed again.
+        """
+        new_hash = LinearProbeTable(table_size, self.hash_function, self.deletion_strategy, self.tombstone_fraction,
+                                    self.max_load_factor, self.min_load_factor)
+
+        if keep_items:
+            for (key, data, key_hash) in self.__hashed_items():
+                new_hash.__insert(key, data, key_hash)
 
         self.count = new_hash.count
-        self.table = new_hash.table
+        self.tombstones = 0
+        self.slot_keys = new_hash.slot_keys
+        self.slot_values = new_hash.slot_values
+        self.hashes = new_hash.hashes
+        self.rehash_keys = None
+        self.rehash_values = None
+        self.rehash_hashes = None
+        self.rehash_position = 0
+        self.rehash_count = 0
 
-    def __linear_probe(self, key: str, is_insert: bool) -> int:
+    def __linear_probe(self, key: K, key_hash: int, is_insert: bool) -> int:
         """
         Find the correct position for this key in the hash table using linear probing.
+        The cached hashes are compared first, so the key itself is only compared on a hash match.
+        Lookups probe past tombstones, inserts reuse the first tombstone found once the key is known to be absent.
+        Returns -1 when a lookup does not find the key, or when an insert finds no room for it.
 
-        Complexity (Best): O(K) first position is empty where K is the size of the key
-        Complexity (Worst): O(K + N) when we've searched the entire table where N is the table_size
+        Complexity (Best): O(1) first position is empty
+        Complexity (Worst): O(N) when we've searched the entire table where N is the table_size
         """
-        position = self.hash(key)  # get the position using hash
+        position = key_hash % len(self.slot_keys)  # get the position using the full hash
 
         if is_insert and self.is_full():
-            raise KeyError(key)
+            return -1
 
-        for _ in range(len(self.table)):  # start traversing
-            if self.table[position] is None:  # found empty slot
+        first_tombstone = None
+        for _ in range(len(self.slot_keys)):  # start traversing
+            stored_key = self.slot_keys[position]
+            if stored_key is None:  # found empty slot
                 if is_insert:
-                    return position
-                raise KeyError(key)  # so the key is not in
-            elif self.table[position][0] == key:  # found key
+                    return position if first_tombstone is None else first_tombstone
+                return -1  # so the key is not in
+            elif stored_key is TOMBSTONE:  # deleted slot, the key may still be further along
+                if first_tombstone is None:
+                    first_tombstone = position
+            elif self.hashes[position] == key_hash and stored_key == key:  # found key
                 return position
-            else:  # there is something but not the key, try next
-                position = (position + 1) % len(self.table)
+            position = (position + 1) % len(self.slot_keys)  # there is something but not the key, try next
 
-    def __getitem__(self, key: str) -> T:
-        """ Get the item at a certain key. """
-        position = self.__linear_probe(key, False)
-        return self.table[position][1]
+        if is_insert and first_tombstone is not None:
+            return first_tombstone
+        return -1
+
+    def __getitem__(self, key: K) -> T:
+        """ Get the item at a certain key, looking in the arrays being migrated if it is not in the current ones. """
+        key_hash = self.hash_key(key)
+        position = self.__linear_probe(key, key_hash, False)
+        if position >= 0:
+            return self.slot_values[position]
+        position = self.__rehash_probe(key, key_hash)
+        if position >= 0:
+            return self.rehash_values[position]
+        raise KeyError(key)
 
-    def __setitem__(self, key: str, data: T) -> None:
+    def __setitem__(self, key: K, data: T) -> None:
         """
         Set an (key, data) pair in our hash table
-        :see: #self.__linear_probe(key: str, is_insert: bool)
+        :see: #self.__set_hashed(key: K, data: T, key_hash: int)
+        """
+        if key is None:
+            raise TypeError("None cannot be used as a key, it marks an empty slot.")
+        self.__set_hashed(key, data, self.hash_key(key))
+
+    def __set_hashed(self, key: K, data: T, key_hash: int) -> None:
+        """
+        Set an (key, data) pair whose full hash is already known. While resizing incrementally, a key still in the
+        old arrays is updated in place and a new key migrates the next rehash_step old slots, so updating the data
+        of a key never moves any item.
+        :see: #self.__insert(key: K, data: T, key_hash: int)
+        """
+        if self.rehash_keys is None:
+            self.__insert(key, data, key_hash)
+            return
+        position = self.__rehash_probe(key, key_hash)
+        if position >= 0:
+            self.rehash_values[position] = data
+            return
+        count = len(self)
+        self.__insert(key, data, key_hash)
+        if len(self) > count and self.rehash_keys is not None:
+            self.__rehash_step(self.rehash_step)
+
+    def __insert(self, key: K, data: T, key_hash: int) -> None:
+        """
+        Insert an (key, data) pair whose full hash is already known.
+        The table grows once the insert takes it past the max load factor.
+        :see: #self.__linear_probe(key: K, key_hash: int, is_insert: bool)
         :see: #self.__rehash()
         """
-        try:
-            position = self.__linear_probe(key, True)
-        except KeyError:
+        position = self.__linear_probe(key, key_hash, True)
+        if position < 0:
             self.__rehash()
-            self.__setitem__(key, data)  # try again
+            position = self.__rehash_probe(key, key_hash)  # a full table may have held the key
+            if position >= 0:
+                self.rehash_values[position] = data
+            else:
+                self.__insert(key, data, key_hash)  # try again
         else:
-            if self.table[position] is None:
+            stored_key = self.slot_keys[position]
+            if stored_key is None or stored_key is TOMBSTONE:
                 self.count += 1
-            self.table[position] = (key, data)
+                if stored_key is TOMBSTONE:
+                    self.tombstones -= 1
+            self.slot_keys[position] = key
+            self.slot_values[position] = data
+            self.hashes[position] = key_hash
+            if self.count + self.tombstones > self.max_load_factor * len(self.slot_keys):
+                self.__rehash()
 
     def is_empty(self):
         """ Returns whether the hash table is empty. """
-        return self.count == 0
+        return len(self) == 0
 
     def is_full(self):
         """ Returns whether the hash table is full. """
-        return self.count == len(self.table)
+        return self.count == len(self.slot_keys)
 
-    def hash(self, key: str) -> int:
-        """ Universal Hash function. """
-        value = 0
-        a = 31415
-        for char in key:
-            value = (ord(char) + a * value) % len(self.table)
-            a = a * LinearProbeTable.DEFAULT_HASH_BASE % (len(self.table) - 1)
-        return value
+    def probe_statistics(self) -> ProbeStatistics:
+        """ Returns statistics on how many probes a lookup of each stored key takes. """
+        lengths = []
+        for i in range(len(self.slot_keys)):
+            if self.slot_keys[i] is not None and self.slot_keys[i] is not TOMBSTONE:
+                lengths.append((i - self.hashes[i]) % len(self.slot_keys) + 1)
+        for i in range(len(self.rehash_keys) if self.rehash_keys is not None else 0):
+            if self.rehash_keys[i] is not None and self.rehash_keys[i] is not TOMBSTONE:
+                lengths.append((i - self.rehash_hashes[i]) % len(self.rehash_keys) + 1)
+        return ProbeStatistics.from_lengths(lengths)
+
+    def hash_key(self, key: K) -> int:
+        """ Full hash of the key using the table's hash backend. It does not depend on the table size. """
+        return self.__hash_key(key)
+
+    def hash(self, key: K) -> int:
+        """ Position of the key in the current table. """
+        return self.hash_key(key) % len(self.slot_keys)
 
-    def insert(self, key: str, data: T) -> None:
+    def insert(self, key: K, data: T) -> None:
         """ Utility method to call our setitem method. """
         self[key] = data
 
+    def save(self, path: str) -> None:
+        """
+        Writes the table to a snapshot file, keeping every item in its slot so loading never probes or hashes again.
+        A table holding tombstones or in the middle of an incremental resize is compacted into a copy first.
+        Keys must hash the same in every process, so the salted builtin hash cannot be saved, and neither can
+        keys falling back to it (see has_stable_hash). Either raises ValueError before the file is written.
+        """
+        if self.hash_function == HashFunction.BUILTIN:
+            raise ValueError("Tables using the builtin hash cannot be saved, it is salted per process.")
+        table = self
+        if self.tombstones > 0 or self.rehash_keys is not None:
+            table = LinearProbeTable(len(self.slot_keys), self.hash_function, self.deletion_strategy,
+                                     self.tombstone_fraction, self.max_load_factor, self.min_load_factor)
+            for (key, data, key_hash) in self.__hashed_items():
+                table.__insert(key, data, key_hash)
+
+        offsets = array('q', [0])
+        records = []
+        for i in range(len(table.slot_keys)):
+            if table.slot_keys[i] is not None:
+                if not has_stable_hash(table.slot_keys[i]):
+                    raise ValueError("Key " + repr(table.slot_keys[i]) + " cannot be saved, its hash is salted per process.")
+                records.append(pickle.dumps((table.slot_keys[i], table.slot_values[i]), pickle.HIGHEST_PROTOCOL))
+                offsets.append(offsets[-1] + len(records[-1]))
+            else:
+                offsets.append(offsets[-1])
+
+        with open(path, "wb") as file:
+            file.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, len(table.slot_keys), self.min_table_size, table.count,
+                                            self.hash_function.value, self.deletion_strategy.value,
+                                            self.resize_strategy.value, self.rehash_step, self.tombstone_fraction,
+                                            self.max_load_factor, self.min_load_factor))
+            file.write(table.hashes.tobytes())
+            file.write(offsets.tobytes())
+            file.writelines(records)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'LinearProbeTable[K, T] | MappedLinearProbeTable[K, T]':
+        """
+        Loads a table written by save. With mmap the file is memory-mapped and returned as a read-only
+        MappedLinearProbeTable, which only deserialises the records its lookups touch. Otherwise every record is
+        deserialised into a LinearProbeTable, straight into its saved slot.
+        """
+        if mmap:
+            return MappedLinearProbeTable(path)
+        with open(path, "rb") as file:
+            snapshot = file.read()
+        (table_size, min_table_size, count, hash_function, deletion_strategy, resize_strategy, rehash_step,
+         tombstone_fraction, max_load_factor, min_load_factor) = read_snapshot_header(snapshot)
+
+        table = cls(min_table_size, HashFunction(hash_function), DeletionStrategy(deletion_strategy),
+                    tombstone_fraction, max_load_factor, min_load_factor, ResizeStrategy(resize_strategy), rehash_step)
+        start = SNAPSHOT_HEADER.size
+        table.hashes = array('q')
+        table.hashes.frombytes(snapshot[start:start + 8 * table_size])
+        offsets = array('q')
+        offsets.frombytes(snapshot[start + 8 * table_size:start + 8 * (2 * table_size + 1)])
+        heap = memoryview(snapshot)[start + 8 * (2 * table_size + 1):]
+
+        table.slot_keys = FixedSizeArray(table_size)
+        table.slot_values = FixedSizeArray(table_size)
+        for i in range(table_size):
+            if offsets[i] != offsets[i + 1]:
+                (table.slot_keys[i], table.slot_values[i]) = pickle.loads(heap[offsets[i]:offsets[i + 1]])
+        table.count = count
+        return table
+
+    def __str__(self) -> str:
+        """ Returns all they key/value pairs in our hash table (in no particular order). """
+        result = ""
+        for (key, data) in self.items():
+            result += "(" + str(key) + "," + str(data) + ")\n"
+        return result
+
+
+def read_snapshot_header(snapshot) -> tuple:
+    """ Checks the header of a snapshot and returns its fields after the magic number. """
+    if len(snapshot) < SNAPSHOT_HEADER.size or snapshot[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+        raise ValueError("Not a LinearProbeTable snapshot.")
+    fields = SNAPSHOT_HEADER.unpack_from(snapshot)
+    if len(snapshot) < SNAPSHOT_HEADER.size + 8 * (2 * fields[1] + 1):
+        raise ValueError("Truncated LinearProbeTable snapshot.")
+    return fields[1:]
+
+
+class MappedLinearProbeTable[K, T](Mapping):
+    """
+    Read-only Linear Probe Hash Table answering lookups straight from a memory-mapped snapshot.
+    Opening it only reads the header, so it costs the same for any table size. Lookups probe the mapped hashes and
+    only deserialise a record when its hash matches. Decoded records are kept, so touching a key again is cheap.
+
+    Attributes:
+        - path: file the snapshot was loaded from
+        - table_size: number of slots in the snapshot
+        - count: number of elements in the snapshot
+        - hash_function: hash backend the snapshot was saved with
+        - hashes: memory-mapped full hash of each slot
+        - offsets: memory-mapped start of the record of each slot in the heap (and the end of the last one)
+        - decoded: (key, data) record of each slot decoded so far
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as file:
+            self.__mmap = MemoryMap(file.fileno(), 0, access=ACCESS_READ)
+        try:
+            (self.table_size, self.min_table_size, self.count, hash_function, deletion_strategy, resize_strategy,
+             self.rehash_step, self.tombstone_fraction, self.max_load_factor,
+             self.min_load_factor) = read_snapshot_header(self.__mmap)
+        except ValueError:
+            self.__mmap.close()
+            raise
+        self.hash_function = HashFunction(hash_function)
+        self.deletion_strategy = DeletionStrategy(deletion_strategy)
+        self.resize_strategy = ResizeStrategy(resize_strategy)
+        self.__hash_key = HASH_FUNCTIONS[self.hash_function]
+
+        start = SNAPSHOT_HEADER.size
+        self.hashes = memoryview(self.__mmap)[start:start + 8 * self.table_size].cast('q')
+        self.offsets = memoryview(self.__mmap)[start + 8 * self.table_size:start + 8 * (2 * self.table_size + 1)].cast('q')
+        self.__heap_start = start + 8 * (2 * self.table_size + 1)
+        self.decoded = {}
+
+    def __record(self, position: int) -> tuple[K, T]:
+        """ Returns the (key, data) record of an occupied slot, deserialising it on first use. """
+        record = self.decoded.get(position)
+        if record is None:
+            start = self.__heap_start + self.offsets[position]
+            record = pickle.loads(self.__mmap[start:self.__heap_start + self.offsets[position + 1]])
+            self.decoded[position] = record
+        return record
+
+    def __linear_probe(self, key: K) -> int:
+        """
+        Find the slot of this key in the snapshot using linear probing, or -1 if it is not there.
+        Only records whose cached hash matches are deserialised.
+
+        Complexity (Best): O(1) first position is empty
+        Complexity (Worst): O(N) when we've searched the entire table where N is the table_size
+        """
+        key_hash = self.hash_key(key)
+        position = key_hash % self.table_size
+        for _ in range(self.table_size):
+            if self.offsets[position] == self.offsets[position + 1]:  # found empty slot
+                return -1
+            elif self.hashes[position] == key_hash and self.__record(position)[0] == key:
+                return position
+            position = (position + 1) % self.table_size
+        return -1
+
+    def __len__(self) -> int:
+        """ Returns number of elements in the hash table. """
+        return self.count
+
+    def __iter__(self):
+        """ Yields the keys in slot order, deserialising each record. """
+        for position in range(self.table_size):
+            if self.offsets[position] != self.offsets[position + 1]:
+                yield self.__record(position)[0]
+
+    def __contains__(self, key: K) -> bool:
+        """ Checks to see if the key is in the table, without raising. """
+        return self.__linear_probe(key) >= 0
+
+    def __getitem__(self, key: K) -> T:
+        """ Get the item at a certain key. """
+        position = self.__linear_probe(key)
+        if position < 0:
+            raise KeyError(key)
+        return self.__record(position)[1]
+
+    def get(self, key: K, default: T = None) -> T:
+        """ Returns the data at a certain key, or default if the key is not in the table. """
+        position = self.__linear_probe(key)
+        if position < 0:
+            return default
+        return self.__record(position)[1]
+
+    def hash_key(self, key: K) -> int:
+        """ Full hash of the key using the snapshot's hash backend. """
+        return self.__hash_key(key)
+
+    def copy(self) -> LinearProbeTable[K, T]:
+        """ Returns a writable LinearProbeTable holding every item in its saved slot, so no key is hashed again. """
+        return LinearProbeTable.load(self.path, mmap=False)
+
+    def close(self) -> None:
+        """ Releases the memory map. The table cannot be used afterwards. """
+        self.hashes.release()
+        self.offsets.release()
+        self.__mmap.close()
+
+    def __enter__(self) -> 'MappedLinearProbeTable[K, T]':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def __str__(self) -> str:
         """ Returns all they key/value pairs in our hash table (in no particular order). """
         result = ""
-        for item in self.table:
-            if item is not None:
-                (key, value) = item
-                result += "(" + str(key) + "," + str(value) + ")\n"
-        return result
\ No newline at end of file
+        for (key, data) in self.items():
+            result += "(" + str(key) + "," + str(data) + ")\n"
+        return result
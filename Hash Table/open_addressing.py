@@ -0,0 +1,399 @@
+"""
+Open Addressing Hash Table Implementations.
+
+- Siblings of LinearProbeTable sharing the same FixedSizeArray storage (parallel arrays of keys, values and cached full hashes).
+- Robin Hood hashing with backward-shift deletion.
+- Quadratic probing and double hashing, both using tombstones for deletion.
+"""
+
+from abc import ABC, abstractmethod
+from array import array
+from fixed_size_array import FixedSizeArray
+from hash import LinearProbeTable, HashFunction, HASH_FUNCTIONS, ProbeStatistics, TOMBSTONE
+
+
+class OpenAddressingTable[K, T](ABC):
+    """
+    Abstract class for an open addressing hash table.
+
+    Constants:
+        - MIN_CAPACITY: smallest valid table size
+        - DEFAULT_TABLE_SIZE: default table size used in the __init__
+        - DEFAULT_MAX_LOAD_FACTOR: load factor above which the table grows
+        - PRIMES: list of prime numbers to use for resizing (shared with LinearProbeTable)
+
+    Attributes:
+        - count: number of elements in the hash table
+        - slot_keys: internal array of keys (None for an empty slot, TOMBSTONE for a deleted slot)
+        - slot_values: internal array of the data of the key at the same position in slot_keys
+        - hashes: typed array of the full hash of the key at the same position in slot_keys
+        - hash_function: hash backend used to compute the full hash of a key
+        - max_load_factor: table grows along PRIMES once it is loaded above it
+    """
+    MIN_CAPACITY = 1
+
+    DEFAULT_TABLE_SIZE = 17
+    DEFAULT_MAX_LOAD_FACTOR = 2 / 3
+    PRIMES = LinearProbeTable.PRIMES
+
+    def __init__(self, table_size: int = DEFAULT_TABLE_SIZE, hash_function: HashFunction = HashFunction.UNIVERSAL,
+                 max_load_factor: float = None) -> None:
+        if max_load_factor is None:
+            max_load_factor = self.DEFAULT_MAX_LOAD_FACTOR
+        if not 0 < max_load_factor <= 1:
+            raise ValueError("Load factor should satisfy 0 < max_load_factor <= 1.")
+        self.count = 0
+        self.max_load_factor = max_load_factor
+        self.slot_keys = FixedSizeArray(max(self.MIN_CAPACITY, table_size))
+        self.slot_values = FixedSizeArray(max(self.MIN_CAPACITY, table_size))
+        self.hashes = array('q', [0]) * max(self.MIN_CAPACITY, table_size)
+        self.hash_function = hash_function
+        self.__hash_key = HASH_FUNCTIONS[hash_function]
+
+    def __len__(self) -> int:
+        """ Returns number of elements in the hash table. """
+        return self.count
+
+    @abstractmethod
+    def find(self, key: K, key_hash: int) -> int:
+        """ Returns the position of the key in the table. Raises KeyError if it is not in. """
+        pass
+
+    @abstractmethod
+    def insert_hashed(self, key: K, data: T, key_hash: int) -> None:
+        """ Insert an (key, data) pair whose full hash is already known, without growing the table. """
+        pass
+
+    @abstractmethod
+    def __delitem__(self, key: K) -> None:
+        """ Deletes an item from our hash table. """
+        pass
+
+    @abstractmethod
+    def probe_length(self, position: int) -> int:
+        """ Returns the number of probes a lookup takes to reach the key stored at position. """
+        pass
+
+    def __iter__(self):
+        """ Yields the keys of the table, raising RuntimeError if the table changes size during the iteration. """
+        slot_keys = self.slot_keys
+        count = self.count
+        for i in range(len(slot_keys)):
+            if self.slot_keys is not slot_keys or self.count != count:
+                raise RuntimeError(type(self).__name__ + " changed size during iteration")
+            if self.is_occupied(slot_keys[i]):
+                yield slot_keys[i]
+
+    def __contains__(self, key: K) -> bool:
+        """ Checks to see if the key is in the table, without raising. """
+        try:
+            self.find(key, self.hash_key(key))
+        except KeyError:
+            return False
+        return True
+
+    def __getitem__(self, key: K) -> T:
+        """ Get the item at a certain key. """
+        position = self.find(key, self.hash_key(key))
+        return self.slot_values[position]
+
+    def __setitem__(self, key: K, data: T) -> None:
+        """
+        Set an (key, data) pair in our hash table, growing the table first if the insert could take it past the max load factor.
+        :see: #self.insert_hashed(key: K, data: T, key_hash: int)
+        """
+        if key is None:
+            raise TypeError("None cannot be used as a key, it marks an empty slot.")
+        if self.count + 1 > self.max_load_factor * len(self.slot_keys):
+            self.resize(self.table_size_for(self.count + 1, len(self.slot_keys)))
+        self.insert_hashed(key, data, self.hash_key(key))
+
+    def table_size_for(self, n: int, larger_than: int = 0) -> int:
+        """ Smallest size along PRIMES (above larger_than) that holds n items within the max load factor. """
+        for prime in self.PRIMES:
+            if prime > larger_than and n <= self.max_load_factor * prime:
+                return prime
+        return max(int(n / self.max_load_factor), larger_than) + 1  # ran out of primes
+
+    def resize(self, table_size: int) -> None:
+        """ Reinsert all values into a table of the given size. The cached hashes are reused, so no key is hashed again. """
+        old_slot_keys = self.slot_keys
+        old_slot_values = self.slot_values
+        old_hashes = self.hashes
+        self.count = 0
+        self.slot_keys = FixedSizeArray(table_size)
+        self.slot_values = FixedSizeArray(table_size)
+        self.hashes = array('q', [0]) * table_size
+
+        for i in range(len(old_slot_keys)):
+            if self.is_occupied(old_slot_keys[i]):
+                self.insert_hashed(old_slot_keys[i], old_slot_values[i], old_hashes[i])
+
+    def reserve(self, n: int) -> None:
+        """ Resize the table once so that it holds n items without growing again. """
+        table_size = self.table_size_for(n)
+        if table_size > len(self.slot_keys):
+            self.resize(table_size)
+
+    def load_factor(self) -> float:
+        """ Returns the fraction of the table that is occupied by items. """
+        return self.count / len(self.slot_keys)
+
+    def probe_statistics(self) -> ProbeStatistics:
+        """ Returns statistics on how many probes a lookup of each stored key takes. """
+        lengths = []
+        for i in range(len(self.slot_keys)):
+            if self.is_occupied(self.slot_keys[i]):
+                lengths.append(self.probe_length(i))
+        return ProbeStatistics.from_lengths(lengths)
+
+    @staticmethod
+    def is_occupied(stored_key: K) -> bool:
+        """ Returns whether a slot holding stored_key holds an item, rather than being empty or deleted. """
+        return stored_key is not None and stored_key is not TOMBSTONE
+
+    def is_empty(self) -> bool:
+        """ Returns whether the hash table is empty. """
+        return self.count == 0
+
+    def is_full(self) -> bool:
+        """ Returns whether the hash table is full. """
+        return self.count == len(self.slot_keys)
+
+    def hash_key(self, key: K) -> int:
+        """ Full hash of the key using the table's hash backend. It does not depend on the table size. """
+        return self.__hash_key(key)
+
+    def hash(self, key: K) -> int:
+        """ Position of the key in the current table. """
+        return self.hash_key(key) % len(self.slot_keys)
+
+    def insert(self, key: K, data: T) -> None:
+        """ Utility method to call our setitem method. """
+        self[key] = data
+
+    def __str__(self) -> str:
+        """ Returns all they key/value pairs in our hash table (in no particular order). """
+        result = ""
+        for i in range(len(self.slot_keys)):
+            if self.is_occupied(self.slot_keys[i]):
+                result += "(" + str(self.slot_keys[i]) + "," + str(self.slot_values[i]) + ")\n"
+        return result
+
+
+class RobinHoodTable[K, T](OpenAddressingTable[K, T]):
+    """
+    Robin Hood Hash Table
+
+    Linear probing where an insert takes the slot of any key that is closer to its home position than the inserted key,
+    which keeps the variance of the probe lengths low. Deletion shifts the rest of the cluster back by one slot,
+    so the table never holds tombstones.
+    """
+    DEFAULT_MAX_LOAD_FACTOR = 0.9
+
+    def probe_length(self, position: int) -> int:
+        """ Returns the number of probes a lookup takes to reach the key stored at position. """
+        return (position - self.hashes[position]) % len(self.slot_keys) + 1
+
+    def find(self, key: K, key_hash: int) -> int:
+        """
+        Find the position of the key. The search stops early once it reaches a key closer to its home than the key searched for would be.
+
+        Complexity (Best): O(1) key is at its home position
+        Complexity (Worst): O(N) where N is the table_size
+        """
+        size = len(self.slot_keys)
+        position = key_hash % size
+        for distance in range(size):
+            stored_key = self.slot_keys[position]
+            if stored_key is None or (position - self.hashes[position]) % size < distance:
+                break
+            elif self.hashes[position] == key_hash and stored_key == key:
+                return position
+            position = (position + 1) % size
+        raise KeyError(key)
+
+    def insert_hashed(self, key: K, data: T, key_hash: int) -> None:
+        """
+        Insert an (key, data) pair, displacing any key closer to its home position than the one being carried.
+
+        Complexity (Best): O(1) home position is empty
+        Complexity (Worst): O(N) where N is the table_size
+        """
+        size = len(self.slot_keys)
+        position = key_hash % size
+        distance = 0
+        displaced = False
+        for _ in range(size):
+            if self.slot_keys[position] is None:  # found empty slot
+                self.slot_keys[position] = key
+                self.slot_values[position] = data
+                self.hashes[position] = key_hash
+                self.count += 1
+                return
+
+            stored_hash = self.hashes[position]
+            if not displaced and stored_hash == key_hash and self.slot_keys[position] == key:  # found key
+                self.slot_values[position] = data
+                return
+
+            stored_distance = (position - stored_hash) % size
+            if stored_distance < distance:  # take from the rich, carry the displaced item further along
+                (key, self.slot_keys[position]) = (self.slot_keys[position], key)
+                (data, self.slot_values[position]) = (self.slot_values[position], data)
+                (key_hash, self.hashes[position]) = (stored_hash, key_hash)
+                distance = stored_distance
+                displaced = True
+            position = (position + 1) % size
+            distance += 1
+        raise KeyError(key)
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes an item from our hash table by shifting back the following keys that are not at their home position.
+
+        Complexity (Best): O(K) the next slot is empty or holds a key at its home position where K is the size of the key
+        Complexity (Worst): O(K + N) where N is the table_size
+        """
+        size = len(self.slot_keys)
+        position = self.find(key, self.hash_key(key))
+        next_position = (position + 1) % size
+        while self.slot_keys[next_position] is not None and self.hashes[next_position] % size != next_position:
+            self.slot_keys[position] = self.slot_keys[next_position]
+            self.slot_values[position] = self.slot_values[next_position]
+            self.hashes[position] = self.hashes[next_position]
+            position = next_position
+            next_position = (next_position + 1) % size
+        self.slot_keys[position] = None
+        self.slot_values[position] = None
+        self.count -= 1
+
+
+class TombstoneProbeTable[K, T](OpenAddressingTable[K, T]):
+    """
+    Abstract class for an open addressing hash table that leaves a tombstone in the slot of a deleted key.
+
+    Constants:
+        - DEFAULT_TOMBSTONE_FRACTION: fraction of the table that may hold tombstones before it is compacted
+
+    Attributes:
+        - tombstones: number of tombstones in table
+        - tombstone_fraction: table is compacted once tombstones exceed this fraction of it
+    """
+    DEFAULT_TOMBSTONE_FRACTION = 0.25
+
+    def __init__(self, table_size: int = OpenAddressingTable.DEFAULT_TABLE_SIZE,
+                 hash_function: HashFunction = HashFunction.UNIVERSAL, max_load_factor: float = None,
+                 tombstone_fraction: float = DEFAULT_TOMBSTONE_FRACTION) -> None:
+        super().__init__(table_size, hash_function, max_load_factor)
+        self.tombstones = 0
+        self.tombstone_fraction = tombstone_fraction
+
+    @abstractmethod
+    def probe_position(self, key_hash: int, i: int) -> int:
+        """ Returns the i-th position of the probe sequence of a key. """
+        pass
+
+    def probe_length(self, position: int) -> int:
+        """ Returns the number of probes a lookup takes to reach the key stored at position. """
+        i = 0
+        while self.probe_position(self.hashes[position], i) != position:
+            i += 1
+        return i + 1
+
+    def find(self, key: K, key_hash: int) -> int:
+        """
+        Find the position of the key, probing past tombstones.
+
+        Complexity (Best): O(1) first position holds the key or is empty
+        Complexity (Worst): O(N) where N is the table_size
+        """
+        for i in range(len(self.slot_keys)):
+            position = self.probe_position(key_hash, i)
+            stored_key = self.slot_keys[position]
+            if stored_key is None:  # found empty slot
+                break
+            elif stored_key is not TOMBSTONE and self.hashes[position] == key_hash and stored_key == key:
+                return position
+        raise KeyError(key)
+
+    def insert_hashed(self, key: K, data: T, key_hash: int) -> None:
+        """ Insert an (key, data) pair, reusing the first tombstone found once the key is known to be absent. """
+        free_position = None
+        for i in range(len(self.slot_keys)):
+            position = self.probe_position(key_hash, i)
+            stored_key = self.slot_keys[position]
+            if stored_key is None or stored_key is TOMBSTONE:
+                if free_position is None:
+                    free_position = position
+                if stored_key is None:  # found empty slot
+                    break
+            elif self.hashes[position] == key_hash and stored_key == key:  # found key
+                self.slot_values[position] = data
+                return
+
+        if free_position is None:  # probe sequence is exhausted
+            self.resize(self.table_size_for(self.count + 1, len(self.slot_keys)))
+            self.insert_hashed(key, data, key_hash)
+            return
+        if self.slot_keys[free_position] is TOMBSTONE:
+            self.tombstones -= 1
+        self.slot_keys[free_position] = key
+        self.slot_values[free_position] = data
+        self.hashes[free_position] = key_hash
+        self.count += 1
+
+    def __setitem__(self, key: K, data: T) -> None:
+        """ Set an (key, data) pair in our hash table, counting tombstones towards the load factor. """
+        if key is None:
+            raise TypeError("None cannot be used as a key, it marks an empty slot.")
+        if self.count + self.tombstones + 1 > self.max_load_factor * len(self.slot_keys):
+            if self.count + 1 > self.max_load_factor * len(self.slot_keys):
+                self.resize(self.table_size_for(self.count + 1, len(self.slot_keys)))
+            else:
+                self.resize(len(self.slot_keys))  # compacting the tombstones away is enough
+        self.insert_hashed(key, data, self.hash_key(key))
+
+    def __delitem__(self, key: K) -> None:
+        """ Deletes an item from our hash table by leaving a tombstone, compacting the table once there are too many. """
+        position = self.find(key, self.hash_key(key))
+        self.slot_keys[position] = TOMBSTONE
+        self.slot_values[position] = None
+        self.count -= 1
+        self.tombstones += 1
+        if self.tombstones > self.tombstone_fraction * len(self.slot_keys):
+            self.resize(len(self.slot_keys))
+
+    def resize(self, table_size: int) -> None:
+        """ Reinsert all values into a table of the given size, dropping any tombstone. """
+        self.tombstones = 0
+        super().resize(table_size)
+
+
+class QuadraticProbeTable[K, T](TombstoneProbeTable[K, T]):
+    """
+    Quadratic Probe Hash Table
+
+    Probes home, home + 1, home + 4, home + 9, ... which breaks up the primary clusters of linear probing.
+    With a prime table size only half of the table is reachable from a home position, so the load factor is kept at 1/2.
+    """
+    DEFAULT_MAX_LOAD_FACTOR = 1 / 2
+
+    def probe_position(self, key_hash: int, i: int) -> int:
+        """ Returns the i-th position of the probe sequence of a key. """
+        return (key_hash + i * i) % len(self.slot_keys)
+
+
+class DoubleHashTable[K, T](TombstoneProbeTable[K, T]):
+    """
+    Double Hash Table
+
+    Probes with a step derived from the high part of the full hash, so keys sharing a home position follow different sequences.
+    The step is never 0 and the table size is prime, so the sequence visits every slot.
+    """
+
+    def probe_position(self, key_hash: int, i: int) -> int:
+        """ Returns the i-th position of the probe sequence of a key. """
+        size = len(self.slot_keys)
+        step = 1 + (key_hash // size) % max(1, size - 1)
+        return (key_hash + i * step) % size
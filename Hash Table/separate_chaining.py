@@ -0,0 +1,227 @@
+"""
+Separate Chaining Hash Table Implementation.
+
+- Defines a Hash Table using Separate Chaining for conflict resolution.
+- Each bucket holds compact parallel arrays of keys, values and cached full hashes, instead of a linked list of nodes.
+"""
+
+from fixed_size_array import FixedSizeArray
+from hash import LinearProbeTable, HashFunction, HASH_FUNCTIONS, ProbeStatistics
+
+
+class SeparateChainingTable[K, T]:
+    """
+    Separate Chaining Hash Table
+
+    Constants:
+        - MIN_CAPACITY: smallest valid table size
+        - DEFAULT_TABLE_SIZE: default table size used in the __init__
+        - DEFAULT_MAX_LOAD_FACTOR: load factor above which the table grows (may be above 1)
+        - DEFAULT_MIN_LOAD_FACTOR: load factor below which the table shrinks (0 never shrinks)
+        - PRIMES: list of prime numbers to use for resizing (shared with LinearProbeTable)
+
+    Attributes:
+        - count: number of elements in the hash table
+        - bucket_keys: keys of each bucket, a list per non-empty bucket
+        - bucket_values: values of each bucket, parallel to bucket_keys
+        - bucket_hashes: full hashes of each bucket, parallel to bucket_keys
+        - hash_function: hash backend used to compute the full hash of a key
+        - max_load_factor: table grows along PRIMES once count / table size exceeds it
+        - min_load_factor: table shrinks along PRIMES once count / table size falls below it
+        - min_table_size: the table never shrinks below the size it was created with
+    """
+    MIN_CAPACITY = 1
+
+    DEFAULT_TABLE_SIZE = 17
+    DEFAULT_MAX_LOAD_FACTOR = 1.5
+    DEFAULT_MIN_LOAD_FACTOR = 1 / 8
+    PRIMES = LinearProbeTable.PRIMES
+
+    def __init__(self, table_size: int = DEFAULT_TABLE_SIZE, hash_function: HashFunction = HashFunction.UNIVERSAL,
+                 max_load_factor: float = DEFAULT_MAX_LOAD_FACTOR,
+                 min_load_factor: float = DEFAULT_MIN_LOAD_FACTOR) -> None:
+        if not 0 <= min_load_factor < max_load_factor:
+            raise ValueError("Load factors should satisfy 0 <= min_load_factor < max_load_factor.")
+        self.count = 0
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.min_table_size = max(self.MIN_CAPACITY, table_size)
+        self.bucket_keys = FixedSizeArray(self.min_table_size)
+        self.bucket_values = FixedSizeArray(self.min_table_size)
+        self.bucket_hashes = FixedSizeArray(self.min_table_size)
+        self.hash_function = hash_function
+        self.__hash_key = HASH_FUNCTIONS[hash_function]
+
+    def __len__(self) -> int:
+        """ Returns number of elements in the hash table. """
+        return self.count
+
+    def __find(self, key: K, key_hash: int) -> tuple[int, int]:
+        """
+        Returns the (bucket, index in bucket) position of the key.
+        The cached hashes are compared first, so the key itself is only compared on a hash match.
+
+        Complexity (Best): O(1) key is first in its bucket
+        Complexity (Worst): O(N) when every key is in the same bucket
+        """
+        bucket = key_hash % len(self.bucket_keys)
+        hashes = self.bucket_hashes[bucket]
+        if hashes is not None:
+            keys = self.bucket_keys[bucket]
+            for i in range(len(hashes)):
+                if hashes[i] == key_hash and keys[i] == key:
+                    return (bucket, i)
+        raise KeyError(key)
+
+    def __iter__(self):
+        """ Yields the keys of the table, raising RuntimeError if the table changes size during the iteration. """
+        bucket_keys = self.bucket_keys
+        count = self.count
+        for bucket in range(len(bucket_keys)):
+            keys = bucket_keys[bucket]
+            if keys is not None:
+                for key in list(keys):
+                    if self.bucket_keys is not bucket_keys or self.count != count:
+                        raise RuntimeError("SeparateChainingTable changed size during iteration")
+                    yield key
+
+    def __contains__(self, key: K) -> bool:
+        """ Checks to see if the key is in the table, without raising. """
+        try:
+            self.__find(key, self.hash_key(key))
+        except KeyError:
+            return False
+        return True
+
+    def __getitem__(self, key: K) -> T:
+        """ Get the item at a certain key. """
+        (bucket, i) = self.__find(key, self.hash_key(key))
+        return self.bucket_values[bucket][i]
+
+    def __setitem__(self, key: K, data: T) -> None:
+        """
+        Set an (key, data) pair in our hash table
+        :see: #self.__insert(key: K, data: T, key_hash: int)
+        """
+        key_hash = self.hash_key(key)
+        try:
+            (bucket, i) = self.__find(key, key_hash)
+        except KeyError:
+            self.__insert(key, data, key_hash)
+            if self.count > self.max_load_factor * len(self.bucket_keys):
+                self.__resize(self.__table_size_for(self.count, len(self.bucket_keys)))
+        else:
+            self.bucket_values[bucket][i] = data
+
+    def __insert(self, key: K, data: T, key_hash: int) -> None:
+        """ Append a (key, data) pair known not to be in the table to its bucket. """
+        bucket = key_hash % len(self.bucket_keys)
+        if self.bucket_hashes[bucket] is None:
+            self.bucket_keys[bucket] = [key]
+            self.bucket_values[bucket] = [data]
+            self.bucket_hashes[bucket] = [key_hash]
+        else:
+            self.bucket_keys[bucket].append(key)
+            self.bucket_values[bucket].append(data)
+            self.bucket_hashes[bucket].append(key_hash)
+        self.count += 1
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes an item from our hash table by moving the last entry of its bucket into its place.
+
+        Complexity (Best): O(K) key is first in its bucket where K is the size of the key
+        Complexity (Worst): O(K + N) when every key is in the same bucket
+        """
+        (bucket, i) = self.__find(key, self.hash_key(key))
+        keys = self.bucket_keys[bucket]
+        values = self.bucket_values[bucket]
+        hashes = self.bucket_hashes[bucket]
+        if len(keys) == 1:
+            self.bucket_keys[bucket] = None
+            self.bucket_values[bucket] = None
+            self.bucket_hashes[bucket] = None
+        else:
+            keys[i] = keys[-1]
+            values[i] = values[-1]
+            hashes[i] = hashes[-1]
+            keys.pop()
+            values.pop()
+            hashes.pop()
+        self.count -= 1
+
+        if self.count < self.min_load_factor * len(self.bucket_keys) and len(self.bucket_keys) > self.min_table_size:
+            # Shrink to about half the max load factor, so a few inserts do not grow it straight back
+            self.__resize(max(self.__table_size_for(2 * self.count), self.min_table_size))
+
+    def __table_size_for(self, n: int, larger_than: int = 0) -> int:
+        """ Smallest size along PRIMES (above larger_than) that holds n items within the max load factor. """
+        for prime in self.PRIMES:
+            if prime > larger_than and n <= self.max_load_factor * prime:
+                return prime
+        return max(int(n / self.max_load_factor), larger_than) + 1  # ran out of primes
+
+    def __resize(self, table_size: int) -> None:
+        """ Redistribute all entries over the given number of buckets. The cached hashes are reused, so no key is hashed again. """
+        old_keys = self.bucket_keys
+        old_values = self.bucket_values
+        old_hashes = self.bucket_hashes
+        self.count = 0
+        self.bucket_keys = FixedSizeArray(table_size)
+        self.bucket_values = FixedSizeArray(table_size)
+        self.bucket_hashes = FixedSizeArray(table_size)
+
+        for bucket in range(len(old_keys)):
+            hashes = old_hashes[bucket]
+            if hashes is not None:
+                keys = old_keys[bucket]
+                values = old_values[bucket]
+                for i in range(len(hashes)):
+                    self.__insert(keys[i], values[i], hashes[i])
+
+    def reserve(self, n: int) -> None:
+        """ Resize the table once so that it holds n items without growing again. """
+        table_size = self.__table_size_for(n)
+        if table_size > len(self.bucket_keys):
+            self.__resize(table_size)
+
+    def load_factor(self) -> float:
+        """ Returns the average number of items per bucket. """
+        return self.count / len(self.bucket_keys)
+
+    def probe_statistics(self) -> ProbeStatistics:
+        """ Returns statistics on how many keys a lookup of each stored key compares against. """
+        lengths = []
+        for bucket in range(len(self.bucket_hashes)):
+            if self.bucket_hashes[bucket] is not None:
+                lengths.extend(range(1, len(self.bucket_hashes[bucket]) + 1))
+        return ProbeStatistics.from_lengths(lengths)
+
+    def is_empty(self) -> bool:
+        """ Returns whether the hash table is empty. """
+        return self.count == 0
+
+    def is_full(self) -> bool:
+        """ Returns whether the hash table is full. A chaining table is never full. """
+        return False
+
+    def hash_key(self, key: K) -> int:
+        """ Full hash of the key using the table's hash backend. It does not depend on the table size. """
+        return self.__hash_key(key)
+
+    def hash(self, key: K) -> int:
+        """ Bucket of the key in the current table. """
+        return self.hash_key(key) % len(self.bucket_keys)
+
+    def insert(self, key: K, data: T) -> None:
+        """ Utility method to call our setitem method. """
+        self[key] = data
+
+    def __str__(self) -> str:
+        """ Returns all they key/value pairs in our hash table (in no particular order). """
+        result = ""
+        for bucket in range(len(self.bucket_keys)):
+            if self.bucket_keys[bucket] is not None:
+                for (key, value) in zip(self.bucket_keys[bucket], self.bucket_values[bucket]):
+                    result += "(" + str(key) + "," + str(value) + ")\n"
+        return result
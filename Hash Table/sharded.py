@@ -0,0 +1,189 @@
+"""
+Sharded Hash Table Implementation.
+
+- Defines a thread safe Hash Table partitioning its keys over independent LinearProbeTable shards.
+- Each shard has its own readers-writer lock: lookups in a shard share it, writes to a shard hold it alone.
+- Writes to different shards never wait on each other, and each shard resizes on its own,
+  so a resize only stalls the keys of that one shard.
+"""
+
+import threading
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from hash import LinearProbeTable, HashFunction
+
+
+class ReadWriteLock:
+    """
+    Readers-writer lock. Any number of readers may hold it at once, a writer holds it alone.
+    Waiting writers go first, so a steady stream of readers cannot starve them. It is not reentrant.
+
+    Attributes:
+        - readers: number of threads currently holding the lock to read
+        - writing: whether a thread currently holds the lock to write
+        - waiting_writers: number of threads waiting to write
+    """
+
+    def __init__(self) -> None:
+        self.readers = 0
+        self.writing = False
+        self.waiting_writers = 0
+        self.__condition = threading.Condition(threading.Lock())
+
+    @contextmanager
+    def read(self):
+        """ Holds the lock shared with other readers for the duration of the with block. """
+        with self.__condition:
+            while self.writing or self.waiting_writers > 0:
+                self.__condition.wait()
+            self.readers += 1
+        try:
+            yield
+        finally:
+            with self.__condition:
+                self.readers -= 1
+                if self.readers == 0:
+                    self.__condition.notify_all()
+
+    @contextmanager
+    def write(self):
+        """ Holds the lock alone for the duration of the with block. """
+        with self.__condition:
+            self.waiting_writers += 1
+            while self.writing or self.readers > 0:
+                self.__condition.wait()
+            self.waiting_writers -= 1
+            self.writing = True
+        try:
+            yield
+        finally:
+            with self.__condition:
+                self.writing = False
+                self.__condition.notify_all()
+
+
+class ShardedHashTable[K, T](MutableMapping):
+    """
+    Sharded Hash Table
+
+    Constants:
+        - MIN_SHARDS: smallest valid number of shards
+        - DEFAULT_SHARD_COUNT: default number of shards used in the __init__
+
+    Attributes:
+        - shards: the LinearProbeTable holding each partition of the keys
+        - locks: the ReadWriteLock guarding the shard at the same position
+    """
+    MIN_SHARDS = 1
+
+    DEFAULT_SHARD_COUNT = 16
+
+    def __init__(self, shard_count: int = DEFAULT_SHARD_COUNT,
+                 table_size: int = LinearProbeTable.DEFAULT_TABLE_SIZE,
+                 hash_function: HashFunction = HashFunction.UNIVERSAL,
+                 max_load_factor: float = LinearProbeTable.DEFAULT_MAX_LOAD_FACTOR,
+                 min_load_factor: float = LinearProbeTable.DEFAULT_MIN_LOAD_FACTOR) -> None:
+        shard_count = max(self.MIN_SHARDS, shard_count)
+        self.shards = [LinearProbeTable(table_size, hash_function, max_load_factor=max_load_factor,
+                                        min_load_factor=min_load_factor) for _ in range(shard_count)]
+        self.locks = [ReadWriteLock() for _ in range(shard_count)]
+
+    def shard_index(self, key: K) -> int:
+        """
+        Shard of the key. It is picked with Python's builtin hash, which is cheap and independent of the
+        hash backend the shard probes with. Equal keys share the builtin hash, so they share a shard.
+        """
+        return hash(key) % len(self.shards)
+
+    def __len__(self) -> int:
+        """ Returns number of elements over all shards. Other threads may change it straight after. """
+        count = 0
+        for shard, lock in zip(self.shards, self.locks):
+            with lock.read():
+                count += len(shard)
+        return count
+
+    def __iter__(self):
+        """ Yields the keys of each shard in turn, from a copy taken under that shard's lock. """
+        for shard, lock in zip(self.shards, self.locks):
+            with lock.read():
+                keys = list(shard)
+            yield from keys
+
+    def __contains__(self, key: K) -> bool:
+        """ Returns whether the key is in the table. """
+        index = self.shard_index(key)
+        with self.locks[index].read():
+            return key in self.shards[index]
+
+    def __getitem__(self, key: K) -> T:
+        """ Get the item at a certain key. """
+        index = self.shard_index(key)
+        with self.locks[index].read():
+            return self.shards[index][key]
+
+    def get(self, key: K, default: T = None) -> T:
+        """ Get the item at a certain key, or default if the key is not in the table. """
+        index = self.shard_index(key)
+        with self.locks[index].read():
+            return self.shards[index].get(key, default)
+
+    def __setitem__(self, key: K, data: T) -> None:
+        """ Set an (key, data) pair in the shard of the key. Only that shard may resize. """
+        index = self.shard_index(key)
+        with self.locks[index].write():
+            self.shards[index][key] = data
+
+    def __delitem__(self, key: K) -> None:
+        """ Deletes an item from the shard of the key. Only that shard may resize. """
+        index = self.shard_index(key)
+        with self.locks[index].write():
+            del self.shards[index][key]
+
+    def pop(self, key: K, *default: T) -> T:
+        """ Removes the key and returns its data, or default if given and the key is not in the table. """
+        index = self.shard_index(key)
+        with self.locks[index].write():
+            return self.shards[index].pop(key, *default)
+
+    def setdefault(self, key: K, default: T = None) -> T:
+        """ Returns the data of the key, inserting default first if the key is not in the table, as one atomic step. """
+        index = self.shard_index(key)
+        with self.locks[index].write():
+            shard = self.shards[index]
+            if key in shard:
+                return shard[key]
+            shard[key] = default
+            return default
+
+    def clear(self) -> None:
+        """ Clears every shard back to its initial size, one shard at a time. """
+        for shard, lock in zip(self.shards, self.locks):
+            with lock.write():
+                shard.clear()
+
+    def load_factor(self) -> float:
+        """ Returns the fraction of all slots over all shards holding an item. """
+        count = 0
+        slots = 0
+        for shard, lock in zip(self.shards, self.locks):
+            with lock.read():
+                count += len(shard)
+                slots += len(shard.slot_keys)
+        return count / slots
+
+    def is_empty(self) -> bool:
+        """ Returns whether the hash table is empty. """
+        return len(self) == 0
+
+    def insert(self, key: K, data: T) -> None:
+        """ Utility method to call our setitem method. """
+        self[key] = data
+
+    def __str__(self) -> str:
+        """ Returns all they key/value pairs in our hash table (in no particular order). """
+        result = ""
+        for shard, lock in zip(self.shards, self.locks):
+            with lock.read():
+                result += str(shard)
+        return result
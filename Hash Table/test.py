@@ -1,5 +1,11 @@
+import os
+import random
+import subprocess
+import sys
+import tempfile
 import unittest
-from hash import LinearProbeTable
+from collections.abc import MutableMapping
+from hash import LinearProbeTable, MappedLinearProbeTable, HashFunction, DeletionStrategy, ResizeStrategy
 
 class TestHashTable(unittest.TestCase):
     def setup(self):
@@ -17,7 +23,7 @@ class TestHashTable(unittest.TestCase):
         self.assertFalse(dictionary.is_empty())
 
     def test_is_full(self):
-        dictionary = LinearProbeTable(10)
+        dictionary = LinearProbeTable(10, max_load_factor=1)
         self.assertFalse(dictionary.is_full())
 
         for i in range(10):
@@ -56,6 +62,398 @@ class TestHashTable(unittest.TestCase):
             else:
                 self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
 
+    def test_hash_functions(self):
+        for hash_function in HashFunction:
+            dictionary = LinearProbeTable(5, hash_function)
+            for i in range(50):
+                dictionary[str(i)] = i
+            for i in range(0, 50, 2):
+                del dictionary[str(i)]
+
+            self.assertEqual(len(dictionary), 25)
+            for i in range(1, 50, 2):
+                self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
+
+    def test_hash_is_cached(self):
+        dictionary = LinearProbeTable(3)
+        calls = []
+        hash_key = dictionary.hash_key
+        dictionary.hash_key = lambda key: calls.append(key) or hash_key(key)
+
+        for i in range(20):
+            dictionary[str(i)] = i
+        self.assertEqual(len(calls), 20, "Resizing should not hash any key again")
+        for i in range(10):
+            del dictionary[str(i)]
+        self.assertEqual(len(calls), 30, "Deleting should only hash the deleted key")
+        for i in range(10, 20):
+            self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
+
+    def test_generic_keys(self):
+        for hash_function in HashFunction:
+            for deletion_strategy in DeletionStrategy:
+                dictionary = LinearProbeTable(3, hash_function, deletion_strategy)
+                for i in range(100):
+                    dictionary[i] = i
+                    dictionary[(i, str(i))] = -i
+                    dictionary[str(i).encode()] = str(i)
+                dictionary["1"] = "one"
+                self.assertEqual(len(dictionary), 301)
+                self.assertEqual(dictionary[1], 1, "Integer keys should not be turned into strings")
+                self.assertEqual(dictionary["1"], "one")
+
+                for i in range(0, 100, 2):
+                    del dictionary[i]
+                for i in range(100):
+                    self.assertEqual(dictionary[(i, str(i))], -i)
+                    self.assertEqual(dictionary[str(i).encode()], str(i))
+                    if i % 2 == 0:
+                        self.assertNotIn(i, dictionary)
+                    else:
+                        self.assertIs(type(next(key for key in dictionary if key == i)), int)
+
+    def test_equal_numbers_share_a_key(self):
+        for hash_function in HashFunction:
+            dictionary = LinearProbeTable(5, hash_function)
+            dictionary[1] = "int"
+            dictionary[1.0] = "float"
+            dictionary[True] = "bool"
+            self.assertEqual(len(dictionary), 1)
+            self.assertEqual(dictionary[1], "bool")
+
+    def test_hash_fits_in_64_bits(self):
+        for hash_function in HashFunction:
+            dictionary = LinearProbeTable(5, hash_function)
+            for key in [-1, 2 ** 100, -2 ** 63, (2 ** 64, -1), b"\xff" * 20, "\U0010ffff" * 20, "\ud800", 1.5]:
+                self.assertLess(abs(dictionary.hash_key(key)), 2 ** 63)
+                dictionary[key] = key
+                self.assertEqual(dictionary[key], key)
+
+    def test_none_key(self):
+        dictionary = LinearProbeTable(5)
+        with self.assertRaises(TypeError):
+            dictionary[None] = 1
+        self.assertNotIn(None, dictionary)
+
+    def test_del_tombstone(self):
+        dictionary = LinearProbeTable(5, deletion_strategy=DeletionStrategy.TOMBSTONE, tombstone_fraction=1)
+        for i in range(10):
+            dictionary[str(i)] = i
+
+        for i in range(5):
+            del dictionary[str(i)]
+        self.assertEqual(dictionary.tombstones, 5)
+        self.assertEqual(len(dictionary), 5)
+
+        for i in range(10):
+            if i < 5:
+                with self.assertRaises(KeyError):
+                    _ = dictionary[str(i)]
+            else:
+                self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
+        self.assertNotIn("(0,0)", str(dictionary))
+
+        # Reinserting reuses the tombstones instead of growing the table
+        table_size = len(dictionary.slot_keys)
+        for i in range(5):
+            dictionary[str(i)] = -i
+        self.assertEqual(len(dictionary.slot_keys), table_size)
+        self.assertEqual(dictionary.tombstones, 0)
+        for i in range(5):
+            self.assertEqual(dictionary[str(i)], -i)
+
+    def test_tombstone_compaction(self):
+        dictionary = LinearProbeTable(17, deletion_strategy=DeletionStrategy.TOMBSTONE, tombstone_fraction=0.25)
+        for i in range(10):
+            dictionary[str(i)] = i
+
+        for i in range(4):
+            del dictionary[str(i)]
+        self.assertEqual(dictionary.tombstones, 4)
+
+        del dictionary["4"]  # 5 > 0.25 * 17
+        self.assertEqual(dictionary.tombstones, 0)
+        self.assertEqual(len(dictionary), 5)
+        for i in range(5, 10):
+            self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
+
+    def test_load_factor_growth(self):
+        dictionary = LinearProbeTable(7, max_load_factor=0.5)
+        for i in range(100):
+            dictionary[str(i)] = i
+            self.assertLessEqual(dictionary.load_factor(), 0.5)
+            self.assertIn(len(dictionary.slot_keys), LinearProbeTable.PRIMES)
+
+        for i in range(100):
+            self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
+
+    def test_load_factor_shrink(self):
+        for deletion_strategy in DeletionStrategy:
+            dictionary = LinearProbeTable(7, deletion_strategy=deletion_strategy, min_load_factor=0.25)
+            for i in range(200):
+                dictionary[str(i)] = i
+            grown_size = len(dictionary.slot_keys)
+
+            for i in range(190):
+                del dictionary[str(i)]
+            self.assertLess(len(dictionary.slot_keys), grown_size)
+            self.assertGreaterEqual(len(dictionary.slot_keys), 7)
+            for i in range(190, 200):
+                self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
+
+    def test_load_factor_invalid(self):
+        with self.assertRaises(ValueError):
+            LinearProbeTable(max_load_factor=1.5)
+        with self.assertRaises(ValueError):
+            LinearProbeTable(max_load_factor=0.5, min_load_factor=0.5)
+
+    def test_reserve(self):
+        dictionary = LinearProbeTable(3)
+        dictionary["a"] = 0
+        dictionary.reserve(1000)
+        table_size = len(dictionary.slot_keys)
+        self.assertGreaterEqual(table_size * dictionary.max_load_factor, 1000)
+
+        for i in range(999):
+            dictionary[str(i)] = i
+        self.assertEqual(len(dictionary.slot_keys), table_size, "Table should not grow after reserve")
+        self.assertEqual(dictionary["a"], 0)
+
+        dictionary.reserve(10)  # never shrinks
+        self.assertEqual(len(dictionary.slot_keys), table_size)
+
+    def test_mapping_protocol(self):
+        dictionary = LinearProbeTable(5)
+        self.assertIsInstance(dictionary, MutableMapping)
+        expected = {str(i): i for i in range(20)}
+        for key, value in expected.items():
+            dictionary[key] = value
+
+        self.assertEqual(sorted(dictionary), sorted(expected))
+        self.assertEqual(sorted(dictionary.keys()), sorted(expected.keys()))
+        self.assertEqual(sorted(dictionary.values()), sorted(expected.values()))
+        self.assertEqual(sorted(dictionary.items()), sorted(expected.items()))
+        self.assertEqual(dictionary, expected)
+        self.assertIn("3", dictionary)
+        self.assertNotIn("missing", dictionary)
+        self.assertIn(("3", 3), dictionary.items())
+
+    def test_get_pop(self):
+        for deletion_strategy in DeletionStrategy:
+            dictionary = LinearProbeTable(5, deletion_strategy=deletion_strategy)
+            for i in range(10):
+                dictionary[str(i)] = i
+
+            self.assertEqual(dictionary.get("3"), 3)
+            self.assertIsNone(dictionary.get("missing"))
+            self.assertEqual(dictionary.get("missing", -1), -1)
+
+            self.assertEqual(dictionary.pop("3"), 3)
+            self.assertNotIn("3", dictionary)
+            self.assertEqual(len(dictionary), 9)
+            self.assertEqual(dictionary.pop("3", -1), -1)
+            with self.assertRaises(KeyError):
+                dictionary.pop("3")
+
+            self.assertEqual(dictionary.setdefault("3", 30), 30)
+            self.assertEqual(dictionary.setdefault("3", 300), 30)
+            (key, value) = dictionary.popitem()
+            self.assertNotIn(key, dictionary)
+            self.assertEqual(len(dictionary), 9)
+
+    def test_update(self):
+        dictionary = LinearProbeTable(3)
+        dictionary.update({str(i): i for i in range(100)})
+        self.assertEqual(len(dictionary), 100)
+        table_size = len(dictionary.slot_keys)
+
+        dictionary.update([(str(i), -i) for i in range(50)], extra=1)
+        self.assertEqual(len(dictionary), 101)
+        self.assertEqual(dictionary["10"], -10)
+        self.assertEqual(dictionary["60"], 60)
+        self.assertEqual(dictionary["extra"], 1)
+
+        other = LinearProbeTable(3)
+        other.update(dictionary)
+        self.assertEqual(other, dictionary)
+        self.assertGreaterEqual(len(dictionary.slot_keys), table_size)
+
+    def test_clear(self):
+        dictionary = LinearProbeTable(5)
+        for i in range(100):
+            dictionary[str(i)] = i
+        dictionary.clear()
+        self.assertTrue(dictionary.is_empty())
+        self.assertEqual(len(dictionary.slot_keys), 5)
+        self.assertEqual(list(dictionary), [])
+
+    def test_iter_changed_size(self):
+        dictionary = LinearProbeTable(5)
+        for i in range(3):
+            dictionary[str(i)] = i
+        with self.assertRaises(RuntimeError):
+            for key in dictionary:
+                dictionary[key + "!"] = 0
+
+    def test_incremental_rehash(self):
+        dictionary = LinearProbeTable(17, resize_strategy=ResizeStrategy.INCREMENTAL, rehash_step=2)
+        for i in range(11):
+            dictionary[i] = i
+        self.assertIsNone(dictionary.rehash_keys)
+
+        dictionary[11] = 11  # passes the max load factor
+        self.assertIsNotNone(dictionary.rehash_keys, "Growing should start a migration")
+        self.assertEqual(len(dictionary.rehash_keys), 17)
+        self.assertGreater(dictionary.rehash_count, 0)
+        self.assertEqual(len(dictionary), 12)
+
+        # Lookups, updates and iteration see both arrays, and never migrate anything
+        position = dictionary.rehash_position
+        for i in range(12):
+            self.assertIn(i, dictionary)
+            self.assertEqual(dictionary[i], i)
+            dictionary[i] = -i
+        self.assertEqual(dictionary.rehash_position, position)
+        self.assertEqual(sorted(dictionary), list(range(12)))
+        self.assertEqual(sorted(dictionary.values()), list(range(-11, 1)))
+        self.assertEqual(dictionary.get(12, "missing"), "missing")
+
+        # Each insert or delete migrates at most rehash_step old slots
+        del dictionary[0]
+        self.assertLessEqual(dictionary.rehash_position, position + 2)
+        while dictionary.rehash_keys is not None:
+            position = dictionary.rehash_position
+            dictionary[str(position)] = position
+            self.assertLessEqual(dictionary.rehash_position, position + 2)
+        self.assertEqual(dictionary.rehash_count, 0)
+        self.assertEqual(dictionary.count, len(dictionary))
+        for i in range(1, 12):
+            self.assertEqual(dictionary[i], -i)
+
+    def test_incremental_rehash_random(self):
+        """ Compares incrementally resizing tables against a dict under a random mix of inserts and deletes. """
+        rng = random.Random(7)
+        for deletion_strategy in DeletionStrategy:
+            dictionary = LinearProbeTable(3, deletion_strategy=deletion_strategy,
+                                          resize_strategy=ResizeStrategy.INCREMENTAL, rehash_step=1)
+            expected = {}
+            migrations = 0
+            for _ in range(5000):
+                key = rng.randrange(600)
+                if key in expected and rng.random() < 0.4:
+                    self.assertEqual(dictionary.pop(key), expected.pop(key))
+                else:
+                    dictionary[key] = rng.random()
+                    expected[key] = dictionary[key]
+                migrations += dictionary.rehash_keys is not None
+                self.assertEqual(len(dictionary), len(expected))
+
+            self.assertGreater(migrations, 0)
+            self.assertEqual(dict(dictionary.items()), expected)
+            self.assertEqual(dictionary.probe_statistics().count, len(expected))
+            dictionary.clear()
+            self.assertTrue(dictionary.is_empty())
+            self.assertIsNone(dictionary.rehash_keys)
+
+    def test_incremental_rehash_full_table(self):
+        dictionary = LinearProbeTable(5, max_load_factor=1, resize_strategy=ResizeStrategy.INCREMENTAL)
+        for i in range(5):
+            dictionary[i] = i
+        for i in range(5):
+            dictionary[i] = -i  # updating a full table must not store the key twice
+        self.assertEqual(len(dictionary), 5)
+        self.assertEqual(sorted(dictionary.items()), [(i, -i) for i in range(5)])
+
+    def test_snapshot(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.snapshot")
+            for hash_function in [HashFunction.UNIVERSAL, HashFunction.BYTES]:
+                for deletion_strategy in DeletionStrategy:
+                    dictionary = LinearProbeTable(3, hash_function, deletion_strategy, min_load_factor=0)
+                    for i in range(300):
+                        dictionary[i] = [i]
+                        dictionary[("id", i)] = str(i)
+                    for i in range(0, 300, 3):
+                        del dictionary[i]
+                    dictionary.save(path)
+
+                    loaded = LinearProbeTable.load(path, mmap=False)
+                    self.assertIsInstance(loaded, LinearProbeTable)
+                    self.assertEqual(dict(loaded.items()), dict(dictionary.items()))
+                    self.assertEqual(loaded.tombstones, 0)
+                    loaded[-1] = "writable"
+                    self.assertEqual(len(loaded), len(dictionary) + 1)
+
+                    with LinearProbeTable.load(path) as mapped:
+                        self.assertIsInstance(mapped, MappedLinearProbeTable)
+                        self.assertEqual(len(mapped), len(dictionary))
+                        self.assertEqual(mapped[1], [1])
+                        self.assertEqual(mapped[("id", 0)], "0")
+                        self.assertNotIn(0, mapped)
+                        self.assertEqual(mapped.get(0, "missing"), "missing")
+                        with self.assertRaises(KeyError):
+                            _ = mapped["missing"]
+                        self.assertEqual(len(mapped.decoded), 2, "Only the records looked up should be deserialised")
+                        self.assertEqual(dict(mapped.items()), dict(dictionary.items()))
+                        self.assertEqual(dict(mapped.copy().items()), dict(dictionary.items()))
+
+    def test_snapshot_during_incremental_rehash(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.snapshot")
+            dictionary = LinearProbeTable(17, resize_strategy=ResizeStrategy.INCREMENTAL, rehash_step=1)
+            for i in range(12):
+                dictionary[str(i)] = i
+            self.assertIsNotNone(dictionary.rehash_keys)
+            dictionary.save(path)
+            with LinearProbeTable.load(path) as mapped:
+                self.assertEqual(dict(mapped.items()), {str(i): i for i in range(12)})
+
+    def test_snapshot_errors(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.snapshot")
+            with self.assertRaises(ValueError):
+                LinearProbeTable(hash_function=HashFunction.BUILTIN).save(path)
+            for hash_function in [HashFunction.UNIVERSAL, HashFunction.BYTES]:
+                dictionary = LinearProbeTable(hash_function=hash_function)
+                dictionary[("id", frozenset({"a0"}))] = 1
+                with self.assertRaises(ValueError, msg="Keys hashed with the salted builtin hash should not be saved"):
+                    dictionary.save(path)
+                self.assertFalse(os.path.exists(path))
+            with open(path, "wb") as file:
+                file.write(b"not a snapshot")
+            for mmap in [True, False]:
+                with self.assertRaises(ValueError):
+                    LinearProbeTable.load(path, mmap)
+
+    def test_snapshot_across_processes(self):
+        """ A snapshot saved under one hash seed should answer lookups in a process with another seed. """
+        keys = "[str(i) for i in range(50)] + list(range(50)) + [(i, b'id', 1.5, None) for i in range(50)]"
+        save = ("from hash import LinearProbeTable, HashFunction\n"
+                "for hash_function in [HashFunction.UNIVERSAL, HashFunction.BYTES]:\n"
+                "    table = LinearProbeTable(hash_function=hash_function)\n"
+                "    for key in " + keys + ": table[key] = repr(key)\n"
+                "    table.save(sys.argv[1] + str(hash_function.value))\n"
+                "    try:\n"
+                "        table[frozenset({'a0'})] = 0\n"
+                "        table.save(sys.argv[1] + 'salted')\n"
+                "    except ValueError:\n"
+                "        pass\n")
+        load = ("from hash import LinearProbeTable, HashFunction\n"
+                "for hash_function in [HashFunction.UNIVERSAL, HashFunction.BYTES]:\n"
+                "    for mmap in [True, False]:\n"
+                "        table = LinearProbeTable.load(sys.argv[1] + str(hash_function.value), mmap)\n"
+                "        assert len(table) == 150\n"
+                "        for key in " + keys + ": assert key in table and table[key] == repr(key), key\n"
+                "        if mmap: table.close()\n")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.snapshot")
+            for (seed, script) in [("1", save), ("2", load)]:
+                result = subprocess.run([sys.executable, "-c", "import sys\n" + script, path],
+                                        cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True,
+                                        env=dict(os.environ, PYTHONHASHSEED=seed))
+                self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertFalse(os.path.exists(path + "salted"))
+
     def test_str(self):
         dictionary = LinearProbeTable(5)
         self.assertEqual(str(dictionary), "", "Dictionary should be empty")
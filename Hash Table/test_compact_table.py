@@ -0,0 +1,125 @@
+import random
+import unittest
+from hash import HashFunction
+from compact_table import CompactProbeTable
+
+
+class TestCompactTable(unittest.TestCase):
+    def test_init(self):
+        dictionary = CompactProbeTable()
+        self.assertEqual(len(dictionary), 0, "Dictionary should be empty")
+        self.assertTrue(dictionary.is_empty())
+
+    def test_hash(self):
+        dictionary = CompactProbeTable(5)
+        for i in range(100):
+            dictionary[str(i)] = i
+        self.assertEqual(len(dictionary), 100)
+        self.assertLessEqual(dictionary.load_factor(), dictionary.max_load_factor)
+
+        for i in range(100):
+            self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
+        with self.assertRaises(KeyError):
+            _ = dictionary["missing"]
+
+    def test_insertion_order(self):
+        dictionary = CompactProbeTable(3)
+        keys = [str(i) for i in range(50, 0, -1)]
+        for key in keys:
+            dictionary[key] = key
+        dictionary["50"] = "updated"  # updating keeps the original position
+        self.assertEqual(list(dictionary), keys)
+
+        for key in keys[::2]:
+            del dictionary[key]
+        self.assertEqual(list(dictionary), keys[1::2])
+        self.assertEqual(dictionary["49"], "49")
+
+    def test_iter_changed_size(self):
+        dictionary = CompactProbeTable()
+        for i in range(100):
+            dictionary[i] = i
+        with self.assertRaises(RuntimeError):
+            for key in dictionary:
+                if key == 0:
+                    for i in range(1, 95):
+                        del dictionary[i]
+        with self.assertRaises(RuntimeError):
+            for key in dictionary:
+                dictionary[-1] = -1
+
+    def test_index_is_compact(self):
+        self.assertEqual(CompactProbeTable(17).index.typecode, 'b')
+        self.assertEqual(CompactProbeTable(1103).index.typecode, 'h')
+        self.assertEqual(CompactProbeTable(108631).index.typecode, 'i')
+
+    def test_del(self):
+        dictionary = CompactProbeTable(5)
+        for i in range(10):
+            dictionary[str(i)] = i
+
+        for i in range(5):
+            del dictionary[str(i)]
+        self.assertEqual(len(dictionary), 5)
+
+        for i in range(10):
+            if i < 5:
+                with self.assertRaises(KeyError):
+                    _ = dictionary[str(i)]
+            else:
+                self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
+        with self.assertRaises(KeyError):
+            del dictionary["0"]
+
+    def test_churn_compacts(self):
+        dictionary = CompactProbeTable(17)
+        for i in range(10):
+            dictionary[str(i)] = i
+        for _ in range(100):
+            del dictionary["0"]
+            dictionary["0"] = 0
+        self.assertEqual(len(dictionary.index), 17, "Churn should compact instead of growing")
+        self.assertEqual(len(dictionary), 10)
+        self.assertEqual(list(dictionary), [str(i) for i in range(1, 10)] + ["0"])
+
+    def test_reserve(self):
+        dictionary = CompactProbeTable(3)
+        dictionary.reserve(1000)
+        table_size = len(dictionary.index)
+        for i in range(1000):
+            dictionary[str(i)] = i
+        self.assertEqual(len(dictionary.index), table_size, "Table should not grow after reserve")
+
+    def test_random_operations(self):
+        """ Compares the table against a dict under a random mix of inserts and deletes. """
+        rng = random.Random(7)
+        for hash_function in HashFunction:
+            dictionary = CompactProbeTable(3, hash_function)
+            expected = {}
+            for _ in range(2000):
+                key = str(rng.randrange(300))
+                if key in expected and rng.random() < 0.5:
+                    del dictionary[key]
+                    del expected[key]
+                else:
+                    dictionary[key] = rng.random()
+                    expected[key] = dictionary[key]
+
+            self.assertEqual(len(dictionary), len(expected))
+            self.assertEqual(list(dictionary), list(expected))
+            self.assertEqual(dictionary.probe_statistics().count, len(expected))
+            for key, value in expected.items():
+                self.assertEqual(dictionary[key], value)
+
+    def test_str(self):
+        dictionary = CompactProbeTable(5)
+        self.assertEqual(str(dictionary), "", "Dictionary should be empty")
+
+        for i in range(5):
+            dictionary[str(i)] = i
+        self.assertEqual(str(dictionary), "".join("(" + str(i) + "," + str(i) + ")\n" for i in range(5)))
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestCompactTable)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,163 @@
+import random
+import unittest
+from hash import LinearProbeTable, HashFunction
+from open_addressing import RobinHoodTable, QuadraticProbeTable, DoubleHashTable
+
+
+class TestOpenAddressing(unittest.TestCase):
+    TABLE_TYPES = [RobinHoodTable, QuadraticProbeTable, DoubleHashTable]
+
+    def test_init(self):
+        for table_type in self.TABLE_TYPES:
+            dictionary = table_type()
+            self.assertEqual(len(dictionary), 0, "Dictionary should be empty")
+            self.assertTrue(dictionary.is_empty())
+
+    def test_hash(self):
+        for table_type in self.TABLE_TYPES:
+            dictionary = table_type(5)
+            for i in range(100):
+                dictionary[str(i)] = i
+            self.assertEqual(len(dictionary), 100)
+            self.assertLessEqual(dictionary.load_factor(), dictionary.max_load_factor)
+
+            for i in range(100):
+                self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
+            with self.assertRaises(KeyError):
+                _ = dictionary["missing"]
+
+    def test_update(self):
+        for table_type in self.TABLE_TYPES:
+            dictionary = table_type()
+            for i in range(20):
+                dictionary[str(i)] = i
+            for i in range(20):
+                dictionary[str(i)] = -i
+            self.assertEqual(len(dictionary), 20)
+            for i in range(20):
+                self.assertEqual(dictionary[str(i)], -i)
+
+    def test_del(self):
+        for table_type in self.TABLE_TYPES:
+            dictionary = table_type(5)
+            for i in range(50):
+                dictionary[str(i)] = i
+
+            for i in range(25):
+                del dictionary[str(i)]
+            self.assertEqual(len(dictionary), 25)
+
+            for i in range(50):
+                if i < 25:
+                    with self.assertRaises(KeyError):
+                        _ = dictionary[str(i)]
+                else:
+                    self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
+            with self.assertRaises(KeyError):
+                del dictionary["0"]
+
+    def test_contains_and_iter(self):
+        for table_type in self.TABLE_TYPES:
+            dictionary = table_type(5)
+            for i in range(50):
+                dictionary[str(i)] = i
+            for i in range(0, 50, 2):
+                del dictionary[str(i)]
+
+            self.assertNotIn("0", dictionary)
+            self.assertNotIn("missing", dictionary)
+            self.assertIn("1", dictionary)
+            self.assertEqual(sorted(dictionary, key=int), [str(i) for i in range(1, 50, 2)])
+            with self.assertRaises(RuntimeError):
+                for key in dictionary:
+                    del dictionary[key]
+
+    def test_tombstone_fraction(self):
+        for table_type in [QuadraticProbeTable, DoubleHashTable]:
+            dictionary = table_type(1103, tombstone_fraction=0.5)
+            for i in range(400):
+                dictionary[i] = i
+            for i in range(400):
+                del dictionary[i]
+            self.assertEqual(dictionary.tombstones, 400, "Tombstones below the fraction should be kept")
+            self.assertEqual(table_type(1103).tombstone_fraction, table_type.DEFAULT_TOMBSTONE_FRACTION)
+
+    def test_generic_keys(self):
+        for table_type in self.TABLE_TYPES:
+            for hash_function in HashFunction:
+                dictionary = table_type(3, hash_function)
+                for i in range(100):
+                    dictionary[i] = i
+                    dictionary[(i, b"id")] = -i
+                dictionary["1"] = "one"
+                self.assertEqual(len(dictionary), 201)
+                for i in range(0, 100, 2):
+                    del dictionary[i]
+                for i in range(100):
+                    self.assertEqual(dictionary[(i, b"id")], -i)
+                    if i % 2 == 1:
+                        self.assertEqual(dictionary[i], i)
+                self.assertEqual(dictionary["1"], "one")
+                with self.assertRaises(TypeError):
+                    dictionary[None] = 1
+
+    def test_random_operations(self):
+        """ Compares every table against a dict under a random mix of inserts and deletes. """
+        rng = random.Random(7)
+        for table_type in self.TABLE_TYPES:
+            for hash_function in HashFunction:
+                dictionary = table_type(3, hash_function)
+                expected = {}
+                for _ in range(2000):
+                    key = str(rng.randrange(300))
+                    if key in expected and rng.random() < 0.5:
+                        del dictionary[key]
+                        del expected[key]
+                    else:
+                        dictionary[key] = rng.random()
+                        expected[key] = dictionary[key]
+
+                self.assertEqual(len(dictionary), len(expected))
+                for key, value in expected.items():
+                    self.assertEqual(dictionary[key], value)
+
+    def test_probe_statistics(self):
+        for table_type in self.TABLE_TYPES:
+            dictionary = table_type()
+            self.assertEqual(dictionary.probe_statistics().count, 0)
+            for i in range(200):
+                dictionary[str(i)] = i
+
+            statistics = dictionary.probe_statistics()
+            self.assertEqual(statistics.count, 200)
+            self.assertGreaterEqual(statistics.mean, 1)
+            self.assertGreaterEqual(statistics.maximum, statistics.mean)
+
+    def test_robin_hood_variance(self):
+        """ Robin Hood and linear probing take the same total number of probes, Robin Hood spreads them more evenly. """
+        linear = LinearProbeTable(1103, HashFunction.BYTES, max_load_factor=0.9)
+        robin_hood = RobinHoodTable(1103, HashFunction.BYTES, max_load_factor=0.9)
+        for i in range(900):
+            linear[str(i)] = i
+            robin_hood[str(i)] = i
+
+        linear_statistics = linear.probe_statistics()
+        robin_hood_statistics = robin_hood.probe_statistics()
+        self.assertAlmostEqual(linear_statistics.mean, robin_hood_statistics.mean)
+        self.assertLess(robin_hood_statistics.variance, linear_statistics.variance)
+        self.assertLessEqual(robin_hood_statistics.maximum, linear_statistics.maximum)
+
+    def test_str(self):
+        for table_type in self.TABLE_TYPES:
+            dictionary = table_type(5)
+            self.assertEqual(str(dictionary), "", "Dictionary should be empty")
+
+            for i in range(5):
+                dictionary[str(i)] = i
+            for i in range(5):
+                self.assertIn("(" + str(i) + "," + str(i) + ")", str(dictionary))
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestOpenAddressing)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,131 @@
+import random
+import unittest
+from hash import HashFunction
+from separate_chaining import SeparateChainingTable
+
+
+class TestSeparateChaining(unittest.TestCase):
+    def test_init(self):
+        dictionary = SeparateChainingTable()
+        self.assertEqual(len(dictionary), 0, "Dictionary should be empty")
+        self.assertTrue(dictionary.is_empty())
+        self.assertFalse(dictionary.is_full())
+
+    def test_hash(self):
+        dictionary = SeparateChainingTable(5)
+        for i in range(100):
+            dictionary[str(i)] = i
+        self.assertEqual(len(dictionary), 100)
+        self.assertLessEqual(dictionary.load_factor(), dictionary.max_load_factor)
+
+        for i in range(100):
+            self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
+        with self.assertRaises(KeyError):
+            _ = dictionary["missing"]
+
+    def test_contains_and_iter(self):
+        dictionary = SeparateChainingTable(5)
+        for i in range(50):
+            dictionary[str(i)] = i
+        for i in range(0, 50, 2):
+            del dictionary[str(i)]
+
+        self.assertNotIn("0", dictionary)
+        self.assertNotIn("missing", dictionary)
+        self.assertIn("1", dictionary)
+        self.assertEqual(sorted(dictionary, key=int), [str(i) for i in range(1, 50, 2)])
+        with self.assertRaises(RuntimeError):
+            for key in dictionary:
+                del dictionary[key]
+
+    def test_load_factor_above_one(self):
+        dictionary = SeparateChainingTable(7, max_load_factor=4)
+        for i in range(28):
+            dictionary[str(i)] = i
+        self.assertEqual(len(dictionary.bucket_keys), 7, "Table should not grow below its max load factor")
+        self.assertEqual(dictionary.load_factor(), 4)
+        for i in range(28):
+            self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
+
+    def test_update(self):
+        dictionary = SeparateChainingTable(3)
+        for i in range(20):
+            dictionary[str(i)] = i
+        for i in range(20):
+            dictionary[str(i)] = -i
+        self.assertEqual(len(dictionary), 20)
+        for i in range(20):
+            self.assertEqual(dictionary[str(i)], -i)
+
+    def test_del(self):
+        dictionary = SeparateChainingTable(5)
+        for i in range(10):
+            dictionary[str(i)] = i
+
+        for i in range(5):
+            del dictionary[str(i)]
+        self.assertEqual(len(dictionary), 5)
+
+        for i in range(10):
+            if i < 5:
+                with self.assertRaises(KeyError):
+                    _ = dictionary[str(i)]
+            else:
+                self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
+        with self.assertRaises(KeyError):
+            del dictionary["0"]
+
+    def test_shrink(self):
+        dictionary = SeparateChainingTable(7, min_load_factor=0.25)
+        for i in range(500):
+            dictionary[str(i)] = i
+        grown_size = len(dictionary.bucket_keys)
+
+        for i in range(490):
+            del dictionary[str(i)]
+        self.assertLess(len(dictionary.bucket_keys), grown_size)
+        self.assertGreaterEqual(len(dictionary.bucket_keys), 7)
+        for i in range(490, 500):
+            self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
+
+    def test_reserve(self):
+        dictionary = SeparateChainingTable(3)
+        dictionary.reserve(1000)
+        table_size = len(dictionary.bucket_keys)
+        for i in range(1000):
+            dictionary[str(i)] = i
+        self.assertEqual(len(dictionary.bucket_keys), table_size, "Table should not grow after reserve")
+
+    def test_random_operations(self):
+        """ Compares the table against a dict under a random mix of inserts and deletes. """
+        rng = random.Random(7)
+        for hash_function in HashFunction:
+            dictionary = SeparateChainingTable(3, hash_function)
+            expected = {}
+            for _ in range(2000):
+                key = str(rng.randrange(300))
+                if key in expected and rng.random() < 0.5:
+                    del dictionary[key]
+                    del expected[key]
+                else:
+                    dictionary[key] = rng.random()
+                    expected[key] = dictionary[key]
+
+            self.assertEqual(len(dictionary), len(expected))
+            self.assertEqual(dictionary.probe_statistics().count, len(expected))
+            for key, value in expected.items():
+                self.assertEqual(dictionary[key], value)
+
+    def test_str(self):
+        dictionary = SeparateChainingTable(5)
+        self.assertEqual(str(dictionary), "", "Dictionary should be empty")
+
+        for i in range(5):
+            dictionary[str(i)] = i
+        for i in range(5):
+            self.assertIn("(" + str(i) + "," + str(i) + ")", str(dictionary))
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestSeparateChaining)
+    unittest.TextTestRunner(verbosity=2).run(suite)
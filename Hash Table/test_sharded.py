@@ -0,0 +1,130 @@
+import sys
+import threading
+import unittest
+from collections.abc import MutableMapping
+from hash import HashFunction
+from sharded import ShardedHashTable, ReadWriteLock
+
+
+class TestShardedHashTable(unittest.TestCase):
+    def test_init(self):
+        dictionary = ShardedHashTable(4)
+        self.assertIsInstance(dictionary, MutableMapping)
+        self.assertEqual(len(dictionary.shards), 4)
+        self.assertEqual(len(dictionary), 0, "Dictionary should be empty")
+        self.assertTrue(dictionary.is_empty())
+
+    def test_mapping_protocol(self):
+        for hash_function in HashFunction:
+            dictionary = ShardedHashTable(4, 5, hash_function)
+            for i in range(200):
+                dictionary[i] = i
+                dictionary[str(i)] = -i
+            self.assertEqual(len(dictionary), 400)
+            self.assertEqual(sorted(key for key in dictionary if isinstance(key, int)), list(range(200)))
+
+            for i in range(100):
+                del dictionary[i]
+            self.assertEqual(dictionary.pop("0"), 0)
+            self.assertEqual(dictionary.pop("0", None), None)
+            self.assertEqual(len(dictionary), 299)
+            for i in range(200):
+                self.assertEqual(dictionary.get(i), None if i < 100 else i)
+            self.assertNotIn("0", dictionary)
+            with self.assertRaises(KeyError):
+                _ = dictionary[0]
+
+            self.assertEqual(dictionary.setdefault("new", 1), 1)
+            self.assertEqual(dictionary.setdefault("new", 2), 1)
+            dictionary.clear()
+            self.assertTrue(dictionary.is_empty())
+
+    def test_shards_resize_independently(self):
+        dictionary = ShardedHashTable(4, 5)
+        keys = [i for i in range(1000) if dictionary.shard_index(i) == 0][:100]
+        for key in keys:
+            dictionary[key] = key
+        self.assertGreater(len(dictionary.shards[0].slot_keys), 5)
+        for shard in dictionary.shards[1:]:
+            self.assertEqual(len(shard.slot_keys), 5, "Only the shard holding the keys should grow")
+
+    def test_read_write_lock(self):
+        lock = ReadWriteLock()
+        with lock.read():
+            with lock.read():
+                self.assertEqual(lock.readers, 2, "Readers should not block one another")
+        self.assertEqual(lock.readers, 0)
+
+        entered = threading.Event()
+
+        def write():
+            with lock.write():
+                entered.set()
+
+        with lock.read():
+            writer = threading.Thread(target=write)
+            writer.start()
+            self.assertFalse(entered.wait(0.05), "A writer should wait for the readers")
+        writer.join()
+        self.assertTrue(entered.is_set())
+
+    def test_stress(self):
+        """ Writers insert, update and delete their own keys while readers look up every key. No write may be lost. """
+        dictionary = ShardedHashTable(8, 3)
+        threads = 8
+        per_thread = 2000
+        errors = []
+
+        def write(thread: int):
+            try:
+                for i in range(per_thread):
+                    key = thread * per_thread + i
+                    dictionary[key] = -key
+                    dictionary[key] = key
+                    if i % 3 == 0:
+                        del dictionary[key]
+            except Exception as error:
+                errors.append(error)
+
+        def read():
+            try:
+                for _ in range(2):
+                    for key in range(threads * per_thread):
+                        value = dictionary.get(key)
+                        if value is not None and abs(value) != key:
+                            errors.append(AssertionError("Read a torn value for key " + str(key)))
+            except Exception as error:
+                errors.append(error)
+
+        workers = [threading.Thread(target=write, args=(thread,)) for thread in range(threads)]
+        workers += [threading.Thread(target=read) for _ in range(4)]
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)  # switch threads often, so writes interleave inside the resizes
+        try:
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        self.assertEqual(errors, [])
+        expected = {key for key in range(threads * per_thread) if key % per_thread % 3 != 0}
+        self.assertEqual(len(dictionary), len(expected))
+        self.assertEqual(set(dictionary), expected)
+        for key in expected:
+            self.assertEqual(dictionary[key], key)
+
+    def test_str(self):
+        dictionary = ShardedHashTable(3)
+        self.assertEqual(str(dictionary), "", "Dictionary should be empty")
+
+        for i in range(5):
+            dictionary[str(i)] = i
+        for i in range(5):
+            self.assertIn("(" + str(i) + "," + str(i) + ")", str(dictionary))
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestShardedHashTable)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -21,12 +21,12 @@ class FixedSizeArray[T]:
         """ Returns the length of the array. """
         return len(self.array)
 
-    def __getitem__(self, index: int) -> T:
-        """ Returns the object in position index. """
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        """ Returns the object in position index, or a list of the objects in a slice. """
         return self.array[index]
 
-    def __setitem__(self, index: int, value: T) -> None:
-        """ Sets the object in position index to value. """
+    def __setitem__(self, index: int | slice, value: T | list[T]) -> None:
+        """ Sets the object in position index to value, or the objects in a slice to a list of the same length. """
         self.array[index] = value
 
     def sort(self) -> None:
@@ -1,57 +1,199 @@
 """ Heap Implementation. """
 
 from fixed_size_array import FixedSizeArray
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, MutableSequence, Sequence
 from abc import ABC, abstractmethod
 
 
 class Heap[T](ABC):
+    """
+    Array based d-ary heap, 1-indexed so the parent of k is (k - 2) // d + 1 and its children are d * (k - 1) + 2
+    to d * k + 1. With d = 2 that is the binary heap layout: parent k // 2 and children 2 * k and 2 * k + 1.
+    A larger d makes the heap shallower, so adding rises through fewer levels, while sinking compares d children per level.
+
+    The arrays grow geometrically when an element is added to a full heap, up to an optional hard cap.
+
+    Constants:
+        - MIN_CAPACITY: smallest valid capacity
+        - MIN_ARITY: smallest valid number of children per element
+        - DEFAULT_ARITY: default number of children per element used in the __init__
+        - DEFAULT_GROWTH_FACTOR: factor the capacity is multiplied by when the heap grows
+
+    Attributes:
+        - length: number of elements in the heap
+        - d: number of children of each element
+        - growth_factor: factor the capacity is multiplied by when an element is added to a full heap
+        - max_capacity: number of elements the heap never grows past, add returns False there (None never stops growing)
+        - the_array: array of the elements, position 0 is unused
+        - key: function giving the priority of an element (None compares the elements themselves)
+        - priorities: list of the priority of the element at the same position, computed once when the element
+          is added. It is the_array itself when there is no key.
+        - sequences: list of the order in which the element at the same position was added, so equal priorities
+          come out first in first out. It is None when there is no key, as equal elements need no order.
+        - sequence: number of elements added so far, the sequence of the next one
+
+    The priorities and sequences are plain lists rather than FixedSizeArrays: they move alongside every element a
+    rise or sink moves, and list indexing runs in C, so ordering by a key costs no more than wrapping each element
+    in a (priority, sequence, element) tuple.
+    """
     MIN_CAPACITY = 1
+    MIN_ARITY = 2
+
+    DEFAULT_ARITY = 2
+    DEFAULT_GROWTH_FACTOR = 2
 
-    def __init__(self, max_size: int = MIN_CAPACITY) -> None:
+    def __init__(self, max_size: int = MIN_CAPACITY, key: Callable[[T], object] = None, d: int = DEFAULT_ARITY,
+                 max_capacity: int = None, growth_factor: float = DEFAULT_GROWTH_FACTOR) -> None:
+        """ Creates an empty heap starting with room for max_size elements. """
+        if d < self.MIN_ARITY:
+            raise ValueError("The arity should be at least " + str(self.MIN_ARITY) + ".")
+        if growth_factor <= 1:
+            raise ValueError("The growth factor should be larger than 1.")
+        if max_capacity is not None and max_capacity < max(self.MIN_CAPACITY, max_size):
+            raise ValueError("The max capacity should be at least max_size.")
         self.length = 0
+        self.key = key
+        self.d = d
+        self.max_capacity = max_capacity
+        self.growth_factor = growth_factor
+        self.sequence = 0
+        self.allocate(max_size)
+
+    def allocate(self, max_size: int) -> None:
+        """ Replaces the storage with empty arrays holding max_size elements. """
         # Add +1 in the array for readability
         self.the_array = FixedSizeArray(max(self.MIN_CAPACITY, max_size) + 1)
+        self.priorities = self.the_array if self.key is None else [None] * len(self.the_array)
+        self.sequences = None if self.key is None else [None] * len(self.the_array)
 
     def __len__(self) -> int:
         return self.length
 
     def is_full(self) -> bool:
-        return self.length + 1 == len(self.the_array)
+        """ Returns whether the heap reached its max capacity, so no element can be added. """
+        return self.max_capacity is not None and self.length >= self.max_capacity
+
+    def capacity(self) -> int:
+        """ Returns the number of elements the heap holds before it has to grow. """
+        return len(self.the_array) - 1
+
+    def __resize(self, capacity: int) -> None:
+        """ Moves the elements, with their priorities and sequences, into new arrays holding capacity elements. """
+        count = self.length + 1
+        the_array = FixedSizeArray(max(self.MIN_CAPACITY, self.length, capacity) + 1)
+        the_array[:count] = self.the_array[:count]
+        if self.priorities is self.the_array:
+            self.priorities = the_array
+        else:
+            priorities = [None] * len(the_array)
+            priorities[:count] = self.priorities[:count]
+            self.priorities = priorities
+        if self.sequences is not None:
+            sequences = [None] * len(the_array)
+            sequences[:count] = self.sequences[:count]
+            self.sequences = sequences
+        self.the_array = the_array
+
+    def make_room(self) -> bool:
+        """
+        Grows the arrays if they are full, by the growth factor but not past the max capacity.
+        Returns whether there is room for one more element.
+
+        Complexity: O(1) amortised, O(N) when it grows
+        """
+        if self.length < len(self.the_array) - 1:  # room left, the common case
+            return True
+        if self.is_full():
+            return False
+        capacity = max(self.capacity() + 1, int(self.capacity() * self.growth_factor))
+        self.__resize(capacity if self.max_capacity is None else min(capacity, self.max_capacity))
+        return True
+
+    def reserve(self, capacity: int) -> None:
+        """ Grows the arrays once so that they hold capacity elements (up to the max capacity) without growing again. """
+        if self.max_capacity is not None:
+            capacity = min(capacity, self.max_capacity)
+        if capacity > self.capacity():
+            self.__resize(capacity)
+
+    def shrink_to_fit(self) -> None:
+        """ Shrinks the arrays to the length of the heap, releasing the unused capacity. """
+        if self.capacity() > max(self.MIN_CAPACITY, self.length):
+            self.__resize(self.length)
+
+    def parent(self, k: int) -> int:
+        """ Returns the index of the parent of k (0 for the root). """
+        return (k - 2) // self.d + 1
+
+    def priority(self, element: T) -> object:
+        """ Returns the priority the heap orders the element by. """
+        return element if self.key is None else self.key(element)
 
     def swap(self, i: int, j: int) -> None:
         """ Swap the element of index i and index j around. """
         temp_i = self.the_array[i]
         self.the_array[i] = self.the_array[j]
         self.the_array[j] = temp_i
+        if self.priorities is not self.the_array:
+            temp_i = self.priorities[i]
+            self.priorities[i] = self.priorities[j]
+            self.priorities[j] = temp_i
+        if self.sequences is not None:
+            temp_i = self.sequences[i]
+            self.sequences[i] = self.sequences[j]
+            self.sequences[j] = temp_i
+
+    def place(self, k: int, element: T, priority: object, sequence: int = None) -> None:
+        """ Stores the element, its priority and its sequence at index k. """
+        self.the_array[k] = element
+        self.priorities[k] = priority
+        if self.sequences is not None:
+            self.sequences[k] = sequence
+
+    def next_sequence(self) -> int:
+        """ Returns the sequence of an element being added. """
+        self.sequence += 1
+        return self.sequence
 
     @abstractmethod
-    def rise(self, k: int) -> None:
-        """ Raise element at index k to its correct position. """
+    def rise(self, k: int) -> int:
+        """ Raise element at index k to its correct position. Returns that position. """
         pass
 
     def add(self, element: T) -> bool:
-        """ Add an element in to the Heap. `rise` function is used in conjunction with `add` to swap and raise element. """
-        has_space_left = not self.is_full()
+        """
+        Add an element in to the Heap. `rise` function is used in conjunction with `add` to swap and raise element.
+        The heap grows if needed, it returns False only when it is at its max capacity.
+        """
+        has_space_left = self.make_room()
 
         if has_space_left:
+            # Stores the element as place does, written out as adding is on the hot path
             self.length += 1
+            self.sequence += 1
             self.the_array[self.length] = element
+            if self.key is not None:
+                self.priorities[self.length] = self.key(element)
+                self.sequences[self.length] = self.sequence
             self.rise(self.length)
 
         return has_space_left
 
     @abstractmethod
-    def rise2(self, k: int, element: T) -> int:
-        """ Raise element at index k to its correct position. """
+    def rise2(self, k: int, priority: object) -> int:
+        """
+        Returns the position an element of the given priority added at index k rises to, moving the elements above it down.
+        The element was added last, so it stays below any element of equal priority.
+        """
         pass
 
     def add2(self, element: T) -> bool:
         """ Add an element in to the Heap. This alternative implementation shuffles the items down the heap using `rise2` and adds the new item in it's correct position at the end. """
-        has_space_left = not self.is_full()
+        has_space_left = self.make_room()
         if has_space_left:
             self.length += 1
-            self.the_array[self.rise2(self.length, element)] = element
+            priority = self.priority(element)
+            self.place(self.rise2(self.length, priority), element, priority, self.next_sequence())
         return has_space_left
 
     @abstractmethod
@@ -60,94 +202,606 @@ class Heap[T](ABC):
         pass
 
     @abstractmethod
-    def sink(self, k: int) -> None:
-        """ Make the element at index k sink to the correct position. """
+    def sink(self, k: int) -> int:
+        """ Make the element at index k sink to the correct position. Returns that position. """
         pass
 
-    def get_most_priotized(self) -> int:
+    def peek_most_priotized(self) -> T:
+        """ Returns the priotized element without removing it from the heap. """
+        if self.length == 0:
+            raise Exception("Heap is empty")
+        return self.the_array[1]
+
+    def get_most_priotized(self) -> T:
         " Get the priotized element from the heap. "
-        temp_priotized = self.the_array[1]
-        # Swap root and last available node
-        self.the_array[1] = self.the_array[len(self)]
+        if self.length == 0:
+            raise Exception("Heap is empty")
+        the_array = self.the_array
+        priorities = self.priorities
+        sequences = self.sequences
+        temp_priotized = the_array[1]
+        # Move the last available node to the root, and drop the references held by the vacated slot
+        last = self.length
+        the_array[1] = the_array[last]
+        the_array[last] = None
+        if priorities is not the_array:
+            priorities[1] = priorities[last]
+            priorities[last] = None
+        if sequences is not None:
+            sequences[1] = sequences[last]
+            sequences[last] = None
         self.length -= 1
+        if self.length > 0:
+            self.sink(1)
+        return temp_priotized
+
+    def replace_most_priotized(self, element: T) -> T:
+        """
+        Get the priotized element from the heap and add the element in its place, with a single sink.
+
+        Complexity: O(log N)
+        """
+        temp_priotized = self.peek_most_priotized()
+        self.place(1, element, self.priority(element), self.next_sequence())
         self.sink(1)
         return temp_priotized
 
     def create_heap(self, max_size: int, an_array: Sequence = None) -> None:
-        """ Bottom-up heap construction. Create the heap by heap-ordering each parent (from the bottom up) using a given array. It makes initialization of heap faster. """
-        self.the_array = FixedSizeArray(
-            max(len(an_array), max_size, self.MIN_CAPACITY) + 1)
+        """
+        Bottom-up heap construction. Create the heap by heap-ordering each parent (from the bottom up) using a given array.
+        Only the parents of the given elements are sunk, so the work depends on the data and not on max_size.
+        The room allocated is clamped to the max capacity.
+
+        Complexity: O(N) where N is the number of elements given
+        """
+        if an_array is None:
+            an_array = []
+        if self.max_capacity is not None and len(an_array) > self.max_capacity:
+            raise ValueError("More elements than the max capacity of the heap.")
+        capacity = max(len(an_array), max_size)
+        self.allocate(capacity if self.max_capacity is None else min(capacity, self.max_capacity))
         self.length = len(an_array)
 
-        if an_array is not None:
-            # Copy an_array to self.the_array (shift by 1 for readability)
-            for i in range(len(an_array)):
-                self.the_array[i+1] = an_array[i]
+        # Copy an_array to self.the_array (shift by 1 for readability)
+        self.the_array[1:self.length + 1] = list(an_array)
+        if self.priorities is not self.the_array:
+            self.priorities[1:self.length + 1] = [self.priority(element) for element in an_array]
+        if self.sequences is not None:
+            self.sequences[1:self.length + 1] = range(self.sequence + 1, self.sequence + self.length + 1)
+        self.sequence += self.length
+
+        # Heapify every parent, from the parent of the last element up
+        for i in range(self.parent(self.length), 0, -1):
+            self.sink(i)
 
-            # Heapify every parent
-            for i in range(max_size//2, 0, -1):
-                self.sink(i)
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T], key: Callable[[T], object] = None, d: int = DEFAULT_ARITY) -> 'Heap[T]':
+        """
+        Returns a heap of the elements, built bottom-up in one pass.
+
+        Complexity: O(N) where N is the number of elements
+        """
+        elements = list(iterable)
+        heap = cls(key=key, d=d)
+        heap.create_heap(len(elements), elements)
+        return heap
 
 
 class MaxHeap[T](Heap[T]):
+    """
+    The largest priority comes out first, and equal priorities in the order they were added.
+    rise, sink and priotized_child compare the priorities in locals, reading the sequences only on equal priorities.
+    """
 
-    def rise(self, k: int) -> None:
-        """ Raise element at index k to its correct position. """
-        while k > 1 and self.the_array[k] > self.the_array[k // 2]:
-            self.swap(k, k // 2)
-            k = k // 2
+    def rise(self, k: int) -> int:
+        """ Raise element at index k to its correct position, moving the elements above it down. Returns that position. """
+        the_array = self.the_array
+        priorities = self.priorities
+        sequences = self.sequences
+        d = self.d
+        element = the_array[k]
+        if sequences is None:  # the priorities are the elements
+            while k > 1:
+                parent = (k - 2) // d + 1
+                parent_element = the_array[parent]
+                if not element > parent_element:
+                    break
+                the_array[k] = parent_element
+                k = parent
+            the_array[k] = element
+            return k
+
+        priority = priorities[k]
+        sequence = sequences[k]
+        while k > 1:
+            parent = (k - 2) // d + 1
+            parent_priority = priorities[parent]
+            if not (priority > parent_priority or (priority == parent_priority and sequence < sequences[parent])):
+                break
+            the_array[k] = the_array[parent]
+            priorities[k] = parent_priority
+            sequences[k] = sequences[parent]
+            k = parent
+        the_array[k] = element
+        priorities[k] = priority
+        sequences[k] = sequence
+        return k
 
-    def rise2(self, k: int, element: T) -> int:
+    def rise2(self, k: int, priority: object) -> int:
         """ Raise element at index k to its correct position. """
-        while k > 1 and element > self.the_array[k // 2]:
-            self.the_array[k] = self.the_array[k // 2]
-            k = k//2
+        parent = (k - 2) // self.d + 1
+        while k > 1 and priority > self.priorities[parent]:
+            self.place(k, self.the_array[parent], self.priorities[parent],
+                       None if self.sequences is None else self.sequences[parent])
+            k = parent
+            parent = (k - 2) // self.d + 1
         return k
 
     def priotized_child(self, k: int) -> int:
-        """ Returns the index of the largest child of k. """
-        if 2 * k == self.length or self.the_array[2 * k] > self.the_array[2 * k + 1]:
-            return 2*k
-        else:
-            return 2*k+1
+        """ Returns the index of the largest of the (up to d) children of k. """
+        priorities = self.priorities
+        sequences = self.sequences
+        child = self.d * (k - 1) + 2
+        end = min(child + self.d, self.length + 1)
+        child_priority = priorities[child]
+        sibling = child + 1
+        while sibling < end:
+            sibling_priority = priorities[sibling]
+            if sibling_priority > child_priority or (sequences is not None and sibling_priority == child_priority
+                                                        and sequences[sibling] < sequences[child]):
+                child = sibling
+                child_priority = sibling_priority
+            sibling += 1
+        return child
 
-    def sink(self, k: int) -> None:
-        """ Make the element at index k sink to the correct position. """
-        while 2*k <= self.length:
-            child = self.priotized_child(k)
-            if self.the_array[k] >= self.the_array[child]:
+    def sink(self, k: int) -> int:
+        """ Make the element at index k sink to the correct position, moving the elements below it up. Returns that position. """
+        the_array = self.the_array
+        priorities = self.priorities
+        sequences = self.sequences
+        length = self.length
+        d = self.d
+        element = the_array[k]
+        if sequences is None:  # the priorities are the elements
+            child = d * (k - 1) + 2
+            while child <= length:
+                child_element = the_array[child]
+                if d == 2:  # binary heap, one sibling to compare without a loop
+                    if child < length:
+                        sibling_element = the_array[child + 1]
+                        if sibling_element > child_element:
+                            child += 1
+                            child_element = sibling_element
+                else:
+                    sibling = child + 1
+                    end = min(child + d, length + 1)
+                    while sibling < end:
+                        sibling_element = the_array[sibling]
+                        if sibling_element > child_element:
+                            child = sibling
+                            child_element = sibling_element
+                        sibling += 1
+                if not child_element > element:
+                    break
+                the_array[k] = child_element
+                k = child
+                child = d * (k - 1) + 2
+            the_array[k] = element
+            return k
+
+        priority = priorities[k]
+        sequence = sequences[k]
+        child = d * (k - 1) + 2
+        while child <= length:
+            child_priority = priorities[child]
+            if d == 2:
+                if child < length:
+                    sibling_priority = priorities[child + 1]
+                    if sibling_priority > child_priority or (sibling_priority == child_priority
+                                                                and sequences[child + 1] < sequences[child]):
+                        child += 1
+                        child_priority = sibling_priority
+            else:
+                sibling = child + 1
+                end = min(child + d, length + 1)
+                while sibling < end:
+                    sibling_priority = priorities[sibling]
+                    if sibling_priority > child_priority or (sibling_priority == child_priority
+                                                                and sequences[sibling] < sequences[child]):
+                        child = sibling
+                        child_priority = sibling_priority
+                    sibling += 1
+            if not (child_priority > priority or (child_priority == priority and sequences[child] < sequence)):
                 break
-            self.swap(child, k)
+            the_array[k] = the_array[child]
+            priorities[k] = child_priority
+            sequences[k] = sequences[child]
             k = child
+            child = d * (k - 1) + 2
+        the_array[k] = element
+        priorities[k] = priority
+        sequences[k] = sequence
+        return k
 
 
 class MinHeap[T](Heap[T]):
+    """
+    The smallest priority comes out first, and equal priorities in the order they were added.
+    rise, sink and priotized_child compare the priorities in locals, reading the sequences only on equal priorities.
+    """
 
-    def rise(self, k: int) -> None:
-        """ Raise element at index k to its correct position. """
-        while k > 1 and self.the_array[k] < self.the_array[k // 2]:
-            self.swap(k, k // 2)
-            k = k // 2
+    def rise(self, k: int) -> int:
+        """ Raise element at index k to its correct position, moving the elements above it down. Returns that position. """
+        the_array = self.the_array
+        priorities = self.priorities
+        sequences = self.sequences
+        d = self.d
+        element = the_array[k]
+        if sequences is None:  # the priorities are the elements
+            while k > 1:
+                parent = (k - 2) // d + 1
+                parent_element = the_array[parent]
+                if not element < parent_element:
+                    break
+                the_array[k] = parent_element
+                k = parent
+            the_array[k] = element
+            return k
 
-    def rise2(self, k: int, element: T) -> int:
+        priority = priorities[k]
+        sequence = sequences[k]
+        while k > 1:
+            parent = (k - 2) // d + 1
+            parent_priority = priorities[parent]
+            if not (priority < parent_priority or (priority == parent_priority and sequence < sequences[parent])):
+                break
+            the_array[k] = the_array[parent]
+            priorities[k] = parent_priority
+            sequences[k] = sequences[parent]
+            k = parent
+        the_array[k] = element
+        priorities[k] = priority
+        sequences[k] = sequence
+        return k
+
+    def rise2(self, k: int, priority: object) -> int:
         """ Raise element at index k to its correct position. """
-        while k > 1 and element < self.the_array[k // 2]:
-            self.the_array[k] = self.the_array[k // 2]
-            k = k//2
+        parent = (k - 2) // self.d + 1
+        while k > 1 and priority < self.priorities[parent]:
+            self.place(k, self.the_array[parent], self.priorities[parent],
+                       None if self.sequences is None else self.sequences[parent])
+            k = parent
+            parent = (k - 2) // self.d + 1
         return k
 
     def priotized_child(self, k: int) -> int:
-        """ Returns the index of the smallest child of k. """
-        if 2 * k == self.length or self.the_array[2 * k] < self.the_array[2 * k + 1]:
-            return 2*k
-        else:
-            return 2*k+1
+        """ Returns the index of the smallest of the (up to d) children of k. """
+        priorities = self.priorities
+        sequences = self.sequences
+        child = self.d * (k - 1) + 2
+        end = min(child + self.d, self.length + 1)
+        child_priority = priorities[child]
+        sibling = child + 1
+        while sibling < end:
+            sibling_priority = priorities[sibling]
+            if sibling_priority < child_priority or (sequences is not None and sibling_priority == child_priority
+                                                        and sequences[sibling] < sequences[child]):
+                child = sibling
+                child_priority = sibling_priority
+            sibling += 1
+        return child
+
+    def sink(self, k: int) -> int:
+        """ Make the element at index k sink to the correct position, moving the elements below it up. Returns that position. """
+        the_array = self.the_array
+        priorities = self.priorities
+        sequences = self.sequences
+        length = self.length
+        d = self.d
+        element = the_array[k]
+        if sequences is None:  # the priorities are the elements
+            child = d * (k - 1) + 2
+            while child <= length:
+                child_element = the_array[child]
+                if d == 2:  # binary heap, one sibling to compare without a loop
+                    if child < length:
+                        sibling_element = the_array[child + 1]
+                        if sibling_element < child_element:
+                            child += 1
+                            child_element = sibling_element
+                else:
+                    sibling = child + 1
+                    end = min(child + d, length + 1)
+                    while sibling < end:
+                        sibling_element = the_array[sibling]
+                        if sibling_element < child_element:
+                            child = sibling
+                            child_element = sibling_element
+                        sibling += 1
+                if not child_element < element:
+                    break
+                the_array[k] = child_element
+                k = child
+                child = d * (k - 1) + 2
+            the_array[k] = element
+            return k
 
-    def sink(self, k: int) -> None:
-        """ Make the element at index k sink to the correct position. """
-        while 2*k <= self.length:
-            child = self.priotized_child(k)
-            if self.the_array[k] <= self.the_array[child]:
+        priority = priorities[k]
+        sequence = sequences[k]
+        child = d * (k - 1) + 2
+        while child <= length:
+            child_priority = priorities[child]
+            if d == 2:
+                if child < length:
+                    sibling_priority = priorities[child + 1]
+                    if sibling_priority < child_priority or (sibling_priority == child_priority
+                                                                and sequences[child + 1] < sequences[child]):
+                        child += 1
+                        child_priority = sibling_priority
+            else:
+                sibling = child + 1
+                end = min(child + d, length + 1)
+                while sibling < end:
+                    sibling_priority = priorities[sibling]
+                    if sibling_priority < child_priority or (sibling_priority == child_priority
+                                                                and sequences[sibling] < sequences[child]):
+                        child = sibling
+                        child_priority = sibling_priority
+                    sibling += 1
+            if not (child_priority < priority or (child_priority == priority and sequences[child] < sequence)):
                 break
-            self.swap(child, k)
+            the_array[k] = the_array[child]
+            priorities[k] = child_priority
+            sequences[k] = sequences[child]
             k = child
+            child = d * (k - 1) + 2
+        the_array[k] = element
+        priorities[k] = priority
+        sequences[k] = sequence
+        return k
+
+
+class IndexedMinHeap[T](MinHeap[T]):
+    """
+    MinHeap of distinct hashable handles that keeps track of where each handle is, so the priority of any handle
+    can be changed, and any handle removed, in O(log N) without searching for it.
+
+    Attributes:
+        - positions: dictionary from each handle in the heap to its index in the_array, updated on every move
+
+    Note: handles cannot be None, as None marks an empty slot. The priorities are always kept in their own list,
+    given when a handle is added or computed from the handle with the key, and handles of equal priority always
+    come out in the order they were added.
+    """
+
+    def __init__(self, max_size: int = Heap.MIN_CAPACITY, key: Callable[[T], object] = None,
+                 d: int = Heap.DEFAULT_ARITY, max_capacity: int = None,
+                 growth_factor: float = Heap.DEFAULT_GROWTH_FACTOR) -> None:
+        self.positions = {}
+        super().__init__(max_size, key, d, max_capacity, growth_factor)
+
+    def allocate(self, max_size: int) -> None:
+        """ Replaces the storage with empty arrays holding max_size handles, their priorities and their sequences. """
+        super().allocate(max_size)
+        self.priorities = [None] * len(self.the_array)
+        self.sequences = [None] * len(self.the_array)
+        self.positions = {}
+
+    def __contains__(self, handle: T) -> bool:
+        """ Returns whether the handle is in the heap. Complexity: O(1) """
+        return handle in self.positions
+
+    def swap(self, i: int, j: int) -> None:
+        """ Swap the handle of index i and index j around, and their positions. """
+        super().swap(i, j)
+        self.positions[self.the_array[i]] = i
+        self.positions[self.the_array[j]] = j
+
+    def place(self, k: int, element: T, priority: object, sequence: int = None) -> None:
+        """ Stores the handle, its priority and its sequence at index k, and records its position. """
+        super().place(k, element, priority, sequence)
+        if element is not None:
+            self.positions[element] = k
+
+    def __track(self, k: int, top: int) -> None:
+        """ Records the position of each handle from index k up its ancestors to index top, the path a rise or sink moved. """
+        positions = self.positions
+        the_array = self.the_array
+        positions[the_array[k]] = k
+        while k != top:
+            k = (k - 2) // self.d + 1
+            positions[the_array[k]] = k
+
+    def rise(self, k: int) -> int:
+        """ Raise handle at index k to its correct position, and record the positions of the handles on its path. """
+        end = super().rise(k)
+        self.__track(k, end)
+        return end
+
+    def sink(self, k: int) -> int:
+        """ Make the handle at index k sink to the correct position, and record the positions of the handles on its path. """
+        end = super().sink(k)
+        self.__track(end, k)
+        return end
+
+    def __check_new(self, handle: T) -> None:
+        if handle is None:
+            raise ValueError("A handle cannot be None")
+        if handle in self.positions:
+            raise ValueError("Handle is already in the heap")
+
+    def add(self, element: T, priority: object = None) -> bool:
+        """ Add a handle in to the Heap, with the given priority or the one computed from the handle. """
+        self.__check_new(element)
+        if not self.make_room():
+            return False
+        self.length += 1
+        self.place(self.length, element, self.priority(element) if priority is None else priority, self.next_sequence())
+        self.rise(self.length)
+        return True
+
+    def add2(self, element: T, priority: object = None) -> bool:
+        """ Add a handle in to the Heap, shuffling the handles above it down with `rise2`. """
+        self.__check_new(element)
+        if not self.make_room():
+            return False
+        self.length += 1
+        if priority is None:
+            priority = self.priority(element)
+        self.place(self.rise2(self.length, priority), element, priority, self.next_sequence())
+        return True
+
+    def get_most_priotized(self) -> T:
+        """ Get the handle with the smallest priority from the heap. """
+        handle = super().get_most_priotized()
+        del self.positions[handle]
+        return handle
+
+    def replace_most_priotized(self, element: T, priority: object = None) -> T:
+        """ Get the handle with the smallest priority from the heap and add the handle in its place, with a single sink. """
+        self.__check_new(element)
+        handle = self.peek_most_priotized()
+        del self.positions[handle]
+        self.place(1, element, self.priority(element) if priority is None else priority, self.next_sequence())
+        self.sink(1)
+        return handle
+
+    def create_heap(self, max_size: int, an_array: Sequence = None) -> None:
+        """ Bottom-up heap construction from distinct handles, with the priorities computed from the handles. """
+        if an_array is not None:
+            handles = set(an_array)
+            if len(handles) < len(an_array) or None in handles:
+                raise ValueError("Handles should be distinct and not None")
+        super().create_heap(max_size, an_array)
+        self.positions = {self.the_array[k]: k for k in range(1, self.length + 1)}
+
+    def get_priority(self, handle: T) -> object:
+        """ Returns the priority of the handle. Complexity: O(1) """
+        return self.priorities[self.positions[handle]]
+
+    def update_priority(self, handle: T, priority: object) -> None:
+        """
+        Changes the priority of the handle, rising it if it went down and sinking it if it went up.
+
+        Complexity: O(log N)
+        """
+        k = self.positions[handle]
+        previous = self.priorities[k]
+        self.priorities[k] = priority
+        if priority < previous:
+            self.rise(k)
+        else:
+            self.sink(k)
+
+    def remove(self, handle: T) -> None:
+        """
+        Removes the handle from the heap, moving the last handle into its place and rising or sinking that one.
+
+        Complexity: O(log N)
+        """
+        k = self.positions[handle]
+        if k != self.length:
+            self.swap(k, self.length)
+        self.place(self.length, None, None)
+        del self.positions[handle]
+        self.length -= 1
+        if k <= self.length:
+            self.rise(k)
+            self.sink(k)
+
+
+class OffsetView[T]:
+    """
+    Presents a mutable sequence 1-indexed, so a heap can order it in place.
+
+    Attributes:
+        - sequence: the sequence viewed, index k of the view is index k - 1 of the sequence
+    """
+
+    def __init__(self, sequence: MutableSequence[T]) -> None:
+        self.sequence = sequence
+
+    def __len__(self) -> int:
+        """ Returns the length of the view, counting the unused position 0. """
+        return len(self.sequence) + 1
+
+    def __getitem__(self, index: int) -> T:
+        return self.sequence[index - 1]
+
+    def __setitem__(self, index: int, value: T) -> None:
+        self.sequence[index - 1] = value
+
+
+def heapsort[T](sequence: MutableSequence[T], key: Callable[[T], object] = None, reverse: bool = False,
+                d: int = Heap.DEFAULT_ARITY) -> None:
+    """
+    Sorts the sequence in place: heapify it bottom-up, then repeatedly swap the root to the end of the heap and sink
+    the new root. A MaxHeap sorts in ascending order, a MinHeap in descending order.
+    The sort is stable when a key is given, as the sequences break ties by position.
+
+    Complexity: O(N log N)
+    """
+    heap = MinHeap(key=key, d=d) if reverse else MaxHeap(key=key, d=d)
+    heap.the_array = OffsetView(sequence)
+    heap.priorities = heap.the_array if key is None else OffsetView([key(element) for element in sequence])
+    # Later elements win ties, so they are swapped to the end first and equal keys keep their order
+    heap.sequences = None if key is None else OffsetView([-i for i in range(len(sequence))])
+    heap.length = len(sequence)
+    for i in range(heap.parent(heap.length), 0, -1):
+        heap.sink(i)
+    while heap.length > 1:
+        heap.swap(1, heap.length)
+        heap.length -= 1
+        heap.sink(1)
+
+
+def nsmallest[T](k: int, iterable: Iterable[T], key: Callable[[T], object] = None) -> list[T]:
+    """
+    Returns the k smallest elements in ascending order. A MaxHeap holds the k smallest seen so far, so an element
+    only goes in when it is smaller than the largest of them.
+
+    Complexity: O(N log K) time and O(K) memory
+    """
+    return bounded_select(MaxHeap, k, iterable, key)
+
+
+def nlargest[T](k: int, iterable: Iterable[T], key: Callable[[T], object] = None) -> list[T]:
+    """
+    Returns the k largest elements in descending order. A MinHeap holds the k largest seen so far, so an element
+    only goes in when it is larger than the smallest of them.
+
+    Complexity: O(N log K) time and O(K) memory
+    """
+    return bounded_select(MinHeap, k, iterable, key)
+
+
+def bounded_select[T](heap_type: type[Heap], k: int, iterable: Iterable[T], key: Callable[[T], object]) -> list[T]:
+    """
+    Returns the k elements the heap would leave last, ordered the opposite way to the heap.
+    Elements of equal priority keep the order they came in, like sorted: the sequences count down, so among equal
+    priorities the element seen last is at the root and is dropped first.
+    """
+    if k <= 0:
+        return []
+    iterator = iter(iterable)
+    first = []
+    for element in iterator:
+        first.append(element)
+        if len(first) == k:
+            break
+    heap = heap_type(len(first), key)
+    heap.create_heap(len(first), first[::-1])  # sequences len(first) down to 1, in the order first came in
+    sequence = 1
+
+    # The root is the element that would be dropped first, replace it by any element it should be dropped for
+    keep = (lambda a, b: a < b) if heap_type is MaxHeap else (lambda a, b: a > b)
+    for element in iterator:
+        priority = heap.priority(element)
+        if keep(priority, heap.priorities[1]):
+            sequence -= 1
+            heap.place(1, element, priority, sequence)
+            heap.sink(1)
+
+    result = [heap.get_most_priotized() for _ in range(len(heap))]
+    result.reverse()
+    return result
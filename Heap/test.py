@@ -0,0 +1,249 @@
+import heapq
+import random
+import unittest
+from heap import MinHeap, MaxHeap, IndexedMinHeap, heapsort, nsmallest, nlargest
+
+
+class TestHeap(unittest.TestCase):
+    def test_add_and_get(self):
+        for heap_type, expected in [(MinHeap, sorted), (MaxHeap, lambda items: sorted(items, reverse=True))]:
+            for add in ("add", "add2"):
+                heap = heap_type(20)
+                items = [6, 2, 3, 14, 11, 1, 6, 8, 12]
+                for item in items:
+                    self.assertTrue(getattr(heap, add)(item))
+                self.assertEqual(heap.peek_most_priotized(), expected(items)[0])
+                self.assertEqual([heap.get_most_priotized() for _ in range(len(items))], expected(items))
+                with self.assertRaises(Exception):
+                    heap.get_most_priotized()
+
+    def test_create_heap(self):
+        rng = random.Random(7)
+        for length in [0, 1, 2, 9, 100]:
+            items = [rng.randrange(50) for _ in range(length)]
+            for max_size in [0, length // 2, length, 2 * length]:
+                heap = MinHeap()
+                heap.create_heap(max_size, items)
+                self.assertEqual(len(heap), length)
+                self.assertGreaterEqual(len(heap.the_array), max(max_size, length) + 1)
+                self.assertEqual([heap.get_most_priotized() for _ in range(length)], sorted(items))
+
+        heap = MaxHeap()
+        heap.create_heap(5)
+        self.assertEqual(len(heap), 0)
+        self.assertEqual(len(heap.the_array), 6)
+
+    def test_growth(self):
+        rng = random.Random(7)
+        items = [rng.randrange(100) for _ in range(100)]
+        for heap in [MinHeap(), MinHeap(key=lambda item: -item), IndexedMinHeap(growth_factor=1.5)]:
+            for handle, item in enumerate(items):
+                self.assertTrue(heap.add(handle if isinstance(heap, IndexedMinHeap) else item))
+            self.assertEqual(len(heap), 100)
+            self.assertGreaterEqual(heap.capacity(), 100)
+            self.assertEqual(len(heap.priorities), len(heap.the_array))
+            self.assertFalse(heap.is_full(), "A heap without a max capacity is never full")
+        self.assertEqual([heap.get_most_priotized() for _ in range(100)], list(range(100)))
+
+        heap = MinHeap(key=lambda item: -item)
+        heap.reserve(50)
+        self.assertEqual(heap.capacity(), 50)
+        for item in items[:10]:
+            heap.add(item)
+        heap.shrink_to_fit()
+        self.assertEqual(heap.capacity(), 10)
+        self.assertEqual([heap.get_most_priotized() for _ in range(10)], sorted(items[:10], reverse=True))
+        heap.shrink_to_fit()
+        self.assertEqual(heap.capacity(), MinHeap.MIN_CAPACITY)
+
+    def test_max_capacity(self):
+        heap = MaxHeap(2, max_capacity=5)
+        for item in range(5):
+            self.assertTrue(heap.add(item))
+        self.assertTrue(heap.is_full())
+        self.assertFalse(heap.add(5), "A heap at its max capacity should not grow")
+        self.assertFalse(heap.add2(5))
+        self.assertEqual(heap.capacity(), 5)
+        heap.reserve(10)
+        self.assertEqual(heap.capacity(), 5)
+        self.assertEqual(heap.get_most_priotized(), 4)
+        self.assertTrue(heap.add(9))
+        with self.assertRaises(ValueError):
+            heap.create_heap(0, range(6))
+        heap.create_heap(10, range(3))
+        self.assertEqual(heap.capacity(), 5, "create_heap should not allocate past the max capacity")
+        self.assertEqual(len(heap), 3)
+
+        with self.assertRaises(ValueError):
+            MinHeap(5, max_capacity=4)
+        with self.assertRaises(ValueError):
+            MinHeap(growth_factor=1)
+
+    def test_from_iterable_key(self):
+        words = ["pear", "fig", "banana", "kiwi", "apple"]
+        heap = MinHeap.from_iterable(iter(words), key=len)
+        self.assertEqual([len(heap.get_most_priotized()) for _ in range(len(words))], sorted(map(len, words)))
+
+        heap = MaxHeap(10, key=len)
+        heap.create_heap(10, words)
+        heap.add("watermelon")
+        self.assertEqual(heap.get_most_priotized(), "watermelon")
+        self.assertEqual(heap.get_most_priotized(), "banana")
+
+    def test_key_ties_first_in_first_out(self):
+        rng = random.Random(7)
+        for heap_type in [MinHeap, MaxHeap]:
+            for d in [2, 3]:
+                jobs = [(rng.randrange(5), i, object()) for i in range(200)]  # the payload cannot be compared
+                heap = heap_type(100, key=lambda job: job[0], d=d)
+                heap.create_heap(len(jobs), jobs[:100])
+                for job in jobs[100:150]:
+                    heap.add(job)
+                for job in jobs[150:]:
+                    heap.add2(job)
+                self.assertIsNone(heap.priorities[0])
+                expected = sorted(jobs, key=lambda job: -job[0] if heap_type is MaxHeap else job[0])
+                self.assertEqual([heap.get_most_priotized() for _ in range(len(jobs))], expected,
+                                 "Equal priorities should come out in the order they were added")
+
+    def test_heapsort(self):
+        rng = random.Random(7)
+        for length in [0, 1, 2, 10, 101]:
+            items = [rng.randrange(50) for _ in range(length)]
+            ascending = list(items)
+            heapsort(ascending)
+            self.assertEqual(ascending, sorted(items))
+            descending = list(items)
+            heapsort(descending, reverse=True)
+            self.assertEqual(descending, sorted(items, reverse=True))
+            for reverse in [False, True]:
+                by_key = list(items)
+                heapsort(by_key, key=lambda item: item % 7, reverse=reverse)
+                self.assertEqual(by_key, sorted(items, key=lambda item: item % 7, reverse=reverse),
+                                 "Sorting by a key should be stable")
+
+    def test_arity(self):
+        rng = random.Random(7)
+        for d in [2, 3, 4, 7]:
+            for heap_type, before in [(MinHeap, lambda a, b: a <= b), (MaxHeap, lambda a, b: a >= b)]:
+                items = [rng.randrange(100) for _ in range(300)]
+                heap = heap_type.from_iterable(items[:150], d=d)
+                self.assertEqual(heap.d, d)
+                larger = heap_type(300, d=d)
+                for item in items:
+                    self.assertTrue(larger.add(item))
+                for built in [heap, larger]:
+                    for k in range(2, len(built) + 1):
+                        self.assertTrue(before(built.the_array[built.parent(k)], built.the_array[k]))
+                self.assertEqual([larger.get_most_priotized() for _ in range(300)], sorted(items, reverse=heap_type is MaxHeap))
+
+                ascending = list(items)
+                heapsort(ascending, d=d)
+                self.assertEqual(ascending, sorted(items))
+
+        with self.assertRaises(ValueError):
+            MinHeap(5, d=1)
+
+    def test_nsmallest_and_nlargest(self):
+        rng = random.Random(7)
+        items = [rng.randrange(100) for _ in range(200)]
+        for k in [-1, 0, 1, 5, 199, 200, 300]:
+            self.assertEqual(nsmallest(k, iter(items)), sorted(items)[:max(k, 0)])
+            self.assertEqual(nlargest(k, items), sorted(items, reverse=True)[:max(k, 0)])
+            self.assertEqual([item % 10 for item in nsmallest(k, items, key=lambda item: item % 10)],
+                             sorted(item % 10 for item in items)[:max(k, 0)])
+
+    def test_nsmallest_and_nlargest_ties(self):
+        """ Elements of equal key should come out in the order they came in, as with heapq. """
+        self.assertEqual(nsmallest(6, [(4, 97), (0, 32), (0, 63), (3, 60)], key=lambda pair: pair[0]),
+                         [(0, 32), (0, 63), (3, 60), (4, 97)])
+        rng = random.Random(7)
+        for _ in range(200):
+            pairs = [(rng.randrange(5), rng.randrange(100)) for _ in range(rng.randrange(1, 30))]
+            for k in [1, 3, len(pairs) // 2, len(pairs), len(pairs) + 1]:
+                self.assertEqual(nsmallest(k, pairs, key=lambda pair: pair[0]),
+                                 heapq.nsmallest(k, pairs, key=lambda pair: pair[0]))
+                self.assertEqual(nlargest(k, iter(pairs), key=lambda pair: pair[0]),
+                                 heapq.nlargest(k, pairs, key=lambda pair: pair[0]))
+
+
+class TestIndexedMinHeap(unittest.TestCase):
+    def assertIndexed(self, heap: IndexedMinHeap, expected: dict) -> None:
+        """ The positions should point at each handle, and every parent should come before its children. """
+        self.assertEqual(len(heap), len(expected))
+        self.assertEqual(len(heap.positions), len(expected))
+        for handle, priority in expected.items():
+            self.assertIn(handle, heap)
+            self.assertEqual(heap.the_array[heap.positions[handle]], handle)
+            self.assertEqual(heap.get_priority(handle), priority)
+        for k in range(2, len(heap) + 1):
+            self.assertLessEqual(heap.priorities[heap.parent(k)], heap.priorities[k])
+
+    def test_random_operations(self):
+        """ Compares the heap against a dictionary of priorities under a random mix of every operation. """
+        rng = random.Random(7)
+        for d in [2, 4]:
+            self.check_random_operations(rng, IndexedMinHeap(500, d=d))
+
+    def check_random_operations(self, rng: random.Random, heap: IndexedMinHeap) -> None:
+        expected = {}
+        for _ in range(2000):
+            choice = rng.random()
+            if choice < 0.35 or len(expected) == 0:
+                handle = rng.randrange(1000)
+                if handle in expected:
+                    with self.assertRaises(ValueError):
+                        heap.add(handle, 0)
+                else:
+                    expected[handle] = rng.random()
+                    self.assertTrue((heap.add if rng.random() < 0.5 else heap.add2)(handle, expected[handle]))
+            elif choice < 0.6:
+                handle = rng.choice(list(expected))
+                expected[handle] = rng.random()
+                heap.update_priority(handle, expected[handle])
+            elif choice < 0.8:
+                handle = rng.choice(list(expected))
+                heap.remove(handle)
+                del expected[handle]
+                self.assertNotIn(handle, heap)
+            else:
+                smallest = min(expected.values())
+                handle = heap.get_most_priotized()
+                self.assertEqual(expected.pop(handle), smallest)
+            self.assertIndexed(heap, expected)
+
+    def test_create_heap(self):
+        heap = IndexedMinHeap.from_iterable("badc", key=lambda handle: -ord(handle))
+        self.assertIndexed(heap, {handle: -ord(handle) for handle in "abcd"})
+        heap.update_priority("a", -200)
+        self.assertEqual(heap.replace_most_priotized("e", 0), "a")
+        self.assertEqual([heap.get_most_priotized() for _ in range(4)], ["d", "c", "b", "e"])
+        self.assertEqual(heap.positions, {})
+        with self.assertRaises(ValueError):
+            IndexedMinHeap.from_iterable([1, 1])
+
+    def test_ties_first_in_first_out(self):
+        heap = IndexedMinHeap(20)
+        for handle in range(20):
+            heap.add(handle, handle % 2)
+        heap.update_priority(0, 1)
+        # 0 keeps the sequence it was added with, so it still comes out before the handles added after it
+        self.assertEqual([heap.get_most_priotized() for _ in range(20)],
+                         list(range(2, 20, 2)) + [0] + list(range(1, 20, 2)))
+
+    def test_missing_handles(self):
+        heap = IndexedMinHeap(5)
+        with self.assertRaises(KeyError):
+            heap.update_priority("missing", 1)
+        with self.assertRaises(KeyError):
+            heap.remove("missing")
+        with self.assertRaises(ValueError):
+            heap.add(None, 1)
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestHeap)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestIndexedMinHeap)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,231 @@
+""" 
+Benchmarks of ArrayList and LinkList.
+
+- Compares the append throughput of a resizable ArrayList against a preallocated one and the built-in list.
+- Compares inserting and deleting at the front, one item at a time and in a batch, against the built-in list.
+- Compares SortedArrayList against the previous insert-then-sort design and bisect on the built-in list.
+- Compares ChunkedSortedList and SkipList against SortedArrayList, SortedLinkList and bisect on the built-in list, for small and large lists.
+- Compares appending to a LinkList one item at a time and in one extend against collections.deque.
+- Compares repeated edits in the middle of a list through a DoublyLinkList cursor against indexed LinkList and list edits.
+- Compares loading and merging SortedLinkList one insert at a time against from_iterable and merge.
+- Run from this directory: python benchmark.py
+"""
+
+import bisect
+import random
+import timeit
+from collections import deque
+from list import ArrayList, SortedArrayList, ChunkedSortedList, LinkList, DoublyLinkList, SortedLinkList, SkipList
+
+N = 100000
+REPEAT = 3
+
+
+def best_of(statement) -> float:
+    return min(timeit.repeat(statement, number=1, repeat=REPEAT))
+
+
+def append_all(array_list, count: int) -> None:
+    for i in range(count):
+        array_list.append(i)
+
+
+def bench_append() -> None:
+    print(f"Appending {N} items")
+    candidates = [
+        ("ArrayList preallocated", lambda: append_all(ArrayList(N), N)),
+        ("ArrayList resizable x2", lambda: append_all(ArrayList(1, resizable=True), N)),
+        ("ArrayList resizable x1.5", lambda: append_all(ArrayList(1, resizable=True, growth_factor=1.5), N)),
+        ("list", lambda: append_all([], N)),
+    ]
+    for label, append in candidates:
+        elapsed = best_of(append)
+        print(f"  {label:<28}{elapsed * 1000:10.2f} ms{N / elapsed / 1e6:10.2f} M appends/s")
+
+
+def insert_front(array_list, count: int):
+    for i in range(count):
+        array_list.insert(0, i)
+    return array_list
+
+
+def delete_front(array_list: ArrayList) -> None:
+    while len(array_list) > 0:
+        array_list.delete_at_index(0)
+
+
+def pop_front(items: list) -> None:
+    while len(items) > 0:
+        items.pop(0)
+
+
+def bench_shift() -> None:
+    count = N // 10
+    items = list(range(count))
+    print(f"Inserting then deleting {count} items at the front")
+    candidates = [
+        ("ArrayList one by one", lambda: delete_front(insert_front(ArrayList(1, resizable=True), count))),
+        ("ArrayList batch", lambda: batch(items)),
+        ("list one by one", lambda: pop_front(insert_front([], count))),
+    ]
+    for label, shift in candidates:
+        print(f"  {label:<28}{best_of(shift) * 1000:10.2f} ms")
+
+
+def batch(items: list) -> None:
+    array_list = ArrayList(1, resizable=True)
+    array_list.insert_many(0, items)
+    array_list.delete_range(0, len(items))
+
+
+class ResortingArrayList(ArrayList):
+    """ The previous SortedArrayList design: append, then sort the whole list again. """
+
+    def insert(self, item) -> None:
+        ArrayList.insert(self, len(self), item)
+        self.array[:len(self)] = sorted(self.array[:len(self)])
+
+
+def bench_sorted() -> None:
+    count = N // 50
+    rng = random.Random(7)
+    items = [rng.randrange(count) for _ in range(count)]
+    print(f"Inserting {count} random items in sorted order, then looking each one up")
+
+    def fill(sorted_list):
+        for item in items:
+            sorted_list.insert(item)
+        return sorted_list
+
+    def fill_list() -> list:
+        sorted_items = []
+        for item in items:
+            bisect.insort(sorted_items, item)
+        return sorted_items
+
+    for label, build, search in [
+        ("insert then sort", lambda: fill(ResortingArrayList(count)), None),
+        ("SortedArrayList", lambda: fill(SortedArrayList(count)), SortedArrayList.get_index),
+        ("SortedArrayList batch", lambda: SortedArrayList(count).insert_many(items), None),
+        ("list + bisect.insort", fill_list, bisect.bisect_left),
+    ]:
+        built = build()
+        line = f"  {label:<28}{best_of(build) * 1000:10.2f} ms insert"
+        if search is not None:
+            line += f"{best_of(lambda: [search(built, item) for item in items]) * 1000:10.2f} ms lookup"
+        print(line)
+
+
+def bench_chunked() -> None:
+    rng = random.Random(7)
+    for count, candidates in [(N // 50, [SortedArrayList, ChunkedSortedList, SortedLinkList, SkipList, list]),
+                              (2 * N, [ChunkedSortedList, SkipList, list])]:
+        items = [rng.random() for _ in range(count)]
+        positions = [rng.randrange(count) for _ in range(1000)]
+        print(f"Sorted list of {count} random items: inserting all, 1000 index lookups, deleting all from the middle")
+        for candidate in candidates:
+            def fill():
+                sorted_list = SortedArrayList(count) if candidate is SortedArrayList else candidate()
+                for item in items:
+                    if candidate is list:
+                        bisect.insort(sorted_list, item)
+                    else:
+                        sorted_list.insert(item)
+                return sorted_list
+
+            def delete_all(sorted_list) -> None:
+                while len(sorted_list) > 0:
+                    if candidate is list:
+                        sorted_list.pop(len(sorted_list) // 2)
+                    else:
+                        sorted_list.delete_at_index(len(sorted_list) // 2)
+
+            insert_time = best_of(fill)
+            sorted_list = fill()
+            lookup_time = best_of(lambda: [sorted_list[position] for position in positions])
+            delete_time = min(timeit.repeat(lambda: delete_all(fill()), number=1, repeat=REPEAT)) - insert_time
+            print(f"  {candidate.__name__:<28}{insert_time * 1000:10.2f} ms insert{lookup_time * 1000:10.2f} ms lookup"
+                  f"{delete_time * 1000:10.2f} ms delete")
+
+
+def bench_link_append() -> None:
+    print(f"Appending {N} items to a linked list")
+    candidates = [
+        ("LinkList append", lambda: append_all(LinkList(), N)),
+        ("LinkList extend", lambda: LinkList().extend(range(N))),
+        ("deque append", lambda: append_all(deque(), N)),
+    ]
+    for label, append in candidates:
+        elapsed = best_of(append)
+        print(f"  {label:<28}{elapsed * 1000:10.2f} ms{N / elapsed / 1e6:10.2f} M appends/s")
+
+
+def bench_cursor() -> None:
+    size = N // 10
+    edits = 2000
+    print(f"Inserting and deleting {edits} items in the middle of {size} items")
+
+    def indexed(candidate):
+        middle = size // 2
+        for i in range(edits):
+            candidate.insert(middle, i)
+            candidate.insert(middle + 1, i)
+            if isinstance(candidate, list):
+                candidate.pop(middle)
+            else:
+                candidate.delete_at_index(middle)
+
+    def cursor_edits(doubly: DoublyLinkList):
+        cursor = doubly.cursor(size // 2)
+        for i in range(edits):
+            cursor.insert_before(i)
+            cursor.insert_after(i)
+            cursor.move(-1)
+            cursor.remove()
+
+    def filled(candidate):
+        candidate.extend(range(size))
+        return candidate
+
+    candidates = [
+        ("LinkList insert/delete", lambda: indexed(filled(LinkList()))),
+        ("DoublyLinkList insert/delete", lambda: indexed(filled(DoublyLinkList()))),
+        ("DoublyLinkList cursor", lambda: cursor_edits(filled(DoublyLinkList()))),
+        ("list insert/pop", lambda: indexed(filled([]))),
+    ]
+    for label, edit in candidates:
+        elapsed = best_of(edit)
+        print(f"  {label:<30}{elapsed * 1000:10.2f} ms (including filling the list)")
+
+
+def bench_sorted_link() -> None:
+    size = N // 20
+    rng = random.Random(7)
+    items = [rng.random() for _ in range(size)]
+    print(f"Loading {size} items into a SortedLinkList and merging two of that size")
+
+    def insert_all(sorted_list, new_items):
+        for item in new_items:
+            sorted_list.insert(item)
+        return sorted_list
+
+    candidates = [
+        ("insert, random order", lambda: insert_all(SortedLinkList(), items)),
+        ("insert, sorted order", lambda: insert_all(SortedLinkList(), sorted(items))),
+        ("from_iterable", lambda: SortedLinkList.from_iterable(items)),
+        ("merge one insert at a time", lambda: insert_all(SortedLinkList.from_iterable(items), items)),
+        ("merge", lambda: SortedLinkList.from_iterable(items).merge(SortedLinkList.from_iterable(items))),
+    ]
+    for label, load in candidates:
+        elapsed = best_of(load)
+        print(f"  {label:<30}{elapsed * 1000:10.2f} ms")
+
+
+if __name__ == '__main__':
+    bench_append()
+    bench_shift()
+    bench_sorted()
+    bench_chunked()
+    bench_link_append()
+    bench_cursor()
+    bench_sorted_link()
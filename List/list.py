@@ -1,6 +1,10 @@
 """ List implementation. """
 
+import bisect
+import random
 from abc import ABC, abstractmethod
+from heapq import merge
+from itertools import chain
 from fixed_size_array import FixedSizeArray
 
 
@@ -75,15 +79,37 @@ class ArrayList[T](List[T]):
     """ 
     Implementation of a generic list with arrays.
 
+    Constants:
+        - MIN_CAPACITY: smallest valid capacity
+        - DEFAULT_GROWTH_FACTOR: factor a resizable list multiplies its capacity by when full
+        - DEFAULT_SHRINK_THRESHOLD: fraction of its capacity a resizable list may fall below before it shrinks (0 never shrinks)
+
     Attributes:
         - length (int): number of elements in the list (inherited)
         - array (FixedSizeArray[T]): array storing the elements of the list
+        - resizable (bool): whether the list grows when full instead of raising
+        - growth_factor (float): factor the capacity is multiplied by when a resizable list is full
+        - shrink_threshold (float): a resizable list shrinks once length / capacity falls below it
+        - min_capacity (int): a resizable list never shrinks below the capacity it was created with on its own
     """
     MIN_CAPACITY = 1
 
-    def __init__(self, max_capacity: int) -> None:
+    DEFAULT_GROWTH_FACTOR = 2
+    DEFAULT_SHRINK_THRESHOLD = 1 / 4
+
+    def __init__(self, max_capacity: int, resizable: bool = False, growth_factor: float = DEFAULT_GROWTH_FACTOR,
+                 shrink_threshold: float = DEFAULT_SHRINK_THRESHOLD) -> None:
+        """ Creates an empty list holding max_capacity elements, or starting at that capacity if resizable. """
+        if growth_factor <= 1:
+            raise ValueError("The growth factor should be larger than 1.")
+        if not 0 <= shrink_threshold < 1 / growth_factor:
+            raise ValueError("The shrink threshold should satisfy 0 <= shrink_threshold < 1 / growth_factor.")
         List.__init__(self)
-        self.array = FixedSizeArray(max(self.MIN_CAPACITY, max_capacity))
+        self.resizable = resizable
+        self.growth_factor = growth_factor
+        self.shrink_threshold = shrink_threshold
+        self.min_capacity = max(self.MIN_CAPACITY, max_capacity)
+        self.array = FixedSizeArray(self.min_capacity)
 
     def __getitem__(self, index: int) -> T:
         """ Returns the value of the element at an index. """
@@ -93,20 +119,39 @@ class ArrayList[T](List[T]):
         """ Sets the value of the element at position index. """
         self.array[index] = value
 
-    def __shuffle_right(self, index: int) -> None:
-        """ Shuffles all the items to the right from index. """
-        for i in range(len(self), index, -1):
-            self.array[i] = self.array[i - 1]
-
-    def __shuffle_left(self, index: int) -> None:
-        """ Shuffles all the items to the left from index. """
-        for i in range(index, len(self)):
-            self.array[i] = self.array[i+1]
+    def __shuffle_right(self, index: int, count: int = 1) -> None:
+        """
+        Shuffles all the items from index count positions to the right, as a single slice move.
+        The slice copies the references out before storing them, so the reference counts stay correct.
+        """
+        if index < len(self):
+            self.array[index + count:len(self) + count] = self.array[index:len(self)]
+
+    def __shuffle_left(self, index: int, count: int = 1) -> None:
+        """ Shuffles all the items from index + count to the left onto index, as a single slice move, and clears the slots freed at the end. """
+        self.array[index:len(self) - count] = self.array[index + count:len(self)]
+        self.array[len(self) - count:len(self)] = [None] * count
+
+    def __resize(self, capacity: int) -> None:
+        """ Moves the elements into a new array of the given capacity (at least the length of the list). """
+        new_array = FixedSizeArray(max(self.MIN_CAPACITY, len(self), capacity))
+        new_array[:len(self)] = self.array[:len(self)]
+        self.array = new_array
 
     def is_full(self):
-        """ Returns true if the list is full. """
+        """ Returns true if the list is full. A resizable list is full when it has to grow on the next insert. """
         return len(self) >= len(self.array)
 
+    def reserve(self, capacity: int) -> None:
+        """ Grows the array once so that it holds capacity elements without growing again. """
+        if capacity > len(self.array):
+            self.__resize(capacity)
+
+    def shrink_to_fit(self) -> None:
+        """ Shrinks the array to the length of the list, releasing the unused capacity. """
+        if len(self.array) > max(self.MIN_CAPACITY, len(self)):
+            self.__resize(len(self))
+
     def get_index(self, item: T) -> int:
         """ Returns the position of the first occurrence of item. """
         for i in range(len(self)):
@@ -115,71 +160,521 @@ class ArrayList[T](List[T]):
         raise ValueError("Item not in list")
 
     def delete_at_index(self, index: int) -> T:
-        """ Deletes the element from index and move remaining elements to the left. """
-        if index < 0 or index > len(self):
+        """
+        Deletes the element from index and move remaining elements to the left.
+        :see: #self.delete_range(start: int, stop: int)
+        """
+        if index < 0 or index >= len(self):
             raise IndexError("Out of bounds")
         item = self.array[index]
-        self.length -= 1
-        self.__shuffle_left(index)
+        self.delete_range(index, index + 1)
         return item
 
+    def delete_range(self, start: int, stop: int) -> None:
+        """
+        Deletes the elements from start up to (not including) stop, moving the remaining elements left in one shift.
+        A resizable list then shrinks if it fell below the shrink threshold.
+
+        Complexity (Best): O(K) deleting K elements at the end
+        Complexity (Worst): O(N) deleting at the front, or shrinking, where N is the length of the list
+        """
+        if not 0 <= start <= stop <= len(self):
+            raise IndexError("Out of bounds")
+        self.__shuffle_left(start, stop - start)
+        self.length -= stop - start
+
+        if self.resizable and len(self) < self.shrink_threshold * len(self.array) and len(self.array) > self.min_capacity:
+            # Shrink to about 1 / growth_factor full, so a few inserts do not grow it straight back
+            self.__resize(max(self.min_capacity, int(len(self) * self.growth_factor)))
+
     def insert(self, index: int, item: T) -> None:
-        """ Moves element from index to the right by one position and inserts the element in index. """
+        """
+        Moves element from index to the right by one position and inserts the element in index.
+        A full resizable list first grows its capacity by the growth factor, so appending is amortised O(1).
+
+        Complexity (Best): O(1) appending with room left
+        Complexity (Worst): O(N) inserting at the front, or growing, where N is the length of the list
+        """
+        if not 0 <= index <= len(self):
+            raise IndexError("Out of bounds")
         if self.is_full():
-            raise Exception("List is full")
+            if not self.resizable:
+                raise Exception("List is full")
+            self.__resize(max(len(self) + 1, int(len(self.array) * self.growth_factor)))
         self.__shuffle_right(index)
         self.array[index] = item
         self.length += 1
 
+    def insert_many(self, index: int, items) -> None:
+        """
+        Inserts all the items in order starting at index, moving the elements after it right in one shift.
+        A resizable list grows at most once. A fixed list raises without changing if the items do not fit.
+
+        Complexity (Best): O(K) appending K items with room left
+        Complexity (Worst): O(N + K) inserting at the front, or growing, where N is the length of the list
+        """
+        if not 0 <= index <= len(self):
+            raise IndexError("Out of bounds")
+        items = list(items)
+        if len(self) + len(items) > len(self.array):
+            if not self.resizable:
+                raise Exception("List is full")
+            self.__resize(max(len(self) + len(items), int(len(self.array) * self.growth_factor)))
+        self.__shuffle_right(index, len(items))
+        self.array[index:index + len(items)] = items
+        self.length += len(items)
+
+    def clear(self):
+        """ Sets the list back to empty. A resizable list also goes back to the capacity it was created with. """
+        List.clear(self)
+        if self.resizable:
+            self.array = FixedSizeArray(self.min_capacity)
+
 class SortedArrayList[T](ArrayList[T]):
     """ 
     Implementation of a sorted list with arrays.
 
     Attributes:
         - length (int): number of elements in the list (inherited)
-        - array (FixedSizeArray[T]): array storing the elements of the list (inherited)
+        - array (FixedSizeArray[T]): array storing the elements of the list in non-decreasing order (inherited)
 
     Note: This class is to take advantage on the binary search time complexity.
+    Every search is a binary search for an insertion point, so an insert costs O(log N) comparisons and one bulk shift.
     """
 
-    def __init__(self, max_capacity: int) -> None:
-        super().__init__(max_capacity)
+    def __init__(self, max_capacity: int, resizable: bool = False,
+                 growth_factor: float = ArrayList.DEFAULT_GROWTH_FACTOR,
+                 shrink_threshold: float = ArrayList.DEFAULT_SHRINK_THRESHOLD) -> None:
+        super().__init__(max_capacity, resizable, growth_factor, shrink_threshold)
 
     def __setitem__(self, index: int, value: T) -> None:
-        """ Sets the value of the element at position index and sorts the list. """
-        super().__setitem__(index, value)
-        self.array.sort()
+        """
+        Replaces the element at position index with value, moving it to keep the list sorted.
+        Only the elements between its old and new position are shifted, in one slice move.
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("Out of bounds")
+        position = self.bisect_right(value)
+        if position > index:  # moves right, the elements in between move left
+            self.array[index:position - 1] = self.array[index + 1:position]
+            self.array[position - 1] = value
+        else:  # moves left, the elements in between move right
+            self.array[position + 1:index + 1] = self.array[position:index]
+            self.array[position] = value
+
+    def __contains__(self, item: T) -> bool:
+        """ Returns whether the item is in the list, with a binary search. """
+        index = self.bisect_left(item)
+        return index < len(self) and self.array[index] == item
 
     def get_index(self, item: T) -> int:
         """ Returns the position of the first occurrence of item. """
-        self.binary_search(item)
-    
-    def insert(self, index: int, item: T) -> None:
-        """ Moves element from index to the right by one position, insert the element in index and sort the list. """
-        super().insert(index, item)
-        self.array.sort()
+        return self.binary_search(item)
 
-    def binary_search(self, item: T) -> int:
-        """ Does binary search on a sorted list. """
+    def append(self, item: T) -> None:
+        """ Adds the item to the list, at its sorted position. """
+        self.insert(item)
+
+    def insert(self, item: T) -> None:
+        """
+        Insert an item at its sorted position, after any equal item.
+
+        Complexity (Best): O(log N) inserting the largest item with room left
+        Complexity (Worst): O(N) inserting the smallest item, where N is the length of the list
+        """
+        ArrayList.insert(self, self.bisect_right(item), item)
+
+    def insert_many(self, items) -> None:
+        """
+        Inserts all the items at their sorted positions by merging them with the list in one pass.
+        A fixed list raises without changing if the items do not fit.
+
+        Complexity: O(N + K log K) where N is the length of the list and K the number of items
+        """
+        items = sorted(items)
+        if len(self) + len(items) > len(self.array):
+            if not self.resizable:
+                raise Exception("List is full")
+            self.reserve(max(len(self) + len(items), int(len(self.array) * self.growth_factor)))
+        self.array[:len(self) + len(items)] = list(merge(self.array[:len(self)], items))
+        self.length += len(items)
+
+    def bisect_left(self, item: T) -> int:
+        """
+        Returns the position where item would be inserted before any equal element.
+
+        Complexity: O(log N) where N is the length of the list
+        """
         low = 0
-        high = len(self) - 1
-        while low <= high:
+        high = len(self)
+        while low < high:
             mid = (low + high) // 2
-            if self.array[mid] > item:
-                high = mid - 1
-            elif self.array[mid] == item:
-                return mid
+            if self.array[mid] < item:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def bisect_right(self, item: T) -> int:
+        """
+        Returns the position where item would be inserted after any equal element.
+
+        Complexity: O(log N) where N is the length of the list
+        """
+        low = 0
+        high = len(self)
+        while low < high:
+            mid = (low + high) // 2
+            if item < self.array[mid]:
+                high = mid
             else:
                 low = mid + 1
+        return low
+
+    def binary_search(self, item: T) -> int:
+        """ Does binary search on a sorted list. Returns the position of the first occurrence of item. """
+        index = self.bisect_left(item)
+        if index < len(self) and self.array[index] == item:
+            return index
+        raise ValueError("Item not in list")
+
+    def count(self, item: T) -> int:
+        """
+        Returns the number of occurrences of item, with two binary searches.
+
+        Complexity: O(log N) where N is the length of the list
+        """
+        return self.bisect_right(item) - self.bisect_left(item)
+
+    def irange(self, lo: T = None, hi: T = None, inclusive: tuple[bool, bool] = (True, True)):
+        """
+        Yields the elements from lo to hi in order. A bound of None is unbounded, and inclusive says whether
+        elements equal to lo and to hi are included. Finding the range costs two binary searches.
+        """
+        start = 0
+        stop = len(self)
+        if lo is not None:
+            start = self.bisect_left(lo) if inclusive[0] else self.bisect_right(lo)
+        if hi is not None:
+            stop = self.bisect_right(hi) if inclusive[1] else self.bisect_left(hi)
+        for i in range(start, stop):
+            yield self.array[i]
+
+
+class ChunkedSortedList[T](List[T]):
+    """
+    Implementation of a sorted list with a list of bounded sorted blocks (like a B+ tree of height one).
+
+    Constants:
+        - MIN_LOAD: smallest valid load
+        - DEFAULT_LOAD: default load used in the __init__
+
+    Attributes:
+        - length (int): number of elements in the list (inherited)
+        - load (int): blocks are split past 2 * load elements and merged with a neighbour below load / 2
+        - blocks (list[list[T]]): sorted blocks, every element of a block is at most every element of the next
+        - maxes (list[T]): largest element of the block at the same position, searched to find the block of an item
+        - index (list[int]): Fenwick tree over the block lengths to turn positions into (block, offset) and back,
+          None when it has to be rebuilt after a block was split or merged
+
+    Note: Searching maxes then one block is O(log N), and shifting within one block moves at most 2 * load elements.
+    Iterating walks each block in turn, so it never follows a link per element.
+    """
+    MIN_LOAD = 4
+
+    DEFAULT_LOAD = 1000
+
+    def __init__(self, load: int = DEFAULT_LOAD) -> None:
+        if load < self.MIN_LOAD:
+            raise ValueError("The load should be at least " + str(self.MIN_LOAD) + ".")
+        List.__init__(self)
+        self.load = load
+        self.blocks = []
+        self.maxes = []
+        self.index = []
+
+    def __iter__(self):
+        """ Returns an iterator over the elements in order, walking each block in turn. """
+        return chain.from_iterable(self.blocks)
+
+    def __build_index(self) -> list[int]:
+        """ Rebuilds the Fenwick tree over the block lengths in O(B) where B is the number of blocks. """
+        tree = [len(block) for block in self.blocks]
+        for i in range(len(tree)):
+            parent = i | (i + 1)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self.index = tree
+        return tree
+
+    def __index_add(self, block: int, delta: int) -> None:
+        """ Adds delta to the length of a block in the Fenwick tree, if it is up to date. """
+        tree = self.index
+        if tree is not None:
+            while block < len(tree):
+                tree[block] += delta
+                block |= block + 1
+
+    def __position(self, block: int, offset: int) -> int:
+        """ Returns the position in the list of the element at offset in block. """
+        tree = self.index if self.index is not None else self.__build_index()
+        position = offset
+        block -= 1
+        while block >= 0:
+            position += tree[block]
+            block = (block & (block + 1)) - 1
+        return position
+
+    def __locate(self, index: int) -> tuple[int, int]:
+        """ Returns the (block, offset) of the element at position index, descending the Fenwick tree. """
+        if not 0 <= index < len(self):
+            raise IndexError("Out of bounds")
+        if index < len(self.blocks[0]):
+            return (0, index)
+        tree = self.index if self.index is not None else self.__build_index()
+        block = 0
+        step = 1 << len(tree).bit_length()
+        while step > 0:
+            next_block = block + step
+            if next_block <= len(tree) and tree[next_block - 1] <= index:
+                index -= tree[next_block - 1]
+                block = next_block
+            step >>= 1
+        return (block, index)
+
+    def __getitem__(self, index: int) -> T:
+        """
+        Returns the value of the element at position index.
+
+        Complexity: O(log N) where N is the length of the list
+        """
+        (block, offset) = self.__locate(index)
+        return self.blocks[block][offset]
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """ Replaces the element at position index with item, moving it to keep the list sorted. """
+        self.delete_at_index(index)
+        self.insert(item)
+
+    def __contains__(self, item: T) -> bool:
+        """ Returns whether the item is in the list, with two binary searches. """
+        block = bisect.bisect_left(self.maxes, item)
+        if block == len(self.maxes):
+            return False
+        offset = bisect.bisect_left(self.blocks[block], item)
+        return self.blocks[block][offset] == item
+
+    def is_full(self) -> bool:
+        """ Returns true if the list is full. A chunked list is never full. """
+        return False
+
+    def clear(self):
+        """ Sets the list back to empty. """
+        List.clear(self)
+        self.blocks = []
+        self.maxes = []
+        self.index = []
+
+    def append(self, item: T) -> None:
+        """ Adds the item to the list, at its sorted position. """
+        self.insert(item)
+
+    def insert(self, item: T) -> None:
+        """
+        Insert an item at its sorted position, after any equal item. A block grown past 2 * load is split in half.
+
+        Complexity: O(log N + L) where N is the length of the list and L the load
+        """
+        if len(self.blocks) == 0:
+            self.blocks.append([item])
+            self.maxes.append(item)
+            self.index = None
+        else:
+            block = bisect.bisect_right(self.maxes, item)
+            if block == len(self.maxes):  # new largest item
+                block -= 1
+                self.blocks[block].append(item)
+                self.maxes[block] = item
+            else:
+                bisect.insort_right(self.blocks[block], item)
+            self.__index_add(block, 1)
+            if len(self.blocks[block]) > 2 * self.load:
+                self.__split(block)
+        self.length += 1
+
+    def insert_many(self, items) -> None:
+        """
+        Inserts all the items at their sorted positions by sorting them together with the list, then cutting blocks.
+
+        Complexity: O(N + K log K) where N is the length of the list and K the number of items
+        """
+        merged = sorted(chain(self, items))
+        self.blocks = [merged[i:i + self.load] for i in range(0, len(merged), self.load)]
+        self.maxes = [block[-1] for block in self.blocks]
+        self.index = None
+        self.length = len(merged)
+
+    def __split(self, block: int) -> None:
+        """ Splits a block in half. """
+        half = self.blocks[block][len(self.blocks[block]) // 2:]
+        del self.blocks[block][len(self.blocks[block]) // 2:]
+        self.blocks.insert(block + 1, half)
+        self.maxes[block] = self.blocks[block][-1]
+        self.maxes.insert(block + 1, half[-1])
+        self.index = None
+
+    def __delete(self, block: int, offset: int) -> T:
+        """ Deletes the element at offset in block. A block shrunk below load / 2 is merged into a neighbour. """
+        item = self.blocks[block].pop(offset)
+        self.length -= 1
+        if len(self.blocks[block]) == 0:
+            del self.blocks[block]
+            del self.maxes[block]
+            self.index = None
+        else:
+            self.maxes[block] = self.blocks[block][-1]
+            self.__index_add(block, -1)
+            if len(self.blocks[block]) < self.load // 2 and len(self.blocks) > 1:
+                if block == 0:
+                    block = 1
+                self.blocks[block - 1].extend(self.blocks[block])
+                self.maxes[block - 1] = self.maxes[block]
+                del self.blocks[block]
+                del self.maxes[block]
+                self.index = None
+                if len(self.blocks[block - 1]) > 2 * self.load:
+                    self.__split(block - 1)
+        return item
+
+    def delete_at_index(self, index: int) -> T:
+        """
+        Delete an element at the index position and returns the item.
+
+        Complexity: O(log N + L) where N is the length of the list and L the load
+        """
+        (block, offset) = self.__locate(index)
+        return self.__delete(block, offset)
+
+    def remove(self, item: T) -> None:
+        """ Removes the first occurrence of the item from the list, without computing its position. """
+        block = bisect.bisect_left(self.maxes, item)
+        if block < len(self.maxes):
+            offset = bisect.bisect_left(self.blocks[block], item)
+            if self.blocks[block][offset] == item:
+                self.__delete(block, offset)
+                return
+        raise ValueError("Item not in list")
+
+    def get_index(self, item: T) -> int:
+        """ Returns the position of the first occurrence of item. """
+        block = bisect.bisect_left(self.maxes, item)
+        if block < len(self.maxes):
+            offset = bisect.bisect_left(self.blocks[block], item)
+            if self.blocks[block][offset] == item:
+                return self.__position(block, offset)
         raise ValueError("Item not in list")
 
+    def bisect_left(self, item: T) -> int:
+        """ Returns the position where item would be inserted before any equal element. """
+        block = bisect.bisect_left(self.maxes, item)
+        if block == len(self.maxes):
+            return len(self)
+        return self.__position(block, bisect.bisect_left(self.blocks[block], item))
+
+    def bisect_right(self, item: T) -> int:
+        """ Returns the position where item would be inserted after any equal element. """
+        block = bisect.bisect_right(self.maxes, item)
+        if block == len(self.maxes):
+            return len(self)
+        return self.__position(block, bisect.bisect_right(self.blocks[block], item))
+
+    def count(self, item: T) -> int:
+        """
+        Returns the number of occurrences of item.
+
+        Complexity: O(log N) where N is the length of the list
+        """
+        return self.bisect_right(item) - self.bisect_left(item)
+
+    def irange(self, lo: T = None, hi: T = None, inclusive: tuple[bool, bool] = (True, True)):
+        """
+        Yields the elements from lo to hi in order. A bound of None is unbounded, and inclusive says whether
+        elements equal to lo and to hi are included.
+        """
+        block = 0
+        offset = 0
+        if lo is not None:
+            search = bisect.bisect_left if inclusive[0] else bisect.bisect_right
+            block = search(self.maxes, lo)
+            if block < len(self.blocks):
+                offset = search(self.blocks[block], lo)
+        for i in range(block, len(self.blocks)):
+            for item in self.blocks[i][offset if i == block else 0:]:
+                if hi is not None and (hi < item or (not inclusive[1] and item == hi)):
+                    return
+                yield item
+
+    def __str__(self) -> str:
+        """ Returns the elements of the list in order as a string. """
+        return "[" + ", ".join(str(item) for item in self) + "]"
+
 
 class Node[T]:
+    __slots__ = ('item', 'link')  # no per node __dict__
+
     def __init__(self, item: T = None) -> None:
         self.item = item
         self.link = None
 
 
+class NodePool[T]:
+    """
+    Free list of spare nodes, so a linked structure can reuse the nodes it deletes instead of allocating new ones.
+    The spare nodes are chained through their link attribute. A pool may be shared by several structures of one thread.
+
+    Constants:
+        - DEFAULT_MAX_SIZE: default number of spare nodes kept used in the __init__
+
+    Attributes:
+        - free (Node[T]): first spare node (None if there are none)
+        - size (int): number of spare nodes
+        - max_size (int): spare nodes kept at most, nodes released past it are left to the garbage collector
+    """
+    DEFAULT_MAX_SIZE = 1024
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        if max_size < 0:
+            raise ValueError("The max size of a pool should not be negative.")
+        self.free = None
+        self.size = 0
+        self.max_size = max_size
+
+    def __len__(self) -> int:
+        """ Returns the number of spare nodes. """
+        return self.size
+
+    def acquire(self, item: T = None) -> Node[T]:
+        """ Returns an unlinked node holding item, reusing a spare node if there is one. """
+        node = self.free
+        if node is None:
+            return Node(item)
+        self.free = node.link
+        self.size -= 1
+        node.link = None
+        node.item = item
+        return node
+
+    def release(self, node: Node[T]) -> None:
+        """ Takes back a node no longer linked into any structure, dropping its item. """
+        node.item = None
+        if self.size < self.max_size:
+            node.link = self.free
+            self.free = node
+            self.size += 1
+        else:
+            node.link = None
+
+
 class LinkListIterator[T]:
     """ 
     Implementation of a the methods to make LinkList iterable
@@ -213,11 +708,15 @@ class LinkList[T](List[T]):
     Attributes:
         - length (int): number of elements in the list (inherited)
         - head (Node[T]): node at the head of the list
+        - tail (Node[T]): node at the end of the list, so appending never walks the chain
+        - pool (NodePool[T]): pool nodes are taken from and deleted nodes are returned to (None allocates every node)
     """
 
-    def __init__(self) -> None:
+    def __init__(self, pool: NodePool[T] = None) -> None:
         List.__init__(self)
         self.head = None
+        self.tail = None
+        self.pool = pool
 
     def __iter__(self) -> LinkListIterator[T]:
         """ Computes and returns an iterator for the current list. """
@@ -238,8 +737,10 @@ class LinkList[T](List[T]):
         return False
 
     def get_node_at_index(self, index: int) -> Node[T]:
-        """ Returns the node in the list at position index. """
-        if 0 <= index < len(self):
+        """ Returns the node in the list at position index. The last node is returned straight from the tail. """
+        if index == len(self) - 1 and index >= 0:
+            return self.tail
+        elif 0 <= index < len(self):
             current = self.head
             for _ in range(index):
                 current = current.link
@@ -248,17 +749,78 @@ class LinkList[T](List[T]):
             raise ValueError("Index out of bounds")
 
     def insert(self, index: int, item: T) -> None:
-        """ Insert an item at a specific index position. """
-        new_node = Node(item)
+        """ Insert an item at a specific index position. Inserting at either end does not walk the chain. """
+        new_node = Node(item) if self.pool is None else self.pool.acquire(item)
         if index == 0:
             new_node.link = self.head
             self.head = new_node
+            if self.tail is None:
+                self.tail = new_node
         else:
             previous_node = self.get_node_at_index(index-1)
             new_node.link = previous_node.link
             previous_node.link = new_node
+            if previous_node is self.tail:
+                self.tail = new_node
+        self.length += 1
+
+    def append(self, item: T) -> None:
+        """
+        Adds the item to the end of the list, linking it after the tail.
+
+        Complexity: O(1)
+        """
+        new_node = Node(item) if self.pool is None else self.pool.acquire(item)
+        if self.tail is None:
+            self.head = new_node
+        else:
+            self.tail.link = new_node
+        self.tail = new_node
         self.length += 1
 
+    def extend(self, items) -> None:
+        """
+        Adds all the items to the end of the list in order, linking the batch in one pass from the tail.
+
+        Complexity: O(K) where K is the number of items
+        """
+        tail = self.tail
+        for item in items:
+            new_node = Node(item) if self.pool is None else self.pool.acquire(item)
+            if tail is None:
+                self.head = new_node
+            else:
+                tail.link = new_node
+            tail = new_node
+            self.length += 1
+        self.tail = tail
+
+    def appendleft(self, item: T) -> None:
+        """
+        Adds the item to the front of the list.
+
+        Complexity: O(1)
+        """
+        self.insert(0, item)
+
+    def popleft(self) -> T:
+        """
+        Deletes the item at the front of the list and returns it.
+
+        Complexity: O(1)
+        """
+        if self.is_empty():
+            raise ValueError("List is empty")
+        node = self.head
+        item = node.item
+        self.head = node.link
+        if self.head is None:
+            self.tail = None
+        self.length -= 1
+        if self.pool is not None:
+            self.pool.release(node)
+        return item
+
     def get_index(self, item: T) -> int:
         """ Returns the position of the first occurrence of item. """
         current = self.head
@@ -281,14 +843,23 @@ class LinkList[T](List[T]):
             if self.is_empty():
                 raise ValueError("List is empty")
             elif index == 0:
-                item = self.head.item
-                self.head = self.head.link
+                node = self.head
+                self.head = node.link
+                if self.head is None:
+                    self.tail = None
             else:
                 raise e
         else:
-            item = previous_node.link.item
-            previous_node.link = previous_node.link.link
+            node = previous_node.link
+            if node is None:
+                raise ValueError("Index out of bounds")
+            if node is self.tail:
+                self.tail = previous_node
+            previous_node.link = node.link
+        item = node.item
         self.length -= 1
+        if self.pool is not None:
+            self.pool.release(node)
         return item
 
     def delete_negative(self):
@@ -299,17 +870,24 @@ class LinkList[T](List[T]):
             if current.item < 0:
                 previous.link = current.link    # delete the node
                 self.length -= 1
+                if self.pool is not None:
+                    self.pool.release(current)
             else:
                 previous = current              # move previous along
 
         if self.length > 0 and self.head.item < 0:  # check node at index 0
-            self.head = self.head.link             # move the head
+            node = self.head
+            self.head = node.link                  # move the head
             self.length -= 1
+            if self.pool is not None:
+                self.pool.release(node)
+        self.tail = previous if self.length > 0 else None  # last node kept
 
     def clear(self):
         """ Clears the link list. """
         List.clear(self)
         self.head = None
+        self.tail = None
 
 class SortedLinkList[T](LinkList[T]):
     """ 
@@ -318,47 +896,576 @@ class SortedLinkList[T](LinkList[T]):
     Attributes:
          - length (int): number of elements in the list (inherited)
          - head (Node[T]): node at the head of the list (inherited)
+         - tail (Node[T]): node at the end of the list (inherited)
+         - pool (NodePool[T]): pool nodes are taken from and deleted nodes are returned to (inherited)
     """
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, pool: NodePool[T] = None) -> None:
+        super().__init__(pool)
 
     def __setitem__(self, index: int, item: T) -> None:
         raise AttributeError(f"{self.__class__.__name__} has no attribute '__setitem__'")
 
+    def appendleft(self, item: T) -> None:
+        raise AttributeError(f"{self.__class__.__name__} has no attribute 'appendleft'")
+
+    def append(self, item: T) -> None:
+        """ Adds the item to the list, at its sorted position. """
+        self.insert(item)
+
+    def extend(self, items) -> None:
+        """
+        Adds all the items to the list at their sorted positions, by sorting them into a list of their own and merging it in.
+
+        Complexity: O(N + K log K) where K is the number of items
+        """
+        self.merge(self.from_iterable(items, self.pool))
+
+    @classmethod
+    def from_iterable(cls, items, pool: NodePool[T] = None) -> 'SortedLinkList[T]':
+        """
+        Returns a new sorted list of the items, sorting them once and linking them in order from the tail.
+
+        Complexity: O(K log K) where K is the number of items
+        """
+        sorted_list = cls(pool)
+        LinkList.extend(sorted_list, sorted(items))
+        return sorted_list
+
     # Don't use this set of arguments inherited from parent
     # def insert(self, index: int, item: T) -> None:
     #     raise TypeError(f"{self.__class__.__name__} has no arugument `(index: int, item: T)` for the attribute '__setitem__'")
 
     def insert(self, item: T) -> None:
-        """ Insert an item at a sorted index position. """
-        new_node = Node(item)
-        current = self.head
-        previous = None
-        
-        if self.is_empty(): # No node in list
-            new_node.link = self.head
+        """
+        Insert an item at a sorted index position, before any equal items. The walk keeps the previous node,
+        so the list is only walked once, and an item not smaller than the tail is linked straight after it.
+
+        Complexity (Best): O(1) the item goes at the end
+        Complexity (Worst): O(N) where N is the length of the list
+        """
+        new_node = Node(item) if self.pool is None else self.pool.acquire(item)
+        if self.tail is not None and self.tail.item < item:
+            previous = self.tail
+            current = None
+        else:
+            previous = None
+            current = self.head
+            while current is not None and current.item < item:
+                previous = current
+                current = current.link
+
+        new_node.link = current
+        if previous is None:  # Insert before head
             self.head = new_node
         else:
-            index = 0
+            previous.link = new_node
+        if current is None:   # Insert at the end
+            self.tail = new_node
+        self.length += 1
+
+    def merge(self, other: 'SortedLinkList[T]') -> None:
+        """
+        Moves all the items of the other sorted list into this one by relinking its nodes, leaving the other list empty.
+        Equal items keep the ones of this list first.
+
+        Complexity: O(N + M) where M is the length of the other list
+        """
+        if other is self:
+            raise ValueError("Cannot merge a list into itself")
+        mine = self.head
+        theirs = other.head
+        head = None
+        tail = None
+        while mine is not None and theirs is not None:
+            if theirs.item < mine.item:
+                node = theirs
+                theirs = theirs.link
+            else:
+                node = mine
+                mine = mine.link
+            if tail is None:
+                head = node
+            else:
+                tail.link = node
+            tail = node
+
+        rest = mine if mine is not None else theirs  # at most one of them has nodes left
+        if rest is not None:
+            if tail is None:
+                head = rest
+            else:
+                tail.link = rest
+            tail = self.tail if rest is mine else other.tail
+        self.head = head
+        self.tail = tail
+        self.length += other.length
+        other.head = None
+        other.tail = None
+        other.length = 0
+
+
+class DoublyNode[T]:
+    __slots__ = ('item', 'link', 'previous')  # no per node __dict__
+
+    def __init__(self, item: T = None) -> None:
+        self.item = item
+        self.link = None
+        self.previous = None
+
+
+class DoublyLinkList[T](List[T]):
+    """
+    Implementation of a generic list with nodes linked in both directions.
+    Any node can be unlinked, or have a node linked next to it, without walking the list, see Cursor.
+
+    Attributes:
+        - length (int): number of elements in the list (inherited)
+        - head (DoublyNode[T]): node at the head of the list
+        - tail (DoublyNode[T]): node at the end of the list
+    """
+
+    def __init__(self) -> None:
+        List.__init__(self)
+        self.head = None
+        self.tail = None
+
+    def __iter__(self) -> LinkListIterator[T]:
+        """ Computes and returns an iterator for the current list. """
+        return LinkListIterator(self.head)
+
+    def __reversed__(self):
+        """ Yields the items from the tail back to the head. """
+        current = self.tail
+        while current is not None:
+            yield current.item
+            current = current.previous
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """ Sets the value of the element at position index to be item. """
+        self.get_node_at_index(index).item = item
+
+    def __getitem__(self, index: int) -> T:
+        """ Returns the value of the element at position index. """
+        return self.get_node_at_index(index).item
+
+    def is_full(self):
+        """ Returns False as link lists are never full. """
+        return False
+
+    def get_node_at_index(self, index: int) -> DoublyNode[T]:
+        """
+        Returns the node in the list at position index, walking from whichever end is closer.
+
+        Complexity: O(min(index, N - index)) where N is the length of the list
+        """
+        if not 0 <= index < len(self):
+            raise ValueError("Index out of bounds")
+        if index < len(self) // 2:
             current = self.head
+            for _ in range(index):
+                current = current.link
+        else:
+            current = self.tail
+            for _ in range(len(self) - 1 - index):
+                current = current.previous
+        return current
+
+    def insert_after_node(self, node: DoublyNode[T], item: T) -> DoublyNode[T]:
+        """
+        Links a new node holding item straight after node, or at the head if node is None, and returns it.
+
+        Complexity: O(1)
+        """
+        new_node = DoublyNode(item)
+        new_node.previous = node
+        new_node.link = self.head if node is None else node.link
+        if new_node.link is None:
+            self.tail = new_node
+        else:
+            new_node.link.previous = new_node
+        if node is None:
+            self.head = new_node
+        else:
+            node.link = new_node
+        self.length += 1
+        return new_node
+
+    def insert_before_node(self, node: DoublyNode[T], item: T) -> DoublyNode[T]:
+        """
+        Links a new node holding item straight before node, or at the end if node is None, and returns it.
+
+        Complexity: O(1)
+        """
+        return self.insert_after_node(self.tail if node is None else node.previous, item)
+
+    def delete_node(self, node: DoublyNode[T]) -> T:
+        """
+        Unlinks the node from the list and returns its item.
+
+        Complexity: O(1)
+        """
+        if node.previous is None:
+            self.head = node.link
+        else:
+            node.previous.link = node.link
+        if node.link is None:
+            self.tail = node.previous
+        else:
+            node.link.previous = node.previous
+        node.link = None
+        node.previous = None
+        self.length -= 1
+        return node.item
 
-            while index <= self.length: # Only when inserted, you can leave
-                # print(f"item:{item}, index:{index}, length:{self.length+1}")
-                if index == self.length: # Insert at the end
-                    current = super().get_node_at_index(index-1)
-                    current.link = new_node
-                elif item <= current.item:
-                    if index == 0: # Insert before head
-                        new_node.link = self.head
-                        self.head = new_node
-                    else: # Insert in between nodes
-                        new_node.link = current
-                        previous = super().get_node_at_index(index-1)
-                        previous.link = new_node
-                    break
-                else:
-                    current = current.link
-
-                index += 1
-        self.length += 1
\ No newline at end of file
+    def insert(self, index: int, item: T) -> None:
+        """ Insert an item at a specific index position, walking from whichever end is closer. """
+        if index == len(self):
+            self.insert_after_node(self.tail, item)
+        else:
+            self.insert_before_node(self.get_node_at_index(index), item)
+
+    def append(self, item: T) -> None:
+        """
+        Adds the item to the end of the list.
+
+        Complexity: O(1)
+        """
+        self.insert_after_node(self.tail, item)
+
+    def appendleft(self, item: T) -> None:
+        """
+        Adds the item to the front of the list.
+
+        Complexity: O(1)
+        """
+        self.insert_after_node(None, item)
+
+    def extend(self, items) -> None:
+        """ Adds all the items to the end of the list in order. """
+        for item in items:
+            self.insert_after_node(self.tail, item)
+
+    def pop(self) -> T:
+        """
+        Deletes the item at the end of the list and returns it.
+
+        Complexity: O(1)
+        """
+        if self.is_empty():
+            raise ValueError("List is empty")
+        return self.delete_node(self.tail)
+
+    def popleft(self) -> T:
+        """
+        Deletes the item at the front of the list and returns it.
+
+        Complexity: O(1)
+        """
+        if self.is_empty():
+            raise ValueError("List is empty")
+        return self.delete_node(self.head)
+
+    def get_index(self, item: T) -> int:
+        """ Returns the position of the first occurrence of item. """
+        for index, current in enumerate(self):
+            if current == item:
+                return index
+        raise ValueError("Item is not in list")
+
+    def delete_at_index(self, index: int) -> T:
+        """ Delete an element at the index position, walking from whichever end is closer, and returns the item. """
+        if self.is_empty():
+            raise ValueError("List is empty")
+        return self.delete_node(self.get_node_at_index(index))
+
+    def cursor(self, index: int = 0) -> 'Cursor[T]':
+        """ Returns a cursor on the node at position index, or past the end if index is the length of the list. """
+        if index == len(self):
+            return Cursor(self, None)
+        return Cursor(self, self.get_node_at_index(index))
+
+    def clear(self):
+        """ Clears the link list. """
+        List.clear(self)
+        self.head = None
+        self.tail = None
+
+
+class Cursor[T]:
+    """
+    Position in a DoublyLinkList holding a reference to a node, so edits around it never walk the list.
+    The cursor is either on a node or past the end (node is None), which is where it starts on an empty list.
+    Editing the list other than through this cursor may leave it on a node that was deleted.
+
+    Attributes:
+        - link_list (DoublyLinkList[T]): the list the cursor moves over
+        - node (DoublyNode[T]): the node the cursor is on, None past the end
+    """
+
+    def __init__(self, link_list: DoublyLinkList[T], node: DoublyNode[T] = None) -> None:
+        self.link_list = link_list
+        self.node = node
+
+    def is_at_end(self) -> bool:
+        """ Returns True iff the cursor is past the end of the list. """
+        return self.node is None
+
+    @property
+    def item(self) -> T:
+        """ The item of the node the cursor is on. """
+        if self.node is None:
+            raise ValueError("Cursor is past the end")
+        return self.node.item
+
+    @item.setter
+    def item(self, item: T) -> None:
+        if self.node is None:
+            raise ValueError("Cursor is past the end")
+        self.node.item = item
+
+    def insert_before(self, item: T) -> None:
+        """
+        Inserts the item before the cursor, or at the end of the list if the cursor is past the end. The cursor stays on its node.
+
+        Complexity: O(1)
+        """
+        self.link_list.insert_before_node(self.node, item)
+
+    def insert_after(self, item: T) -> None:
+        """
+        Inserts the item after the cursor. The cursor stays on its node.
+
+        Complexity: O(1)
+        """
+        if self.node is None:
+            raise ValueError("Cursor is past the end")
+        self.link_list.insert_after_node(self.node, item)
+
+    def remove(self) -> T:
+        """
+        Deletes the node the cursor is on and returns its item. The cursor moves on to the next node.
+
+        Complexity: O(1)
+        """
+        if self.node is None:
+            raise ValueError("Cursor is past the end")
+        node = self.node
+        self.node = node.link
+        return self.link_list.delete_node(node)
+
+    def move(self, k: int = 1) -> None:
+        """
+        Moves the cursor k nodes towards the end, or -k nodes towards the head if k is negative.
+        Moving one past the tail puts the cursor past the end, and moving back from there reaches the tail.
+        The cursor does not move if that would take it out of the list.
+
+        Complexity: O(|k|)
+        """
+        node = self.node
+        for _ in range(abs(k)):
+            if k > 0:
+                if node is None:
+                    raise ValueError("Cursor would move past the end")
+                node = node.link
+            else:
+                node = self.link_list.tail if node is None else node.previous
+                if node is None:
+                    raise ValueError("Cursor would move before the head")
+        self.node = node
+
+
+class SkipNode[T]:
+    __slots__ = ('item', 'forward', 'span')  # no per node __dict__
+
+    def __init__(self, item: T = None, level: int = 1) -> None:
+        self.item = item
+        self.forward = [None] * level  # next node at each level
+        self.span = [0] * level        # number of positions the link at each level moves forward
+
+    @property
+    def link(self) -> 'SkipNode[T]':
+        """ Next node in order, so a LinkListIterator can walk the bottom level. """
+        return self.forward[0]
+
+
+class SkipList[T](List[T]):
+    """
+    Implementation of a sorted list with a skip list: a sorted link list with express lanes of links skipping ahead.
+    A node takes part in each level above the bottom one with the given probability, so searches drop down
+    through about log N levels. Each link also stores how many positions it skips, so positions are found the same way.
+
+    Constants:
+        - MAX_LEVEL: number of levels a node can take part in at most
+        - DEFAULT_PROBABILITY: default probability used in the __init__
+
+    Attributes:
+        - length (int): number of elements in the list (inherited)
+        - head (SkipNode[T]): sentinel node linking to the first node of every level
+        - level (int): number of levels currently in use
+        - probability (float): probability of a node taking part in the next level up
+        - random (random.Random): source of the node levels
+
+    Note: insert, remove, get_index, delete_at_index and indexing are O(log N) expected, O(N) worst case.
+    """
+    MAX_LEVEL = 32
+
+    DEFAULT_PROBABILITY = 1 / 4
+
+    def __init__(self, probability: float = DEFAULT_PROBABILITY, seed: int = None) -> None:
+        if not 0 < probability < 1:
+            raise ValueError("The probability should satisfy 0 < probability < 1.")
+        List.__init__(self)
+        self.probability = probability
+        self.random = random.Random(seed)
+        self.head = SkipNode(None, self.MAX_LEVEL)
+        self.level = 1
+
+    def __iter__(self) -> LinkListIterator[T]:
+        """ Computes and returns an iterator walking the bottom level. """
+        return LinkListIterator(self.head.forward[0])
+
+    def __random_level(self) -> int:
+        """ Number of levels of a new node, each level above the first with the given probability. """
+        level = 1
+        while level < self.MAX_LEVEL and self.random.random() < self.probability:
+            level += 1
+        return level
+
+    def __predecessors(self, item: T) -> tuple[list[SkipNode[T]], list[int]]:
+        """
+        Last node before item at each level in use, and the position of each of those nodes counting the head as 0.
+        The item belongs (or is) straight after the predecessor on the bottom level.
+        """
+        update = [self.head] * self.level
+        rank = [0] * self.level
+        current = self.head
+        traversed = 0
+        for i in reversed(range(self.level)):
+            while current.forward[i] is not None and current.forward[i].item < item:
+                traversed += current.span[i]
+                current = current.forward[i]
+            update[i] = current
+            rank[i] = traversed
+        return update, rank
+
+    def __predecessors_at(self, index: int) -> list[SkipNode[T]]:
+        """ Last node before position index at each level in use. """
+        update = [self.head] * self.level
+        current = self.head
+        traversed = 0
+        for i in reversed(range(self.level)):
+            while current.forward[i] is not None and traversed + current.span[i] <= index:
+                traversed += current.span[i]
+                current = current.forward[i]
+            update[i] = current
+        return update
+
+    def __check_index(self, index: int) -> None:
+        if not 0 <= index < len(self):
+            raise ValueError("Index out of bounds")
+
+    def __getitem__(self, index: int) -> T:
+        """ Returns the value of the element at position index, following the spans down the levels. """
+        self.__check_index(index)
+        return self.__predecessors_at(index)[0].forward[0].item
+
+    def __setitem__(self, index: int, item: T) -> None:
+        raise AttributeError(f"{self.__class__.__name__} has no attribute '__setitem__'")
+
+    def __contains__(self, item: T) -> bool:
+        """ Returns whether the item is in the list. """
+        candidate = self.__predecessors(item)[0][0].forward[0]
+        return candidate is not None and candidate.item == item
+
+    def is_full(self) -> bool:
+        """ Returns False as skip lists are never full. """
+        return False
+
+    def clear(self):
+        """ Clears the skip list. """
+        List.clear(self)
+        self.head = SkipNode(None, self.MAX_LEVEL)
+        self.level = 1
+
+    def append(self, item: T) -> None:
+        """ Adds the item to the list, at its sorted position. """
+        self.insert(item)
+
+    def insert(self, item: T) -> None:
+        """
+        Insert an item at its sorted position, before any equal items.
+
+        Complexity: O(log N) expected
+        """
+        update, rank = self.__predecessors(item)
+        level = self.__random_level()
+        if level > self.level:
+            for i in range(self.level, level):
+                update.append(self.head)
+                rank.append(0)
+                self.head.span[i] = len(self)  # the head link of an unused level skips to the end
+            self.level = level
+
+        new_node = SkipNode(item, level)
+        for i in range(level):
+            new_node.forward[i] = update[i].forward[i]
+            update[i].forward[i] = new_node
+            new_node.span[i] = update[i].span[i] - (rank[0] - rank[i])
+            update[i].span[i] = rank[0] - rank[i] + 1
+        for i in range(level, self.level):  # links passing over the new node skip one more position
+            update[i].span[i] += 1
+        self.length += 1
+
+    def __delete(self, update: list[SkipNode[T]], node: SkipNode[T]) -> T:
+        """ Unlinks the node from every level, given its predecessors, and returns its item. """
+        for i in range(self.level):
+            if update[i].forward[i] is node:
+                update[i].span[i] += node.span[i] - 1
+                update[i].forward[i] = node.forward[i]
+            else:
+                update[i].span[i] -= 1
+        while self.level > 1 and self.head.forward[self.level - 1] is None:
+            self.level -= 1
+        self.length -= 1
+        return node.item
+
+    def delete_at_index(self, index: int) -> T:
+        """
+        Delete the element at the index position and returns the item.
+
+        Complexity: O(log N) expected
+        """
+        if self.is_empty():
+            raise ValueError("List is empty")
+        self.__check_index(index)
+        update = self.__predecessors_at(index)
+        return self.__delete(update, update[0].forward[0])
+
+    def remove(self, item: T) -> None:
+        """
+        Removes the first occurrence of the item from the list.
+
+        Complexity: O(log N) expected
+        """
+        update, _ = self.__predecessors(item)
+        candidate = update[0].forward[0]
+        if candidate is None or candidate.item != item:
+            raise ValueError("Item is not in list")
+        self.__delete(update, candidate)
+
+    def get_index(self, item: T) -> int:
+        """
+        Returns the position of the first occurrence of item.
+
+        Complexity: O(log N) expected
+        """
+        update, rank = self.__predecessors(item)
+        candidate = update[0].forward[0]
+        if candidate is None or candidate.item != item:
+            raise ValueError("Item is not in list")
+        return rank[0]
+
+    def __str__(self) -> str:
+        """ Returns the elements of the list in order as a string. """
+        return "[" + ", ".join(str(item) for item in self) + "]"
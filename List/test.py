@@ -1,11 +1,17 @@
+import bisect
+import sys
 from enum import Enum
 import unittest
-from list import ArrayList, LinkList
+import random
+from list import ArrayList, SortedArrayList, ChunkedSortedList, LinkList, SortedLinkList, DoublyLinkList, Node, NodePool, SkipList
 
 
 class DataStructure(Enum):
     ARRAY = 1
     LINK = 2
+    CHUNKED = 3
+    DOUBLY = 4
+    SKIP = 5
 
 
 class TestList(unittest.TestCase):
@@ -19,6 +25,12 @@ class TestList(unittest.TestCase):
         if test_list == DataStructure.ARRAY:
             self.lists = [ArrayList(self.LARGE)
                           for i in range(len(self.lengths))]
+        elif test_list == DataStructure.CHUNKED:
+            self.lists = [ChunkedSortedList(4) for i in range(len(self.lengths))]
+        elif test_list == DataStructure.SKIP:
+            self.lists = [SkipList(seed=i) for i in range(len(self.lengths))]
+        elif test_list == DataStructure.DOUBLY:
+            self.lists = [DoublyLinkList() for i in range(len(self.lengths))]
         else:
             self.lists = [LinkList() for i in range(len(self.lengths))]
         for list, length in zip(self.lists, self.lengths):
@@ -93,6 +105,571 @@ class TestList(unittest.TestCase):
             self.assertTrue(list.is_empty())
 
 
+class TestArrayList(unittest.TestCase):
+    def test_fixed_is_full(self):
+        array_list = ArrayList(3)
+        for i in range(3):
+            array_list.append(i)
+        self.assertTrue(array_list.is_full())
+        with self.assertRaises(Exception):
+            array_list.append(3)
+
+    def test_growth(self):
+        array_list = ArrayList(1, resizable=True, growth_factor=1.5)
+        capacities = set()
+        for i in range(1000):
+            array_list.append(i)
+            capacities.add(len(array_list.array))
+        self.assertEqual(len(array_list), 1000)
+        self.assertLess(len(capacities), 20, "Capacity should grow geometrically")
+        for i in range(1000):
+            self.assertEqual(array_list[i], i)
+
+        array_list.insert(0, -1)
+        self.assertEqual(array_list[0], -1)
+        self.assertEqual(array_list[1000], 999)
+
+    def test_shrink(self):
+        array_list = ArrayList(4, resizable=True)
+        for i in range(1000):
+            array_list.append(i)
+        grown_capacity = len(array_list.array)
+
+        for i in range(990):
+            self.assertEqual(array_list.delete_at_index(len(array_list) - 1), 999 - i)
+        self.assertLess(len(array_list.array), grown_capacity / 10, "Capacity should follow the length down")
+        self.assertGreaterEqual(len(array_list.array), 4)
+        self.assertEqual([array_list[i] for i in range(len(array_list))], list(range(10)))
+
+        array_list.clear()
+        self.assertEqual(len(array_list.array), 4)
+
+    def test_reserve_and_shrink_to_fit(self):
+        array_list = ArrayList(2, resizable=True)
+        array_list.reserve(100)
+        self.assertEqual(len(array_list.array), 100)
+        for i in range(100):
+            array_list.append(i)
+        self.assertEqual(len(array_list.array), 100, "List should not grow after reserve")
+
+        for i in range(40):
+            array_list.delete_at_index(0)
+        array_list.shrink_to_fit()
+        self.assertEqual(len(array_list.array), 60)
+        self.assertEqual(array_list[0], 40)
+        self.assertEqual(array_list[59], 99)
+
+        fixed = ArrayList(10)
+        fixed.append(1)
+        fixed.reserve(20)
+        self.assertEqual(len(fixed.array), 20)
+        fixed.shrink_to_fit()
+        self.assertTrue(fixed.is_full())
+
+    def test_insert_many_and_delete_range(self):
+        for resizable in [False, True]:
+            array_list = ArrayList(2 if resizable else 20, resizable=resizable)
+            array_list.insert_many(0, range(5))
+            array_list.insert_many(2, ["a", "b", "c"])
+            array_list.insert_many(len(array_list), iter(["end"]))
+            array_list.insert_many(0, [])
+            self.assertEqual(str(array_list), "[0, 1, a, b, c, 2, 3, 4, end]")
+
+            array_list.delete_range(1, 4)
+            self.assertEqual(str(array_list), "[0, c, 2, 3, 4, end]")
+            array_list.delete_range(4, 6)
+            array_list.delete_range(0, 0)
+            self.assertEqual(str(array_list), "[0, c, 2, 3]")
+            self.assertTrue(all(array_list.array[i] is None for i in range(len(array_list), len(array_list.array))),
+                            "Deleted slots should not keep references")
+
+            for start, stop in [(-1, 2), (2, 1), (0, 5)]:
+                with self.assertRaises(IndexError):
+                    array_list.delete_range(start, stop)
+            with self.assertRaises(IndexError):
+                array_list.insert_many(5, [1])
+            with self.assertRaises(IndexError):
+                array_list.insert(5, 1)
+
+        fixed = ArrayList(4)
+        fixed.insert_many(0, [1, 2, 3])
+        with self.assertRaises(Exception):
+            fixed.insert_many(1, [4, 5])
+        self.assertEqual(str(fixed), "[1, 2, 3]", "A failed insert_many should not change the list")
+
+    def test_shift_reference_counts(self):
+        item = object()
+        references = sys.getrefcount(item)
+        array_list = ArrayList(1, resizable=True)
+        for i in range(50):
+            array_list.insert(0, item)
+            array_list.insert(len(array_list) // 2, i)
+        array_list.insert_many(10, [item] * 10)
+        self.assertEqual(sys.getrefcount(item), references + 60)
+
+        array_list.delete_range(5, 30)
+        while len(array_list) > 0:
+            array_list.delete_at_index(len(array_list) // 2)
+        self.assertEqual(sys.getrefcount(item), references, "Shifting should neither leak nor drop references")
+
+    def test_invalid_factors(self):
+        with self.assertRaises(ValueError):
+            ArrayList(4, resizable=True, growth_factor=1)
+        with self.assertRaises(ValueError):
+            ArrayList(4, resizable=True, growth_factor=2, shrink_threshold=0.5)
+
+
+class TestSortedArrayList(unittest.TestCase):
+    def test_insert_keeps_order(self):
+        rng = random.Random(7)
+        for resizable in [False, True]:
+            sorted_list = SortedArrayList(1 if resizable else 500, resizable=resizable)
+            expected = []
+            for _ in range(500):
+                item = rng.randrange(100)
+                sorted_list.append(item)
+                expected.append(item)
+            expected.sort()
+            self.assertEqual([sorted_list[i] for i in range(len(sorted_list))], expected)
+
+    def test_search(self):
+        sorted_list = SortedArrayList(20)
+        for item in [5, 1, 3, 3, 3, 9, 7]:
+            sorted_list.insert(item)
+        self.assertEqual(str(sorted_list), "[1, 3, 3, 3, 5, 7, 9]")
+        self.assertEqual(sorted_list.get_index(3), 1, "Should find the first occurrence")
+        self.assertEqual(sorted_list.bisect_left(3), 1)
+        self.assertEqual(sorted_list.bisect_right(3), 4)
+        self.assertEqual(sorted_list.bisect_left(4), 4)
+        self.assertEqual(sorted_list.bisect_right(10), 7)
+        self.assertEqual(sorted_list.count(3), 3)
+        self.assertEqual(sorted_list.count(4), 0)
+        self.assertIn(9, sorted_list)
+        self.assertNotIn(4, sorted_list)
+        with self.assertRaises(ValueError):
+            sorted_list.get_index(4)
+
+        sorted_list.remove(3)
+        self.assertEqual(sorted_list.count(3), 2)
+
+    def test_irange(self):
+        sorted_list = SortedArrayList(20)
+        sorted_list.insert_many([5, 1, 3, 3, 9, 7])
+        self.assertEqual(list(sorted_list.irange(3, 7)), [3, 3, 5, 7])
+        self.assertEqual(list(sorted_list.irange(3, 7, (False, False))), [5])
+        self.assertEqual(list(sorted_list.irange(hi=3)), [1, 3, 3])
+        self.assertEqual(list(sorted_list.irange(lo=6)), [7, 9])
+        self.assertEqual(list(sorted_list.irange(10, 20)), [])
+        self.assertEqual(list(sorted_list.irange()), [1, 3, 3, 5, 7, 9])
+
+    def test_setitem_moves_item(self):
+        sorted_list = SortedArrayList(10)
+        sorted_list.insert_many(range(0, 10, 2))
+        sorted_list[0] = 5
+        self.assertEqual(str(sorted_list), "[2, 4, 5, 6, 8]")
+        sorted_list[4] = 3
+        self.assertEqual(str(sorted_list), "[2, 3, 4, 5, 6]")
+        sorted_list[2] = 4
+        self.assertEqual(str(sorted_list), "[2, 3, 4, 5, 6]")
+        with self.assertRaises(IndexError):
+            sorted_list[5] = 1
+
+    def test_insert_many(self):
+        sorted_list = SortedArrayList(2, resizable=True)
+        sorted_list.insert_many([4, 2])
+        sorted_list.insert_many([3, 1, 5, 2])
+        self.assertEqual(str(sorted_list), "[1, 2, 2, 3, 4, 5]")
+
+        fixed = SortedArrayList(3)
+        fixed.insert_many([2, 1])
+        with self.assertRaises(Exception):
+            fixed.insert_many([0, 3])
+        self.assertEqual(str(fixed), "[1, 2]")
+
+
+class TestChunkedSortedList(unittest.TestCase):
+    def test_random_operations(self):
+        """ Compares the list against a sorted built-in list under a random mix of inserts and deletes. """
+        rng = random.Random(7)
+        chunked = ChunkedSortedList(4)
+        expected = []
+        for _ in range(3000):
+            if len(expected) > 0 and rng.random() < 0.4:
+                index = rng.randrange(len(expected))
+                self.assertEqual(chunked.delete_at_index(index), expected.pop(index))
+            else:
+                item = rng.randrange(200)
+                chunked.insert(item)
+                bisect.insort(expected, item)
+            self.assertEqual(len(chunked), len(expected))
+            self.assertTrue(all(len(block) <= 8 for block in chunked.blocks), "Blocks should be split past 2 * load")
+
+        self.assertEqual(list(chunked), expected)
+        for i in range(len(expected)):
+            self.assertEqual(chunked[i], expected[i])
+        for item in range(-1, 201):
+            self.assertEqual(chunked.bisect_left(item), bisect.bisect_left(expected, item))
+            self.assertEqual(chunked.bisect_right(item), bisect.bisect_right(expected, item))
+            self.assertEqual(chunked.count(item), expected.count(item))
+            self.assertEqual(item in chunked, item in expected)
+            if item in expected:
+                self.assertEqual(chunked.get_index(item), expected.index(item))
+
+    def test_search(self):
+        chunked = ChunkedSortedList(4)
+        chunked.insert_many([5, 1, 3, 3, 3, 9, 7, 11, 13, 0])
+        self.assertEqual(str(chunked), "[0, 1, 3, 3, 3, 5, 7, 9, 11, 13]")
+        self.assertEqual(chunked.get_index(3), 2)
+        self.assertEqual(chunked.count(3), 3)
+        with self.assertRaises(ValueError):
+            chunked.get_index(4)
+        with self.assertRaises(ValueError):
+            chunked.remove(14)
+        with self.assertRaises(IndexError):
+            _ = chunked[10]
+
+        chunked.remove(3)
+        self.assertEqual(chunked.count(3), 2)
+        chunked[0] = 8
+        self.assertEqual(str(chunked), "[1, 3, 3, 5, 7, 8, 9, 11, 13]")
+
+    def test_irange(self):
+        chunked = ChunkedSortedList(4)
+        chunked.insert_many(range(20))
+        self.assertEqual(list(chunked.irange(3, 12)), list(range(3, 13)))
+        self.assertEqual(list(chunked.irange(3, 12, (False, False))), list(range(4, 12)))
+        self.assertEqual(list(chunked.irange(hi=2)), [0, 1, 2])
+        self.assertEqual(list(chunked.irange(lo=17)), [17, 18, 19])
+        self.assertEqual(list(chunked.irange(20, 30)), [])
+
+    def test_shrinks(self):
+        chunked = ChunkedSortedList(4)
+        for i in range(100):
+            chunked.append(i)
+        while len(chunked) > 1:
+            chunked.delete_at_index(len(chunked) // 2)
+            self.assertTrue(len(chunked.blocks) == 1 or all(len(block) >= 2 for block in chunked.blocks),
+                            "Small blocks should be merged into a neighbour")
+        self.assertEqual(list(chunked), [0])
+        chunked.clear()
+        self.assertTrue(chunked.is_empty())
+        self.assertEqual(list(chunked), [])
+
+    def test_invalid_load(self):
+        with self.assertRaises(ValueError):
+            ChunkedSortedList(1)
+
+
+class TestLinkList(unittest.TestCase):
+    def assertTail(self, link_list: LinkList) -> None:
+        """ The tail should be the last node reached walking from the head. """
+        last = None
+        current = link_list.head
+        while current is not None:
+            last = current
+            current = current.link
+        self.assertIs(link_list.tail, last)
+
+    def test_append_and_extend(self):
+        link_list = LinkList()
+        self.assertIsNone(link_list.tail)
+        link_list.append(1)
+        self.assertTail(link_list)
+        link_list.extend(range(2, 6))
+        link_list.extend([])
+        link_list.append(6)
+        self.assertEqual(list(link_list), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(len(link_list), 6)
+        self.assertEqual(link_list[5], 6)
+        self.assertTail(link_list)
+
+        empty = LinkList()
+        empty.extend(iter(range(3)))
+        self.assertEqual(list(empty), [0, 1, 2])
+        self.assertTail(empty)
+
+    def test_appendleft_and_popleft(self):
+        link_list = LinkList()
+        with self.assertRaises(ValueError):
+            link_list.popleft()
+        link_list.appendleft(2)
+        self.assertTail(link_list)
+        link_list.appendleft(1)
+        link_list.append(3)
+        self.assertEqual(list(link_list), [1, 2, 3])
+        self.assertEqual([link_list.popleft() for _ in range(3)], [1, 2, 3])
+        self.assertTrue(link_list.is_empty())
+        self.assertIsNone(link_list.tail)
+        link_list.append(4)
+        self.assertEqual(list(link_list), [4])
+        self.assertTail(link_list)
+
+    def test_tail_after_mutations(self):
+        link_list = LinkList()
+        link_list.extend(range(5))
+        link_list.insert(5, 5)
+        self.assertTail(link_list)
+        link_list.insert(2, 9)
+        self.assertTail(link_list)
+        self.assertEqual(link_list.delete_at_index(len(link_list) - 1), 5)
+        self.assertTail(link_list)
+        with self.assertRaises(ValueError):
+            link_list.delete_at_index(len(link_list))
+        link_list.append(-1)
+        link_list.delete_negative()
+        self.assertEqual(list(link_list), [0, 1, 9, 2, 3, 4])
+        self.assertTail(link_list)
+        link_list[len(link_list) - 1] = -4
+        link_list.delete_negative()
+        self.assertTail(link_list)
+        while not link_list.is_empty():
+            link_list.delete_at_index(0)
+        self.assertIsNone(link_list.tail)
+        link_list.extend([1, 2])
+        link_list.clear()
+        self.assertIsNone(link_list.tail)
+
+    def test_pool(self):
+        self.assertFalse(hasattr(Node(1), '__dict__'), "Nodes should not carry a __dict__")
+        pool = NodePool()
+        link_list = LinkList(pool)
+        link_list.extend(range(-3, 3))
+        link_list.delete_negative()
+        link_list.popleft()
+        link_list.delete_at_index(1)
+        self.assertEqual(list(link_list), [1])
+        self.assertEqual(len(pool), 5, "Deleted nodes should be returned to the pool")
+        link_list.extend(range(2, 7))
+        self.assertEqual(len(pool), 0)
+        self.assertEqual(list(link_list), [1, 2, 3, 4, 5, 6])
+        self.assertTail(link_list)
+
+    def test_sorted_link_list_stays_sorted(self):
+        sorted_list = SortedLinkList()
+        sorted_list.extend([5, 1, 3])
+        sorted_list.append(7)
+        sorted_list.append(0)
+        self.assertEqual(list(sorted_list), [0, 1, 3, 5, 7])
+        self.assertTail(sorted_list)
+        with self.assertRaises(AttributeError):
+            sorted_list.appendleft(9)
+
+    def test_sorted_link_list_random_inserts(self):
+        rng = random.Random(7)
+        sorted_list = SortedLinkList()
+        expected = []
+        for _ in range(500):
+            item = rng.randrange(100)
+            sorted_list.insert(item)
+            bisect.insort(expected, item)
+        self.assertEqual(list(sorted_list), expected)
+        self.assertEqual(len(sorted_list), len(expected))
+        self.assertTail(sorted_list)
+
+    def test_sorted_link_list_merge(self):
+        rng = random.Random(7)
+        for mine_length, theirs_length in [(0, 0), (0, 5), (5, 0), (20, 30), (30, 20)]:
+            mine = [rng.randrange(50) for _ in range(mine_length)]
+            theirs = [rng.randrange(50) for _ in range(theirs_length)]
+            sorted_list = SortedLinkList.from_iterable(mine)
+            other = SortedLinkList.from_iterable(theirs)
+            self.assertEqual(list(other), sorted(theirs))
+            other_nodes = set()
+            current = other.head
+            while current is not None:
+                other_nodes.add(id(current))
+                current = current.link
+
+            sorted_list.merge(other)
+            self.assertEqual(list(sorted_list), sorted(mine + theirs))
+            self.assertEqual(len(sorted_list), mine_length + theirs_length)
+            self.assertTail(sorted_list)
+            self.assertTrue(other.is_empty())
+            self.assertIsNone(other.head)
+            self.assertIsNone(other.tail)
+            current = sorted_list.head
+            while current is not None:
+                other_nodes.discard(id(current))
+                current = current.link
+            self.assertEqual(other_nodes, set(), "The nodes of the other list should be relinked, not copied")
+
+        with self.assertRaises(ValueError):
+            sorted_list.merge(sorted_list)
+
+    def test_sorted_link_list_extend(self):
+        sorted_list = SortedLinkList.from_iterable([4, 2, 8])
+        self.assertIsInstance(sorted_list, SortedLinkList)
+        sorted_list.extend(iter([9, 1, 4]))
+        sorted_list.insert(10)
+        self.assertEqual(list(sorted_list), [1, 2, 4, 4, 8, 9, 10])
+        self.assertTail(sorted_list)
+
+
+class TestDoublyLinkList(unittest.TestCase):
+    def assertLinks(self, link_list: DoublyLinkList) -> None:
+        """ Walking forwards from the head and backwards from the tail should give the same items. """
+        self.assertEqual(list(reversed(link_list)), list(link_list)[::-1])
+        self.assertEqual(len(list(link_list)), len(link_list))
+        if link_list.is_empty():
+            self.assertIsNone(link_list.head)
+            self.assertIsNone(link_list.tail)
+        else:
+            self.assertIsNone(link_list.head.previous)
+            self.assertIsNone(link_list.tail.link)
+
+    def test_random_operations(self):
+        """ Compares the list against a built-in list under a random mix of indexed inserts and deletes. """
+        rng = random.Random(7)
+        link_list = DoublyLinkList()
+        expected = []
+        for _ in range(1000):
+            if len(expected) > 0 and rng.random() < 0.4:
+                index = rng.randrange(len(expected))
+                self.assertEqual(link_list.delete_at_index(index), expected.pop(index))
+            else:
+                index = rng.randrange(len(expected) + 1)
+                link_list.insert(index, index)
+                expected.insert(index, index)
+        self.assertLinks(link_list)
+        self.assertEqual(list(link_list), expected)
+        for i in range(len(expected)):
+            self.assertEqual(link_list[i], expected[i])
+        with self.assertRaises(ValueError):
+            _ = link_list[len(expected)]
+
+    def test_deque_operations(self):
+        link_list = DoublyLinkList()
+        with self.assertRaises(ValueError):
+            link_list.pop()
+        with self.assertRaises(ValueError):
+            link_list.popleft()
+        link_list.extend([2, 3])
+        link_list.appendleft(1)
+        link_list.append(4)
+        self.assertEqual(str(link_list), "[1, 2, 3, 4]")
+        self.assertEqual(link_list.pop(), 4)
+        self.assertEqual(link_list.popleft(), 1)
+        self.assertEqual(link_list.get_index(3), 1)
+        self.assertLinks(link_list)
+        link_list.clear()
+        self.assertLinks(link_list)
+
+    def test_cursor_editing(self):
+        link_list = DoublyLinkList()
+        cursor = link_list.cursor()
+        self.assertTrue(cursor.is_at_end())
+        cursor.insert_before(1)
+        cursor.insert_before(5)
+        cursor.move(-2)
+        self.assertEqual(cursor.item, 1)
+        cursor.insert_after(3)
+        cursor.insert_before(0)
+        cursor.move(2)
+        cursor.insert_before(4)
+        cursor.insert_after(6)
+        self.assertEqual(list(link_list), [0, 1, 3, 4, 5, 6])
+        self.assertLinks(link_list)
+
+        cursor.item = 50
+        self.assertEqual(cursor.remove(), 50)
+        self.assertEqual(cursor.item, 6)
+        self.assertEqual(cursor.remove(), 6)
+        self.assertTrue(cursor.is_at_end())
+        with self.assertRaises(ValueError):
+            cursor.remove()
+        with self.assertRaises(ValueError):
+            cursor.move(1)
+        cursor.move(-4)
+        self.assertEqual(cursor.item, 0)
+        with self.assertRaises(ValueError):
+            cursor.move(-1)
+        self.assertEqual(cursor.item, 0, "A failed move should leave the cursor in place")
+        self.assertEqual(cursor.remove(), 0)
+        self.assertEqual(list(link_list), [1, 3, 4])
+        self.assertLinks(link_list)
+
+        cursor = link_list.cursor(1)
+        self.assertEqual(cursor.item, 3)
+        while not link_list.is_empty():
+            if cursor.is_at_end():
+                cursor.move(-1)
+            else:
+                cursor.remove()
+        self.assertLinks(link_list)
+
+
+class TestSkipList(unittest.TestCase):
+    def assertSpans(self, skip_list: SkipList) -> None:
+        """ Every link should skip as many positions as there are bottom level nodes between its ends. """
+        positions = {id(skip_list.head): 0}
+        current = skip_list.head.forward[0]
+        while current is not None:
+            positions[id(current)] = len(positions)
+            current = current.forward[0]
+        for level in range(skip_list.level):
+            current = skip_list.head
+            while current.forward[level] is not None:
+                following = current.forward[level]
+                self.assertEqual(current.span[level], positions[id(following)] - positions[id(current)])
+                current = following
+
+    def test_random_operations(self):
+        """ Compares the list against a sorted built-in list under a random mix of inserts, deletes and lookups. """
+        rng = random.Random(7)
+        skip_list = SkipList(seed=7)
+        expected = []
+        for _ in range(3000):
+            if len(expected) > 0 and rng.random() < 0.4:
+                if rng.random() < 0.5:
+                    index = rng.randrange(len(expected))
+                    self.assertEqual(skip_list.delete_at_index(index), expected.pop(index))
+                else:
+                    item = rng.choice(expected)
+                    self.assertEqual(skip_list.get_index(item), expected.index(item))
+                    skip_list.remove(item)
+                    expected.remove(item)
+            else:
+                item = rng.randrange(200)
+                skip_list.insert(item)
+                bisect.insort(expected, item)
+            self.assertEqual(len(skip_list), len(expected))
+        self.assertSpans(skip_list)
+
+        self.assertEqual(list(skip_list), expected)
+        for i in range(len(expected)):
+            self.assertEqual(skip_list[i], expected[i])
+        for item in range(-1, 201):
+            self.assertEqual(item in skip_list, item in expected)
+
+    def test_levels(self):
+        skip_list = SkipList(seed=1)
+        for i in range(1000):
+            skip_list.append(i)
+        self.assertGreater(skip_list.level, 1, "Nodes should be promoted to express lanes")
+        self.assertLessEqual(skip_list.level, SkipList.MAX_LEVEL)
+        self.assertSpans(skip_list)
+        while not skip_list.is_empty():
+            skip_list.delete_at_index(0)
+        self.assertEqual(skip_list.level, 1, "Empty levels should be dropped")
+        self.assertEqual(str(skip_list), "[]")
+
+    def test_errors(self):
+        skip_list = SkipList(seed=1)
+        with self.assertRaises(ValueError):
+            skip_list.delete_at_index(0)
+        skip_list.insert(3)
+        with self.assertRaises(ValueError):
+            _ = skip_list[1]
+        with self.assertRaises(ValueError):
+            skip_list.remove(4)
+        with self.assertRaises(ValueError):
+            skip_list.get_index(2)
+        with self.assertRaises(AttributeError):
+            skip_list[0] = 1
+        with self.assertRaises(ValueError):
+            SkipList(1)
+
+
 if __name__ == '__main__':
     test_list = DataStructure.ARRAY
     suite = unittest.TestLoader().loadTestsFromTestCase(TestList)
@@ -101,3 +678,33 @@ if __name__ == '__main__':
     test_list = DataStructure.LINK
     suite = unittest.TestLoader().loadTestsFromTestCase(TestList)
     unittest.TextTestRunner(verbosity=2).run(suite)
+
+    test_list = DataStructure.CHUNKED
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestList)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+    test_list = DataStructure.DOUBLY
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestList)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+    test_list = DataStructure.SKIP
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestList)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestArrayList)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestSortedArrayList)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestChunkedSortedList)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestLinkList)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestDoublyLinkList)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestSkipList)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,70 @@
+"""
+Benchmarks of LinkQueue nodes.
+
+- Compares the memory held per element by nodes with a __dict__ (the previous layout) and slotted nodes.
+- Compares the append/serve throughput of allocating every node against reusing nodes from a NodePool.
+- Run from this directory: python benchmark.py
+"""
+
+import timeit
+import tracemalloc
+import queue
+from queue import LinkQueue, NodePool
+
+N = 100000
+REPEAT = 3
+BURST = 1000
+
+
+class DictNode:
+    """ Node with the layout used before nodes were slotted. """
+    def __init__(self, item=None) -> None:
+        self.item = item
+        self.next = None
+
+
+def bytes_per_element(node_type) -> float:
+    """ Memory allocated per appended element (node and int item) while the queue holds N elements, using the given node class. """
+    slotted = queue.Node
+    queue.Node = node_type
+    try:
+        tracemalloc.start()
+        link_queue = LinkQueue()
+        for i in range(N):
+            link_queue.append(i)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    finally:
+        queue.Node = slotted
+    return size / N
+
+
+def churn(link_queue: LinkQueue) -> None:
+    """ Appends and serves N elements in bursts, the way a work queue fills and drains. """
+    for _ in range(N // BURST):
+        for i in range(BURST):
+            link_queue.append(i)
+        for _ in range(BURST):
+            link_queue.serve()
+
+
+def bench_memory() -> None:
+    print(f"Memory of a LinkQueue holding {N} elements")
+    for label, node_type in [("dict nodes", DictNode), ("slotted nodes", queue.Node)]:
+        print(f"  {label:<28}{bytes_per_element(node_type):10.1f} bytes/element")
+
+
+def bench_churn() -> None:
+    print(f"Appending and serving {N} elements in bursts of {BURST}")
+    candidates = [
+        ("allocating", lambda: churn(LinkQueue())),
+        ("NodePool", lambda: churn(LinkQueue(pool=NodePool(BURST)))),
+    ]
+    for label, run in candidates:
+        elapsed = min(timeit.repeat(run, number=1, repeat=REPEAT))
+        print(f"  {label:<28}{elapsed * 1000:10.2f} ms{2 * N / elapsed / 1e6:10.2f} M ops/s")
+
+
+if __name__ == '__main__':
+    bench_memory()
+    bench_churn()
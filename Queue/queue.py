@@ -160,11 +160,61 @@ class CircularQueue[T](Queue[T]):
 
 
 class Node[T]:
+    __slots__ = ('item', 'next')  # no per node __dict__
+
     def __init__(self, item: T = None) -> None:
         self.item = item
         self.next = None
 
 
+class NodePool[T]:
+    """
+    Free list of spare nodes, so a linked structure can reuse the nodes it deletes instead of allocating new ones.
+    The spare nodes are chained through their next attribute. A pool may be shared by several structures of one thread.
+
+    Constants:
+        - DEFAULT_MAX_SIZE: default number of spare nodes kept used in the __init__
+
+    Attributes:
+        - free (Node[T]): first spare node (None if there are none)
+        - size (int): number of spare nodes
+        - max_size (int): spare nodes kept at most, nodes released past it are left to the garbage collector
+    """
+    DEFAULT_MAX_SIZE = 1024
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        if max_size < 0:
+            raise ValueError("The max size of a pool should not be negative.")
+        self.free = None
+        self.size = 0
+        self.max_size = max_size
+
+    def __len__(self) -> int:
+        """ Returns the number of spare nodes. """
+        return self.size
+
+    def acquire(self, item: T = None) -> Node[T]:
+        """ Returns an unlinked node holding item, reusing a spare node if there is one. """
+        node = self.free
+        if node is None:
+            return Node(item)
+        self.free = node.next
+        self.size -= 1
+        node.next = None
+        node.item = item
+        return node
+
+    def release(self, node: Node[T]) -> None:
+        """ Takes back a node no longer linked into any structure, dropping its item. """
+        node.item = None
+        if self.size < self.max_size:
+            node.next = self.free
+            self.free = node
+            self.size += 1
+        else:
+            node.next = None
+
+
 class LinkQueue[T](Queue[T]):
     """
     Linked implementation of a queue with nodes.
@@ -173,12 +223,14 @@ class LinkQueue[T](Queue[T]):
         - length (int): number of elements in the linked queue (inherited)
         - front (int): reference to the front node (None represents an empty queue)
         - rear (int): reference to the rear node (None represents an empty queue)
+        - pool (NodePool[T]): pool nodes are taken from and served nodes are returned to (None allocates every node)
     """
 
-    def __init__(self, _=None) -> None:
+    def __init__(self, _=None, pool: NodePool[T] = None) -> None:
         Queue.__init__(self)
         self.front = None
         self.rear = None
+        self.pool = pool
 
     def clear(self) -> None:
         """ Clears the queue. """
@@ -192,7 +244,7 @@ class LinkQueue[T](Queue[T]):
 
     def append(self, item: T) -> None:
         """ Adds an element to the rear of the queue. """
-        new_node = Node(item)
+        new_node = Node(item) if self.pool is None else self.pool.acquire(item)
         if self.is_empty():
             self.front = new_node
         else:
@@ -205,11 +257,14 @@ class LinkQueue[T](Queue[T]):
         if self.is_empty():
             raise Exception("Queue is empty")
 
-        temp = self.front.item
-        self.front = self.front.next
+        node = self.front
+        temp = node.item
+        self.front = node.next
         self.length -= 1
         if self.is_empty():
             self.rear = None
+        if self.pool is not None:
+            self.pool.release(node)
         return temp
 
     def __str__(self) -> str:
@@ -1,13 +1,14 @@
 
 from enum import Enum
 import unittest
-from queue import LinearQueue, CircularQueue, LinkQueue
+from queue import LinearQueue, CircularQueue, LinkQueue, Node, NodePool
 
 
 class DataStructure(Enum):
     LINEAR = 1
     CIRCULAR = 2
     LINK = 3
+    POOLED = 4
 
 
 class TestQueue(unittest.TestCase):
@@ -24,6 +25,9 @@ class TestQueue(unittest.TestCase):
             self.queues = [LinearQueue(self.CAPACITY) for i in range(len(self.lengths))]
         elif test_list == DataStructure.CIRCULAR:
             self.queues = [CircularQueue(self.CAPACITY) for i in range(len(self.lengths))]
+        elif test_list == DataStructure.POOLED:
+            pool = NodePool(4)
+            self.queues = [LinkQueue(pool=pool) for i in range(len(self.lengths))]
         else:
             self.queues = [LinkQueue() for i in range(len(self.lengths))]
 
@@ -96,6 +100,30 @@ class TestQueue(unittest.TestCase):
             self.assertTrue(queue.is_empty())
 
 
+class TestNodePool(unittest.TestCase):
+    def test_slots(self):
+        self.assertFalse(hasattr(Node(1), '__dict__'), "Nodes should not carry a __dict__")
+
+    def test_reuse(self):
+        pool = NodePool(2)
+        queue = LinkQueue(pool=pool)
+        for i in range(3):
+            queue.append(i)
+        nodes = [queue.front, queue.front.next]
+        self.assertEqual([queue.serve() for _ in range(3)], [0, 1, 2])
+        self.assertEqual(len(pool), 2, "Only max_size spare nodes should be kept")
+        self.assertIsNone(pool.free.item, "Spare nodes should not keep their items alive")
+
+        queue.append(3)
+        queue.append(4)
+        self.assertEqual(len(pool), 0)
+        self.assertIn(queue.front, nodes)
+        self.assertIn(queue.rear, nodes)
+        self.assertIsNone(queue.rear.next)
+        queue.append(5)
+        self.assertEqual([queue.serve() for _ in range(3)], [3, 4, 5])
+
+
 if __name__ == '__main__':
     test_list = DataStructure.LINEAR
     suite = unittest.TestLoader().loadTestsFromTestCase(TestQueue)
@@ -107,4 +135,11 @@ if __name__ == '__main__':
 
     test_list = DataStructure.LINK
     suite = unittest.TestLoader().loadTestsFromTestCase(TestQueue)
-    unittest.TextTestRunner(verbosity=2).run(suite)
\ No newline at end of file
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+    test_list = DataStructure.POOLED
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestQueue)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestNodePool)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -97,21 +97,74 @@ class ArrayStack[T](Stack[T]):
 
 
 class Node[T]:
+    __slots__ = ('item', 'link')  # no per node __dict__
+
     def __init__(self, item: T = None) -> None:
         self.item = item
         self.link = None
 
 
+class NodePool[T]:
+    """
+    Free list of spare nodes, so a linked structure can reuse the nodes it deletes instead of allocating new ones.
+    The spare nodes are chained through their link attribute. A pool may be shared by several structures of one thread.
+
+    Constants:
+        - DEFAULT_MAX_SIZE: default number of spare nodes kept used in the __init__
+
+    Attributes:
+        - free (Node[T]): first spare node (None if there are none)
+        - size (int): number of spare nodes
+        - max_size (int): spare nodes kept at most, nodes released past it are left to the garbage collector
+    """
+    DEFAULT_MAX_SIZE = 1024
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        if max_size < 0:
+            raise ValueError("The max size of a pool should not be negative.")
+        self.free = None
+        self.size = 0
+        self.max_size = max_size
+
+    def __len__(self) -> int:
+        """ Returns the number of spare nodes. """
+        return self.size
+
+    def acquire(self, item: T = None) -> Node[T]:
+        """ Returns an unlinked node holding item, reusing a spare node if there is one. """
+        node = self.free
+        if node is None:
+            return Node(item)
+        self.free = node.link
+        self.size -= 1
+        node.link = None
+        node.item = item
+        return node
+
+    def release(self, node: Node[T]) -> None:
+        """ Takes back a node no longer linked into any structure, dropping its item. """
+        node.item = None
+        if self.size < self.max_size:
+            node.link = self.free
+            self.free = node
+            self.size += 1
+        else:
+            node.link = None
+
+
 class LinkStack[T](Stack[T]):
     """ Implementation of a stack with linked nodes.
 
     Attributes:
         - length (int): number of elements in the stack (inherited)
+        - top (Node[T]): node at the top of the stack (None represents an empty stack)
+        - pool (NodePool[T]): pool nodes are taken from and popped nodes are returned to (None allocates every node)
     """
 
-    def __init__(self, _=None) -> None:
+    def __init__(self, _=None, pool: NodePool[T] = None) -> None:
         Stack.__init__(self)
         self.top = None
+        self.pool = pool
 
     def clear(self) -> None:
         """" Clears all elements from the stack. """
@@ -128,7 +181,7 @@ class LinkStack[T](Stack[T]):
 
     def push(self, item: T) -> None:
         """ Pushes an element to the top of the stack. """
-        new_node = Node(item)
+        new_node = Node(item) if self.pool is None else self.pool.acquire(item)
         new_node.link = self.top
         self.top = new_node
         self.length += 1
@@ -138,9 +191,12 @@ class LinkStack[T](Stack[T]):
         if self.is_empty():
             raise Exception("Stack is empty")
 
-        item = self.top.item
-        self.top = self.top.link
+        node = self.top
+        item = node.item
+        self.top = node.link
         self.length -= 1
+        if self.pool is not None:
+            self.pool.release(node)
         return item
 
     def peek(self) -> T:
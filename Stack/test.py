@@ -1,10 +1,11 @@
 from enum import Enum
 import unittest
-from stack import ArrayStack, LinkStack
+from stack import ArrayStack, LinkStack, Node, NodePool
 
 class DataStructure(Enum):
     ARRAY = 1
     LINK = 2
+    POOLED = 3
 
 class TestStack(unittest.TestCase):
     """ Tests for the above class. """
@@ -18,6 +19,9 @@ class TestStack(unittest.TestCase):
 
         if test_list == DataStructure.ARRAY:
             self.stacks = [ArrayStack(self.CAPACITY) for i in range(len(self.lengths))]
+        elif test_list == DataStructure.POOLED:
+            pool = NodePool(4)
+            self.stacks = [LinkStack(pool=pool) for _ in range(len(self.lengths))]
         else:
             self.stacks = [LinkStack() for _ in range(len(self.lengths))]
 
@@ -91,6 +95,33 @@ class TestStack(unittest.TestCase):
             self.assertTrue(stack.is_empty())
 
 
+class TestNodePool(unittest.TestCase):
+    def test_slots(self):
+        self.assertFalse(hasattr(Node(1), '__dict__'), "Nodes should not carry a __dict__")
+
+    def test_reuse(self):
+        pool = NodePool(2)
+        stack = LinkStack(pool=pool)
+        for i in range(3):
+            stack.push(i)
+        nodes = [stack.top, stack.top.link]
+        self.assertEqual([stack.pop() for _ in range(3)], [2, 1, 0])
+        self.assertEqual(len(pool), 2, "Only max_size spare nodes should be kept")
+        self.assertIsNone(pool.free.item, "Spare nodes should not keep their items alive")
+
+        stack.push(3)
+        stack.push(4)
+        self.assertEqual(len(pool), 0)
+        self.assertIn(stack.top, nodes)
+        self.assertIn(stack.top.link, nodes)
+        stack.push(5)
+        self.assertEqual([stack.pop() for _ in range(3)], [5, 4, 3])
+
+    def test_invalid_max_size(self):
+        with self.assertRaises(ValueError):
+            NodePool(-1)
+
+
 if __name__ == '__main__':
     # ArrayStack
     test_list = DataStructure.ARRAY
@@ -100,4 +131,12 @@ if __name__ == '__main__':
     # LinkStack
     test_list = DataStructure.LINK
     suite = unittest.TestLoader().loadTestsFromTestCase(TestStack)
-    unittest.TextTestRunner(verbosity=2).run(suite)
\ No newline at end of file
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+    # LinkStack sharing a NodePool
+    test_list = DataStructure.POOLED
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestStack)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestNodePool)
+    unittest.TextTestRunner(verbosity=2).run(suite)
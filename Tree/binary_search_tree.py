@@ -11,6 +11,8 @@ from stack import LinkStack
 from list import LinkList
 
 class Node[K, I]:
+    __slots__ = ('key', 'item', 'left', 'right')  # no per node __dict__
+
     def __init__(self, key: K, item: I = None) -> None:
         self.key = key
         self.item = item
@@ -4,6 +4,8 @@ from typing import Callable
 
 
 class Node[T]:
+    __slots__ = ('item', 'left', 'right')  # no per node __dict__
+
     def __init__(self, item: T = None) -> None:
         self.item = item
         self.left = None